@@ -72,6 +72,7 @@ export type DependenciesStatusResponse = {
 type ResponseMetadata = {
 	result_format: string;
 	processing_time_ms?: number;
+	cache?: "hit" | "miss" | null;
 };
 
 export type ExportResponse = {
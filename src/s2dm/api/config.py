@@ -3,7 +3,9 @@
 from pathlib import Path
 from typing import Any
 
-from s2dm.api.models.base import ErrorResponse
+from pydantic import BaseModel
+
+from s2dm.api.models.base import ApiResponse, ErrorResponse
 
 COMMON_RESPONSES: dict[int | str, dict[str, Any]] = {
     400: {"model": ErrorResponse, "description": "Bad request - invalid or missing fields"},
@@ -12,6 +14,18 @@ COMMON_RESPONSES: dict[int | str, dict[str, Any]] = {
 }
 
 
+def success_responses(model: type[BaseModel]) -> dict[int | str, dict[str, Any]]:
+    """Document ``model`` as the success body of a route that builds its Response directly.
+
+    Declaring the model as ``response_model`` instead would have FastAPI validate and re-serialize
+    every returned payload.
+    """
+    return {200: {"model": model, "description": "Successful Response"}}
+
+
+SUCCESS_RESPONSES = success_responses(ApiResponse)
+
+
 def get_api_workspace() -> Path:
     """Return the persistent workspace used by API filesystem operations."""
     return Path.home() / ".s2dm" / "api"
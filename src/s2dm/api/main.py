@@ -1,14 +1,19 @@
 """S2DM Export REST API application."""
 
-from fastapi import FastAPI, Request
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from graphql import GraphQLError, GraphQLSyntaxError
 
 from s2dm import __version__, log
 from s2dm.api.errors import ResourceNotFoundError, ResponseError
-from s2dm.api.models.base import ErrorResponse
+from s2dm.api.middleware import FastCORSMiddleware
+from s2dm.api.models.base import ErrorCode, ErrorResponse
 from s2dm.api.routes import (
     avro,
     deps,
@@ -22,8 +27,21 @@ from s2dm.api.routes import (
     validate,
     vspec,
 )
+from s2dm.api.services.response_service import shutdown_export_pool, start_export_pool
+from s2dm.api.utils.flat_router import FlatAPIRouter
 from s2dm.deps.resolve.errors import DependencyConfigError, DependencySourceError, DependencyUpstreamError
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Run CPU-bound exports in worker processes for the lifetime of the application."""
+    start_export_pool()
+    try:
+        yield
+    finally:
+        shutdown_export_pool()
+
+
 app = FastAPI(
     title="S2DM Export API",
     description="REST API for exporting GraphQL schemas to various formats and validating schemas and queries.",
@@ -31,11 +49,13 @@ app = FastAPI(
     docs_url="/api/v1/docs",
     redoc_url="/api/v1/redoc",
     openapi_url="/api/v1/capabilities",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # FIXME: In production, CORS should be configured more restrictively to allow only trusted origins.
 app.add_middleware(
-    CORSMiddleware,
+    FastCORSMiddleware,
     allow_origin_regex=r"https?://(localhost|127\.0\.0\.1)(:\d+)?",
     allow_credentials=True,
     allow_methods=["*"],
@@ -43,130 +63,100 @@ app.add_middleware(
 )
 
 
-@app.exception_handler(ResponseError)
-def response_error_handler(_request: Request, exc: ResponseError) -> JSONResponse:
-    """Handle validation-like errors that are safe to expose to clients."""
-    error_response = ErrorResponse(error="ValidationError", message=str(exc), details=None)
-    log.warning(f"User-facing validation error: {exc}")
-    return JSONResponse(status_code=422, content=error_response.model_dump())
-
-
-@app.exception_handler(RequestValidationError)
-def request_validation_error_handler(_request: Request, exc: RequestValidationError) -> JSONResponse:
-    """Handle Pydantic request validation errors."""
-    errors = exc.errors()
-    validation_errors = [{"loc": err["loc"], "msg": err["msg"], "type": err["type"]} for err in errors]
-    error_response = ErrorResponse(
-        error="BadRequest",
-        message="Request contains missing fields or incorrect types",
-        details={"validation_errors": validation_errors},
-    )
-    log.warning(f"Request validation error: {exc}")
-    return JSONResponse(status_code=400, content=error_response.model_dump())
+# Maps each handled exception type to (status code, error code, message, log label).
+# A ``None`` message means the exception's own message is safe to expose to the client.
+_ERROR_TABLE: dict[type[Exception], tuple[int, ErrorCode, str | None, str]] = {
+    ResponseError: (422, "ValidationError", None, "User-facing validation error"),
+    ResourceNotFoundError: (404, "NotFound", None, "API resource not found"),
+    FileNotFoundError: (400, "FileNotFound", "Requested file not found", "File not found"),
+    DependencyConfigError: (422, "ValidationError", None, "Dependency config error"),
+    DependencySourceError: (422, "DependencySourceError", None, "Dependency source error"),
+    DependencyUpstreamError: (502, "DependencyUpstreamError", None, "Dependency upstream error"),
+    RuntimeError: (400, "RuntimeError", "A runtime error occurred", "Runtime error"),
+    ValueError: (422, "ValidationError", "Invalid input provided", "Validation error"),
+    TypeError: (422, "ValidationError", "Invalid type provided", "Type error"),
+    GraphQLSyntaxError: (422, "GraphQLSyntaxError", None, "GraphQL syntax error"),
+    GraphQLError: (422, "GraphQLError", None, "GraphQL error"),
+}
 
 
-@app.exception_handler(ResourceNotFoundError)
-def resource_not_found_handler(_request: Request, exc: ResourceNotFoundError) -> JSONResponse:
-    """Handle API-managed resources that are missing."""
-    error_response = ErrorResponse(error="NotFound", message=str(exc), details=None)
-    log.warning(f"API resource not found: {exc}")
-    return JSONResponse(status_code=404, content=error_response.model_dump())
+def _error_body(error: ErrorCode, message: str) -> bytes:
+    """Encode an ErrorResponse without details."""
+    return orjson.dumps(ErrorResponse(error=error, message=message, details=None).model_dump())
 
 
-@app.exception_handler(FileNotFoundError)
-def file_not_found_handler(request: Request, exc: FileNotFoundError) -> JSONResponse:
-    """Handle file not found errors."""
-    error_response = ErrorResponse(error="FileNotFound", message="Requested file not found", details=None)
-    log.warning(f"File not found: {exc}")
-    return JSONResponse(status_code=400, content=error_response.model_dump())
+# Encoded bodies of the errors whose message does not depend on the exception, built once at import time.
+_STATIC_ERROR_BODIES: dict[type[Exception], bytes] = {
+    exc_type: _error_body(error, message)
+    for exc_type, (_, error, message, _) in _ERROR_TABLE.items()
+    if message is not None
+}
+_SERVER_ERROR_BODY = _error_body("ServerError", "An internal server error occurred")
 
 
-@app.exception_handler(RuntimeError)
-def runtime_error_handler(request: Request, exc: RuntimeError) -> JSONResponse:
-    """Handle runtime errors (e.g., URL download failures)."""
-    error_response = ErrorResponse(error="RuntimeError", message="A runtime error occurred", details=None)
-    log.warning(f"Runtime error: {exc}")
-    return JSONResponse(status_code=400, content=error_response.model_dump())
+def api_error_handler(_request: Request, exc: Exception) -> Response:
+    """Translate a handled exception into an ErrorResponse using the most specific table entry."""
+    exc_type = next(exc_type for exc_type in type(exc).__mro__ if exc_type in _ERROR_TABLE)
+    status_code, error, _, log_label = _ERROR_TABLE[exc_type]
+    log.warning("%s: %s", log_label, exc)
 
+    body = _STATIC_ERROR_BODIES.get(exc_type)
+    if body is None:
+        body = _error_body(error, exc.message if isinstance(exc, GraphQLError) else str(exc))
+    return Response(body, status_code=status_code, media_type="application/json")
 
-@app.exception_handler(ValueError)
-def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
-    """Handle validation errors."""
-    error_response = ErrorResponse(error="ValidationError", message="Invalid input provided", details=None)
-    log.warning(f"Validation error: {exc}")
-    return JSONResponse(status_code=422, content=error_response.model_dump())
 
+for _exc_type in _ERROR_TABLE:
+    app.add_exception_handler(_exc_type, api_error_handler)
 
-@app.exception_handler(TypeError)
-def type_error_handler(request: Request, exc: TypeError) -> JSONResponse:
-    """Handle type errors (e.g., GraphQL directive errors)."""
-    error_response = ErrorResponse(error="ValidationError", message="Invalid type provided", details=None)
-    log.warning(f"Type error: {exc}")
-    return JSONResponse(status_code=422, content=error_response.model_dump())
 
+@app.exception_handler(RequestValidationError)
+def request_validation_error_handler(_request: Request, exc: RequestValidationError) -> ORJSONResponse:
+    """Handle Pydantic request validation errors."""
+    errors = exc.errors()
+    validation_errors = [{"loc": err["loc"], "msg": err["msg"], "type": err["type"]} for err in errors]
+    error_response = ErrorResponse(
+        error="BadRequest",
+        message="Request contains missing fields or incorrect types",
+        details={"validation_errors": validation_errors},
+    )
+    log.warning("Request validation error: %s", exc)
+    return ORJSONResponse(status_code=400, content=error_response.model_dump())
 
-@app.exception_handler(GraphQLSyntaxError)
-def graphql_syntax_error_handler(request: Request, exc: GraphQLSyntaxError) -> JSONResponse:
-    """Handle GraphQL syntax errors."""
-    error_response = ErrorResponse(error="GraphQLSyntaxError", message=exc.message, details=None)
-    log.warning(f"GraphQL syntax error: {exc}")
-    return JSONResponse(status_code=422, content=error_response.model_dump())
 
+@app.exception_handler(Exception)
+def general_exception_handler(request: Request, exc: Exception) -> Response:
+    """Handle unexpected errors."""
+    if log.isEnabledFor(logging.ERROR):
+        log.error("Unhandled exception: %s", exc, exc_info=True)
+    return Response(_SERVER_ERROR_BODY, status_code=500, media_type="application/json")
 
-@app.exception_handler(GraphQLError)
-def graphql_error_handler(request: Request, exc: GraphQLError) -> JSONResponse:
-    """Handle GraphQL errors."""
-    error_response = ErrorResponse(error="GraphQLError", message=exc.message, details=None)
-    log.warning(f"GraphQL error: {exc}")
-    return JSONResponse(status_code=422, content=error_response.model_dump())
 
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "version": __version__})
 
-@app.exception_handler(DependencyConfigError)
-def dependency_config_error_handler(_request: Request, exc: DependencyConfigError) -> JSONResponse:
-    """Handle invalid dependency configuration errors."""
-    error_response = ErrorResponse(error="ValidationError", message=str(exc), details=None)
-    log.warning(f"Dependency config error: {exc}")
-    return JSONResponse(status_code=422, content=error_response.model_dump())
 
+async def health(_request: Request) -> Response:
+    """Health check endpoint.
 
-@app.exception_handler(DependencySourceError)
-def dependency_source_error_handler(_request: Request, exc: DependencySourceError) -> JSONResponse:
-    """Handle user-fixable dependency source errors."""
-    error_response = ErrorResponse(error="DependencySourceError", message=str(exc), details=None)
-    log.warning(f"Dependency source error: {exc}")
-    return JSONResponse(status_code=422, content=error_response.model_dump())
+    Registered as a plain Starlette route so that liveness probes skip FastAPI's request
+    parsing, dependency resolution and response serialization.
+    """
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 
-@app.exception_handler(DependencyUpstreamError)
-def dependency_upstream_error_handler(_request: Request, exc: DependencyUpstreamError) -> JSONResponse:
-    """Handle upstream dependency provider errors."""
-    error_response = ErrorResponse(error="DependencyUpstreamError", message=str(exc), details=None)
-    log.warning(f"Dependency upstream error: {exc}")
-    return JSONResponse(status_code=502, content=error_response.model_dump())
+app.add_route("/api/v1/health", health, methods=["GET"], include_in_schema=False)
 
 
-@app.exception_handler(Exception)
-def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    """Handle unexpected errors."""
-    error_response = ErrorResponse(error="ServerError", message="An internal server error occurred", details=None)
-    log.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(status_code=500, content=error_response.model_dump())
-
-
-@app.get("/api/v1/health")
-def health() -> dict[str, str]:
-    """Health check endpoint."""
-    return {"status": "healthy", "version": __version__}
-
-
-app.include_router(shacl.router, prefix="/api/v1/export", tags=["export"])
-app.include_router(vspec.router, prefix="/api/v1/export", tags=["export"])
-app.include_router(jsonschema.router, prefix="/api/v1/export", tags=["export"])
-app.include_router(linkml.router, prefix="/api/v1/export", tags=["export"])
-app.include_router(avro.router, prefix="/api/v1/export", tags=["export"])
-app.include_router(protobuf.router, prefix="/api/v1/export", tags=["export"])
-app.include_router(deps.router, prefix="/api/v1/deps", tags=["deps"])
-app.include_router(insights.router, prefix="/api/v1/insights", tags=["insights"])
-app.include_router(filter.router, prefix="/api/v1/schema", tags=["schema"])
-app.include_router(validate.router, prefix="/api/v1/schema", tags=["schema"])
-app.include_router(query_validate.router, prefix="/api/v1/query", tags=["query"])
+api_router = FlatAPIRouter(app)
+api_router.include_flat(shacl.router, prefix="/api/v1/export", tags=["export"])
+api_router.include_flat(vspec.router, prefix="/api/v1/export", tags=["export"])
+api_router.include_flat(jsonschema.router, prefix="/api/v1/export", tags=["export"])
+api_router.include_flat(linkml.router, prefix="/api/v1/export", tags=["export"])
+api_router.include_flat(avro.router, prefix="/api/v1/export", tags=["export"])
+api_router.include_flat(protobuf.router, prefix="/api/v1/export", tags=["export"])
+api_router.include_flat(deps.router, prefix="/api/v1/deps", tags=["deps"])
+api_router.include_flat(insights.router, prefix="/api/v1/insights", tags=["insights"])
+api_router.include_flat(filter.router, prefix="/api/v1/schema", tags=["schema"])
+api_router.include_flat(validate.router, prefix="/api/v1/schema", tags=["schema"])
+api_router.include_flat(query_validate.router, prefix="/api/v1/query", tags=["query"])
+api_router.install(app)
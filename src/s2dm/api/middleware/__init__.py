@@ -0,0 +1,5 @@
+"""ASGI middleware used by the S2DM REST API."""
+
+from s2dm.api.middleware.cors import FastCORSMiddleware
+
+__all__ = ["FastCORSMiddleware"]
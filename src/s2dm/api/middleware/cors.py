@@ -0,0 +1,150 @@
+"""Pure ASGI CORS middleware tailored to the S2DM API."""
+
+import functools
+import re
+from collections.abc import Callable, Sequence
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+SAFELISTED_HEADERS = frozenset({"accept", "accept-language", "content-language", "content-type"})
+ORIGIN_CACHE_SIZE = 256
+
+
+class FastCORSMiddleware:
+    """CORS middleware operating directly on raw ASGI messages.
+
+    Supports the subset of Starlette's ``CORSMiddleware`` options used by the API: origins are
+    matched against a regular expression, and every header value that does not depend on the
+    request is encoded once at construction time. Requests without an ``Origin`` header are
+    passed through untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origin_regex: str,
+        allow_methods: Sequence[str] = ("GET",),
+        allow_headers: Sequence[str] = (),
+        allow_credentials: bool = False,
+        max_age: int = 600,
+    ) -> None:
+        if "*" in allow_methods:
+            allow_methods = ALL_METHODS
+
+        self.app = app
+        # Origins are matched as raw header bytes, and the verdict for the few distinct origins a
+        # deployment sees is memoized so repeat callers skip the regex entirely.
+        self.allow_origin_regex = re.compile(allow_origin_regex.encode("latin-1"), re.ASCII)
+        self.is_allowed_origin: Callable[[bytes], bool] = functools.lru_cache(maxsize=ORIGIN_CACHE_SIZE)(
+            self._match_origin
+        )
+        self.allow_methods = frozenset(allow_methods)
+        self.allow_all_headers = "*" in allow_headers
+        self.allow_headers = SAFELISTED_HEADERS | {header.lower() for header in allow_headers}
+
+        simple_headers: list[tuple[bytes, bytes]] = []
+        if allow_credentials:
+            simple_headers.append((b"access-control-allow-credentials", b"true"))
+        self.simple_headers = simple_headers
+
+        preflight_headers = [
+            (b"vary", b"Origin"),
+            (b"access-control-allow-methods", ", ".join(allow_methods).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+        ]
+        if not self.allow_all_headers:
+            allowed = ", ".join(sorted(self.allow_headers))
+            preflight_headers.append((b"access-control-allow-headers", allowed.encode("latin-1")))
+        preflight_headers.extend(simple_headers)
+        self.preflight_headers = preflight_headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin: bytes | None = None
+        request_method: bytes | None = None
+        request_headers: bytes | None = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self.preflight_response(send, origin, request_method, request_headers)
+            return
+
+        if not self.is_allowed_origin(origin):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cors_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = message.setdefault("headers", [])
+                self.add_origin_headers(headers, origin)
+                headers.extend(self.simple_headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors_headers)
+
+    def _match_origin(self, origin: bytes) -> bool:
+        """Return whether the given raw ``Origin`` header value is allowed."""
+        return self.allow_origin_regex.fullmatch(origin) is not None
+
+    @staticmethod
+    def add_origin_headers(headers: list[tuple[bytes, bytes]], origin: bytes) -> None:
+        """Mirror the origin back and make sure caches vary on it."""
+        headers.append((b"access-control-allow-origin", origin))
+        for index, (name, value) in enumerate(headers):
+            if name.lower() == b"vary":
+                headers[index] = (name, value + b", Origin")
+                return
+        headers.append((b"vary", b"Origin"))
+
+    async def preflight_response(
+        self,
+        send: Send,
+        origin: bytes,
+        request_method: bytes,
+        request_headers: bytes | None,
+    ) -> None:
+        """Answer a CORS preflight request without invoking the application."""
+        headers = list(self.preflight_headers)
+        failures = []
+
+        if self.is_allowed_origin(origin):
+            headers.append((b"access-control-allow-origin", origin))
+        else:
+            failures.append("origin")
+
+        if request_method.decode("latin-1") not in self.allow_methods:
+            failures.append("method")
+
+        if request_headers is not None:
+            if self.allow_all_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+            else:
+                requested = request_headers.decode("latin-1").lower().split(",")
+                if any(header.strip() not in self.allow_headers for header in requested):
+                    failures.append("headers")
+
+        if failures:
+            status = 400
+            body = ("Disallowed CORS " + ", ".join(failures)).encode("utf-8")
+        else:
+            status = 200
+            body = b"OK"
+
+        headers.append((b"content-type", b"text/plain; charset=utf-8"))
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -1,13 +1,19 @@
-from typing import Any, Literal, TypeAlias
+from typing import Annotated, Any, Literal, TypeAlias
 
-from pydantic import AnyHttpUrl, BaseModel, Field, FilePath
+from pydantic import AnyHttpUrl, BaseModel, Field
+
+PATH_MAX_LENGTH = 4096
 
 
 class PathInput(BaseModel):
     """Input referencing a file path on the server filesystem."""
 
     type: Literal["path"] = Field(description="Input type discriminator")
-    path: FilePath = Field(description="Absolute or relative path to file on server filesystem")
+    # Existence is checked lazily by the service layer rather than by a stat during validation.
+    path: str = Field(
+        max_length=PATH_MAX_LENGTH,
+        description="Absolute or relative path to file on server filesystem",
+    )
 
 
 class UrlInput(BaseModel):
@@ -34,7 +40,8 @@ class FileContentInput(BaseModel):
 
 BaseInput = PathInput | ContentInput
 ConfigInput = BaseInput
-SchemaInput = BaseInput | FileContentInput | UrlInput
+# Tagged on ``type`` so each list item is validated against a single member instead of every member in turn.
+SchemaInput = Annotated[BaseInput | FileContentInput | UrlInput, Field(discriminator="type")]
 
 ErrorCode: TypeAlias = Literal[
     "BadRequest",
@@ -111,6 +118,9 @@ class ResponseMetadata(BaseModel):
 
     result_format: str = Field(description="Format of the result content")
     processing_time_ms: int | None = Field(default=None, description="Processing time in milliseconds")
+    cache: Literal["hit", "miss"] | None = Field(
+        default=None, description="Result cache status (only present for cacheable requests)"
+    )
 
 
 class ApiResponse(BaseModel):
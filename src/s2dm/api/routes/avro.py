@@ -1,61 +1,76 @@
 """Avro export routes."""
 
+from functools import partial
 from typing import cast
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from graphql import DocumentNode
 
-from s2dm.api.config import COMMON_RESPONSES
+from s2dm.api.config import COMMON_RESPONSES, SUCCESS_RESPONSES
 from s2dm.api.models.avro import AvroProtocolExportRequest, AvroSchemaExportRequest
-from s2dm.api.models.base import ApiResponse
-from s2dm.api.services.response_service import execute_and_respond
+from s2dm.api.services.response_service import StreamRequested, execute_and_respond, request_cache_key
 from s2dm.api.services.schema_service import load_validated_schema
-from s2dm.exporters.avro import translate_to_avro_protocol, translate_to_avro_schema
 
 router = APIRouter(responses=COMMON_RESPONSES)
 
 
+def _export_avro_schema(request: AvroSchemaExportRequest) -> list[str]:
+    from s2dm.exporters.avro import translate_to_avro_schema
+
+    annotated_schema, query_document = load_validated_schema(
+        schemas=request.schemas,
+        naming_config_input=request.naming_config,
+        selection_query_input=request.selection_query,
+        root_type=request.root_type,
+        expanded_instances=request.expanded_instances,
+    )
+
+    avro_schema = translate_to_avro_schema(annotated_schema, request.namespace, cast(DocumentNode, query_document))
+    return [avro_schema]
+
+
 @router.post(
     "/avro/schema",
-    response_model=ApiResponse,
+    responses=SUCCESS_RESPONSES,
     openapi_extra={"x-exporter-name": "Avro Schema", "x-cli-command-name": "avro schema"},
 )
-def export_avro_schema(request: AvroSchemaExportRequest) -> ApiResponse:
+def export_avro_schema(request: AvroSchemaExportRequest, stream: StreamRequested) -> Response:
     """Export GraphQL schema to Avro Schema."""
+    return execute_and_respond(
+        executor=partial(_export_avro_schema, request),
+        result_format="avsc",
+        cache_key=request_cache_key("avro/schema", request),
+        stream=stream,
+        cpu_bound=True,
+    )
 
-    def process_request() -> list[str]:
-        annotated_schema, query_document = load_validated_schema(
-            schemas=request.schemas,
-            naming_config_input=request.naming_config,
-            selection_query_input=request.selection_query,
-            root_type=request.root_type,
-            expanded_instances=request.expanded_instances,
-        )
 
-        avro_schema = translate_to_avro_schema(annotated_schema, request.namespace, cast(DocumentNode, query_document))
-        return [avro_schema]
+def _export_avro_protocol(request: AvroProtocolExportRequest) -> list[str]:
+    from s2dm.exporters.avro import translate_to_avro_protocol
 
-    return execute_and_respond(executor=process_request, result_format="avsc")
+    annotated_schema, _ = load_validated_schema(
+        schemas=request.schemas,
+        naming_config_input=request.naming_config,
+        selection_query_input=request.selection_query,
+        root_type=request.root_type,
+        expanded_instances=request.expanded_instances,
+    )
+
+    protocols = translate_to_avro_protocol(annotated_schema, request.namespace, request.strict)
+    return list(protocols.values())
 
 
 @router.post(
     "/avro/protocol",
-    response_model=ApiResponse,
+    responses=SUCCESS_RESPONSES,
     openapi_extra={"x-exporter-name": "Avro Protocol", "x-cli-command-name": "avro protocol"},
 )
-def export_avro_protocol(request: AvroProtocolExportRequest) -> ApiResponse:
+def export_avro_protocol(request: AvroProtocolExportRequest, stream: StreamRequested) -> Response:
     """Export GraphQL schema to Avro Protocol (IDL)."""
-
-    def process_request() -> list[str]:
-        annotated_schema, _ = load_validated_schema(
-            schemas=request.schemas,
-            naming_config_input=request.naming_config,
-            selection_query_input=request.selection_query,
-            root_type=request.root_type,
-            expanded_instances=request.expanded_instances,
-        )
-
-        protocols = translate_to_avro_protocol(annotated_schema, request.namespace, request.strict)
-        return list(protocols.values())
-
-    return execute_and_respond(executor=process_request, result_format="avdl")
+    return execute_and_respond(
+        executor=partial(_export_avro_protocol, request),
+        result_format="avdl",
+        cache_key=request_cache_key("avro/protocol", request),
+        stream=stream,
+        cpu_bound=True,
+    )
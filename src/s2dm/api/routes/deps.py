@@ -1,7 +1,7 @@
 """Dependency resolution routes."""
 
 from fastapi import APIRouter, Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from s2dm.api.config import COMMON_RESPONSES
 from s2dm.api.errors import ResourceNotFoundError
@@ -124,11 +124,11 @@ def resolve_dependencies(request: ResolveDependenciesRequest) -> Response:
         return Response(status_code=204)
 
     response = DependenciesApiResponse(warnings=warnings)
-    return JSONResponse(status_code=200, content=response.model_dump())
+    return ORJSONResponse(status_code=200, content=response.model_dump())
 
 
-@router.post("/build", response_model=ApiResponse, responses=BUILD_RESPONSES)
-def build_dependencies(request: BuildDependenciesRequest) -> ApiResponse:
+@router.post("/build", responses=BUILD_RESPONSES)
+def build_dependencies(request: BuildDependenciesRequest) -> Response:
     """Compose vendored dependencies in the API-managed workspace."""
 
     def process_request() -> list[str]:
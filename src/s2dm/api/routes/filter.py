@@ -1,9 +1,8 @@
 """Schema filter route."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
-from s2dm.api.config import COMMON_RESPONSES
-from s2dm.api.models.base import ApiResponse
+from s2dm.api.config import COMMON_RESPONSES, SUCCESS_RESPONSES
 from s2dm.api.models.filter import FilterSchemaRequest
 from s2dm.api.services.response_service import execute_and_respond
 from s2dm.api.services.schema_service import load_validated_schema
@@ -12,8 +11,8 @@ from s2dm.exporters.utils.schema_loader import print_schema_with_directives_pres
 router = APIRouter(responses=COMMON_RESPONSES)
 
 
-@router.post("/filter", response_model=ApiResponse)
-def filter_schema(request: FilterSchemaRequest) -> ApiResponse:
+@router.post("/filter", responses=SUCCESS_RESPONSES)
+def filter_schema(request: FilterSchemaRequest) -> Response:
     """Filter a GraphQL schema based on selection query."""
 
     def process_request() -> list[str]:
@@ -1,8 +1,8 @@
 """Schema insights routes."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
-from s2dm.api.config import COMMON_RESPONSES
+from s2dm.api.config import COMMON_RESPONSES, success_responses
 from s2dm.api.models.insights import InsightsRequest
 from s2dm.api.services.insights_service import (
     get_schema_concepts,
@@ -10,30 +10,31 @@ from s2dm.api.services.insights_service import (
     get_schema_quality_issues,
     get_schema_relationships,
 )
+from s2dm.api.services.response_service import model_response
 from s2dm.tools.insights.models import ConceptsResult, CoverageResult, QualityResult, RelationshipsResult
 
 router = APIRouter(responses=COMMON_RESPONSES)
 
 
-@router.post("/concepts", response_model=ConceptsResult)
-def get_concepts(request: InsightsRequest) -> ConceptsResult:
+@router.post("/concepts", responses=success_responses(ConceptsResult))
+def get_concepts(request: InsightsRequest) -> Response:
     """Get concept counts, member names, and object-type field composition."""
-    return get_schema_concepts(request.schemas)
+    return model_response(get_schema_concepts(request.schemas))
 
 
-@router.post("/relationships", response_model=RelationshipsResult)
-def get_relationships(request: InsightsRequest) -> RelationshipsResult:
+@router.post("/relationships", responses=success_responses(RelationshipsResult))
+def get_relationships(request: InsightsRequest) -> Response:
     """Get the deepest object-reference paths reachable from the schema's root."""
-    return get_schema_relationships(request.schemas)
+    return model_response(get_schema_relationships(request.schemas))
 
 
-@router.post("/coverage", response_model=CoverageResult)
-def get_coverage(request: InsightsRequest) -> CoverageResult:
+@router.post("/coverage", responses=success_responses(CoverageResult))
+def get_coverage(request: InsightsRequest) -> Response:
     """Get documentation coverage across types, fields, enums, and enum values."""
-    return get_schema_coverage(request.schemas)
+    return model_response(get_schema_coverage(request.schemas))
 
 
-@router.post("/quality", response_model=QualityResult)
-def get_quality(request: InsightsRequest) -> QualityResult:
+@router.post("/quality", responses=success_responses(QualityResult))
+def get_quality(request: InsightsRequest) -> Response:
     """Get quality issues: missing descriptions, deprecated fields, unused elements."""
-    return get_schema_quality_issues(request.schemas)
+    return model_response(get_schema_quality_issues(request.schemas))
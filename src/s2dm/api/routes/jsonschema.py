@@ -1,35 +1,43 @@
 """JSON Schema export route."""
 
-from fastapi import APIRouter
+from functools import partial
 
-from s2dm.api.config import COMMON_RESPONSES
-from s2dm.api.models.base import ApiResponse
+from fastapi import APIRouter, Response
+
+from s2dm.api.config import COMMON_RESPONSES, SUCCESS_RESPONSES
 from s2dm.api.models.jsonschema import JsonSchemaExportRequest
-from s2dm.api.services.response_service import execute_and_respond
+from s2dm.api.services.response_service import StreamRequested, execute_and_respond, request_cache_key
 from s2dm.api.services.schema_service import load_validated_schema
-from s2dm.exporters.jsonschema import translate_to_jsonschema
 
 router = APIRouter(responses=COMMON_RESPONSES)
 
 
+def _export_jsonschema(request: JsonSchemaExportRequest) -> list[str]:
+    from s2dm.exporters.jsonschema import translate_to_jsonschema
+
+    annotated_schema, _ = load_validated_schema(
+        schemas=request.schemas,
+        naming_config_input=request.naming_config,
+        selection_query_input=request.selection_query,
+        root_type=request.root_type,
+        expanded_instances=request.expanded_instances,
+    )
+
+    json_schema = translate_to_jsonschema(annotated_schema, request.root_type, request.strict)
+    return [json_schema]
+
+
 @router.post(
     "/jsonschema",
-    response_model=ApiResponse,
+    responses=SUCCESS_RESPONSES,
     openapi_extra={"x-exporter-name": "JSON Schema", "x-cli-command-name": "jsonschema"},
 )
-def export_jsonschema(request: JsonSchemaExportRequest) -> ApiResponse:
+def export_jsonschema(request: JsonSchemaExportRequest, stream: StreamRequested) -> Response:
     """Export GraphQL schema to JSON Schema."""
-
-    def process_request() -> list[str]:
-        annotated_schema, _ = load_validated_schema(
-            schemas=request.schemas,
-            naming_config_input=request.naming_config,
-            selection_query_input=request.selection_query,
-            root_type=request.root_type,
-            expanded_instances=request.expanded_instances,
-        )
-
-        json_schema = translate_to_jsonschema(annotated_schema, request.root_type, request.strict)
-        return [json_schema]
-
-    return execute_and_respond(executor=process_request, result_format="json")
+    return execute_and_respond(
+        executor=partial(_export_jsonschema, request),
+        result_format="json",
+        cache_key=request_cache_key("jsonschema", request),
+        stream=stream,
+        cpu_bound=True,
+    )
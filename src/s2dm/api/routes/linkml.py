@@ -1,41 +1,49 @@
 """LinkML export route."""
 
-from fastapi import APIRouter
+from functools import partial
 
-from s2dm.api.config import COMMON_RESPONSES
-from s2dm.api.models.base import ApiResponse
+from fastapi import APIRouter, Response
+
+from s2dm.api.config import COMMON_RESPONSES, SUCCESS_RESPONSES
 from s2dm.api.models.linkml import LinkmlExportRequest
-from s2dm.api.services.response_service import execute_and_respond
+from s2dm.api.services.response_service import StreamRequested, execute_and_respond, request_cache_key
 from s2dm.api.services.schema_service import load_validated_schema
-from s2dm.exporters.linkml import translate_to_linkml
 
 router = APIRouter(responses=COMMON_RESPONSES)
 
 
+def _export_linkml(request: LinkmlExportRequest) -> list[str]:
+    from s2dm.exporters.linkml import translate_to_linkml
+
+    annotated_schema, _ = load_validated_schema(
+        schemas=request.schemas,
+        naming_config_input=request.naming_config,
+        selection_query_input=request.selection_query,
+        root_type=request.root_type,
+        expanded_instances=request.expanded_instances,
+    )
+
+    linkml_content = translate_to_linkml(
+        annotated_schema,
+        request.id,
+        request.name,
+        request.default_prefix,
+        request.default_prefix_url,
+    )
+    return [linkml_content]
+
+
 @router.post(
     "/linkml",
-    response_model=ApiResponse,
+    responses=SUCCESS_RESPONSES,
     openapi_extra={"x-exporter-name": "LinkML", "x-cli-command-name": "linkml"},
 )
-def export_linkml(request: LinkmlExportRequest) -> ApiResponse:
+def export_linkml(request: LinkmlExportRequest, stream: StreamRequested) -> Response:
     """Export GraphQL schema to LinkML."""
-
-    def process_request() -> list[str]:
-        annotated_schema, _ = load_validated_schema(
-            schemas=request.schemas,
-            naming_config_input=request.naming_config,
-            selection_query_input=request.selection_query,
-            root_type=request.root_type,
-            expanded_instances=request.expanded_instances,
-        )
-
-        linkml_content = translate_to_linkml(
-            annotated_schema,
-            request.id,
-            request.name,
-            request.default_prefix,
-            request.default_prefix_url,
-        )
-        return [linkml_content]
-
-    return execute_and_respond(executor=process_request, result_format="yaml")
+    return execute_and_respond(
+        executor=partial(_export_linkml, request),
+        result_format="yaml",
+        cache_key=request_cache_key("linkml", request),
+        stream=stream,
+        cpu_bound=True,
+    )
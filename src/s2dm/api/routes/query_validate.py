@@ -1,21 +1,21 @@
 """Query validate route - validate GraphQL query against schema."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from graphql import parse, print_schema, validate
 
-from s2dm.api.config import COMMON_RESPONSES
+from s2dm.api.config import COMMON_RESPONSES, SUCCESS_RESPONSES
 from s2dm.api.errors import ResponseError, format_error_list
-from s2dm.api.models.base import ApiResponse
 from s2dm.api.models.query_validate import ValidateQueryRequest
 from s2dm.api.services.response_service import execute_and_respond
 from s2dm.api.services.schema_service import path_for_content, process_schema_input, validate_schema_or_raise
 from s2dm.exporters.utils.schema_loader import load_schema
+from s2dm.utils.file import read_text_mapped
 
 router = APIRouter(responses=COMMON_RESPONSES)
 
 
-@router.post("/validate", response_model=ApiResponse)
-def validate_query(request: ValidateQueryRequest) -> ApiResponse:
+@router.post("/validate", responses=SUCCESS_RESPONSES)
+def validate_query(request: ValidateQueryRequest) -> Response:
     """Validate a GraphQL query against a schema. Returns the schema if validation succeeds."""
 
     def process_request() -> list[str]:
@@ -25,7 +25,7 @@ def validate_query(request: ValidateQueryRequest) -> ApiResponse:
         validate_schema_or_raise(schema)
 
         query_path = path_for_content(request.selection_query, "selection_query", ".graphql")
-        query_text = query_path.read_text(encoding="utf-8")
+        query_text = read_text_mapped(query_path)
 
         query_document = parse(query_text)
 
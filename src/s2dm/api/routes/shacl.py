@@ -1,45 +1,53 @@
 """SHACL export route."""
 
-from fastapi import APIRouter
+from functools import partial
 
-from s2dm.api.config import COMMON_RESPONSES
-from s2dm.api.models.base import ApiResponse
+from fastapi import APIRouter, Response
+
+from s2dm.api.config import COMMON_RESPONSES, SUCCESS_RESPONSES
 from s2dm.api.models.shacl import ShaclExportRequest
-from s2dm.api.services.response_service import execute_and_respond
+from s2dm.api.services.response_service import StreamRequested, execute_and_respond, request_cache_key
 from s2dm.api.services.schema_service import load_validated_schema
-from s2dm.exporters.shacl import translate_to_shacl
 
 router = APIRouter(responses=COMMON_RESPONSES)
 
 
+def _export_shacl(request: ShaclExportRequest) -> list[str]:
+    from s2dm.exporters.shacl import translate_to_shacl
+
+    annotated_schema, _ = load_validated_schema(
+        schemas=request.schemas,
+        naming_config_input=request.naming_config,
+        selection_query_input=request.selection_query,
+        root_type=request.root_type,
+        expanded_instances=request.expanded_instances,
+    )
+
+    graph = translate_to_shacl(
+        annotated_schema,
+        request.shapes_namespace,
+        request.shapes_namespace_prefix,
+        request.model_namespace,
+        request.model_namespace_prefix,
+    )
+
+    result_str = graph.serialize(format=request.serialization_format)
+    if isinstance(result_str, bytes):
+        result_str = result_str.decode("utf-8")
+    return [result_str]
+
+
 @router.post(
     "/shacl",
-    response_model=ApiResponse,
+    responses=SUCCESS_RESPONSES,
     openapi_extra={"x-exporter-name": "SHACL", "x-cli-command-name": "shacl"},
 )
-def export_shacl(request: ShaclExportRequest) -> ApiResponse:
+def export_shacl(request: ShaclExportRequest, stream: StreamRequested) -> Response:
     """Export GraphQL schema to SHACL shapes."""
-
-    def process_request() -> list[str]:
-        annotated_schema, _ = load_validated_schema(
-            schemas=request.schemas,
-            naming_config_input=request.naming_config,
-            selection_query_input=request.selection_query,
-            root_type=request.root_type,
-            expanded_instances=request.expanded_instances,
-        )
-
-        graph = translate_to_shacl(
-            annotated_schema,
-            request.shapes_namespace,
-            request.shapes_namespace_prefix,
-            request.model_namespace,
-            request.model_namespace_prefix,
-        )
-
-        result_str = graph.serialize(format=request.serialization_format)
-        if isinstance(result_str, bytes):
-            result_str = result_str.decode("utf-8")
-        return [result_str]
-
-    return execute_and_respond(executor=process_request, result_format=request.serialization_format)
+    return execute_and_respond(
+        executor=partial(_export_shacl, request),
+        result_format=request.serialization_format,
+        cache_key=request_cache_key("shacl", request),
+        stream=stream,
+        cpu_bound=True,
+    )
@@ -1,9 +1,8 @@
 """Schema validate route - compose and validate GraphQL schemas."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
-from s2dm.api.config import COMMON_RESPONSES
-from s2dm.api.models.base import ApiResponse
+from s2dm.api.config import COMMON_RESPONSES, SUCCESS_RESPONSES
 from s2dm.api.models.validate import ValidateSchemaRequest
 from s2dm.api.services.response_service import execute_and_respond
 from s2dm.api.services.schema_service import process_schema_input, validate_schema_or_raise
@@ -15,8 +14,8 @@ from s2dm.exporters.utils.schema_loader import (
 router = APIRouter(responses=COMMON_RESPONSES)
 
 
-@router.post("/validate", response_model=ApiResponse)
-def validate_schema(request: ValidateSchemaRequest) -> ApiResponse:
+@router.post("/validate", responses=SUCCESS_RESPONSES)
+def validate_schema(request: ValidateSchemaRequest) -> Response:
     """Compose and validate GraphQL schemas."""
 
     def process_request() -> list[str]:
@@ -1,32 +1,41 @@
 """VSPEC export route."""
 
-from fastapi import APIRouter
+from functools import partial
 
-from s2dm.api.config import COMMON_RESPONSES
-from s2dm.api.models.base import ApiResponse, BaseExportRequest
-from s2dm.api.services.response_service import execute_and_respond
+from fastapi import APIRouter, Response
+
+from s2dm.api.config import COMMON_RESPONSES, SUCCESS_RESPONSES
+from s2dm.api.models.base import BaseExportRequest
+from s2dm.api.services.response_service import StreamRequested, execute_and_respond, request_cache_key
 from s2dm.api.services.schema_service import load_validated_schema
-from s2dm.exporters.vspec import translate_to_vspec
 
 router = APIRouter(responses=COMMON_RESPONSES)
 
 
-@router.post(
-    "/vspec", response_model=ApiResponse, openapi_extra={"x-exporter-name": "VSpec", "x-cli-command-name": "vspec"}
-)
-def export_vspec(request: BaseExportRequest) -> ApiResponse:
-    """Export GraphQL schema to VSPEC."""
+def _export_vspec(request: BaseExportRequest) -> list[str]:
+    from s2dm.exporters.vspec import translate_to_vspec
 
-    def process_request() -> list[str]:
-        annotated_schema, _ = load_validated_schema(
-            schemas=request.schemas,
-            naming_config_input=request.naming_config,
-            selection_query_input=request.selection_query,
-            root_type=request.root_type,
-            expanded_instances=request.expanded_instances,
-        )
+    annotated_schema, _ = load_validated_schema(
+        schemas=request.schemas,
+        naming_config_input=request.naming_config,
+        selection_query_input=request.selection_query,
+        root_type=request.root_type,
+        expanded_instances=request.expanded_instances,
+    )
 
-        vspec_content = translate_to_vspec(annotated_schema)
-        return [vspec_content]
+    vspec_content = translate_to_vspec(annotated_schema)
+    return [vspec_content]
 
-    return execute_and_respond(executor=process_request, result_format="vspec")
+
+@router.post(
+    "/vspec", responses=SUCCESS_RESPONSES, openapi_extra={"x-exporter-name": "VSpec", "x-cli-command-name": "vspec"}
+)
+def export_vspec(request: BaseExportRequest, stream: StreamRequested) -> Response:
+    """Export GraphQL schema to VSPEC."""
+    return execute_and_respond(
+        executor=partial(_export_vspec, request),
+        result_format="vspec",
+        cache_key=request_cache_key("vspec", request),
+        stream=stream,
+        cpu_bound=True,
+    )
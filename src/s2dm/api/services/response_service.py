@@ -1,38 +1,224 @@
 """Response construction service for API endpoints."""
 
+import hashlib
+import multiprocessing
+import os
+import threading
 import time
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Annotated, Any
+
+import orjson
+from fastapi import Depends, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel
 
 from s2dm.api.errors import to_response_error
-from s2dm.api.models.base import ApiResponse, ResponseMetadata
+from s2dm.api.models.base import PathInput, UrlInput
+
+RESULT_CACHE_MAX_SIZE = 64
+RESULT_CACHE_TTL_SECONDS = 300.0
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+class ResultCache:
+    """Thread-safe LRU cache of executor results whose entries expire after a time-to-live."""
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, list[str]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> list[str] | None:
+        """Return the cached result for ``key``, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: str, result: list[str]) -> None:
+        """Store ``result`` under ``key``, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+
+result_cache = ResultCache(max_size=RESULT_CACHE_MAX_SIZE, ttl_seconds=RESULT_CACHE_TTL_SECONDS)
+
+
+_export_pool: ProcessPoolExecutor | None = None
+
+
+def start_export_pool(max_workers: int | None = None) -> None:
+    """Start the worker processes that CPU-bound exports are offloaded to.
+
+    Exporters are pure Python and hold the GIL for their whole run, so running them on the request
+    threads limits the API to a single core. Until the pool is started, exports run inline.
+
+    Args:
+        max_workers: Number of worker processes, defaults to the number of CPUs
+    """
+    global _export_pool
+    if _export_pool is None:
+        _export_pool = ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+
+def shutdown_export_pool() -> None:
+    """Stop the export worker processes, waiting for running exports to finish."""
+    global _export_pool
+    if _export_pool is not None:
+        _export_pool.shutdown()
+        _export_pool = None
+
+
+def _run_in_worker(executor: Callable[[], list[str]]) -> list[str]:
+    # Library exceptions (e.g. GraphQLSyntaxError) cannot always be rebuilt from their pickled
+    # form, so they are translated to ResponseError before crossing the process boundary.
+    try:
+        return executor()
+    except Exception as exc:
+        response_error = to_response_error(exc)
+        if response_error is not None:
+            raise response_error from exc
+        raise
+
+
+def _iter_inputs(request: BaseModel) -> Iterator[Any]:
+    for field_name in type(request).model_fields:
+        value = getattr(request, field_name)
+        if isinstance(value, list):
+            yield from value
+        else:
+            yield value
+
+
+def request_cache_key(endpoint: str, request: BaseModel) -> str | None:
+    """Fingerprint a request so identical requests can reuse a previously computed result.
+
+    Path inputs contribute their modification time and size, so edits to the referenced files
+    invalidate the fingerprint. Requests referencing URLs or unreadable paths are not cacheable.
+
+    Args:
+        endpoint: Identifier of the endpoint handling the request
+        request: Validated request model
+
+    Returns:
+        Hex digest identifying the request, or None if the request must not be cached
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(endpoint.encode("utf-8"))
+    digest.update(request.model_dump_json().encode("utf-8"))
+
+    for value in _iter_inputs(request):
+        if isinstance(value, UrlInput):
+            return None
+        if isinstance(value, PathInput):
+            try:
+                stat_result = os.stat(value.path)
+            except OSError:
+                return None
+            digest.update(f"{stat_result.st_mtime_ns}:{stat_result.st_size}".encode())
+
+    return digest.hexdigest()
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Return whether the client asked for a streamed NDJSON response via the Accept header."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+StreamRequested = Annotated[bool, Depends(wants_ndjson)]
+
+
+def _ndjson_lines(result: list[str], metadata: dict[str, Any]) -> Iterator[bytes]:
+    yield orjson.dumps({"metadata": metadata}, option=orjson.OPT_APPEND_NEWLINE)
+    for chunk in result:
+        yield orjson.dumps({"result_chunk": chunk}, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def _build_response(result: list[str], metadata: dict[str, Any], stream: bool) -> Response:
+    if stream:
+        return StreamingResponse(_ndjson_lines(result, metadata), media_type=NDJSON_MEDIA_TYPE)
+    return ORJSONResponse({"result": result, "metadata": metadata})
+
+
+def model_response(model: BaseModel) -> Response:
+    """Serialize an already validated model straight to a JSON response."""
+    return Response(model.model_dump_json(), media_type="application/json")
 
 
 def execute_and_respond(
     executor: Callable[[], list[str]],
     result_format: str,
-) -> ApiResponse:
-    """Execute a callable and construct an ApiResponse with timing metadata.
+    cache_key: str | None = None,
+    stream: bool = False,
+    cpu_bound: bool = False,
+) -> Response:
+    """Execute a callable and construct a JSON response with timing metadata.
+
+    The body is serialized directly instead of returning an ``ApiResponse`` model, so FastAPI skips
+    re-encoding and re-validating potentially large exported payloads.
 
     Args:
         executor: Callable that performs the work and returns list of result strings
         result_format: Format identifier for the result (e.g., "avsc", "proto", "graphql")
+        cache_key: Optional request fingerprint (see ``request_cache_key``). When given, a
+            previously computed result for the same key is returned without running the executor.
+        stream: Whether to stream the result as NDJSON, one line for the metadata followed by one
+            ``result_chunk`` line per result string, instead of a single JSON document
+        cpu_bound: Whether to run the executor in the export process pool (see
+            ``start_export_pool``). The executor and its arguments must then be picklable.
 
     Returns:
-        ApiResponse with result and timing metadata
+        JSON response matching the ApiResponse schema with result and timing metadata, or the
+        equivalent NDJSON stream
     """
-    start_time = time.perf_counter()
+    if cache_key is not None:
+        cached_result = result_cache.get(cache_key)
+        if cached_result is not None:
+            metadata = {"result_format": result_format, "processing_time_ms": 0, "cache": "hit"}
+            return _build_response(cached_result, metadata, stream)
+
+    start_ns = time.perf_counter_ns()
 
     try:
-        result = executor()
+        if cpu_bound and _export_pool is not None:
+            result = _export_pool.submit(_run_in_worker, executor).result()
+        else:
+            result = executor()
     except Exception as exc:
         response_error = to_response_error(exc)
         if response_error is not None:
             raise response_error from exc
         raise
 
-    processing_time_ms = int((time.perf_counter() - start_time) * 1000)
+    processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+    if cache_key is not None:
+        result_cache.put(cache_key, result)
 
-    return ApiResponse(
-        result=result,
-        metadata=ResponseMetadata(result_format=result_format, processing_time_ms=processing_time_ms),
-    )
+    metadata = {
+        "result_format": result_format,
+        "processing_time_ms": processing_time_ms,
+        "cache": None if cache_key is None else "miss",
+    }
+    return _build_response(result, metadata, stream)
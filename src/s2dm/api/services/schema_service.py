@@ -1,5 +1,6 @@
 """Schema processing service for API endpoints."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from graphql import DocumentNode, GraphQLSchema
@@ -14,6 +15,8 @@ from s2dm.exporters.utils.schema_loader import (
 )
 from s2dm.utils.file import temp_file_from_content
 
+MAX_SCHEMA_DOWNLOAD_WORKERS = 8
+
 
 def process_schema_input(schema_input: SchemaInput) -> Path:
     """Process schema input (path, URL, or content) and return Path object."""
@@ -22,6 +25,19 @@ def process_schema_input(schema_input: SchemaInput) -> Path:
     return path_for_content(schema_input, "schema", ".graphql")
 
 
+def process_schema_inputs(schema_inputs: list[SchemaInput]) -> list[Path]:
+    """Process several schema inputs, downloading URL inputs concurrently.
+
+    Returns:
+        Paths in the order of the given inputs
+    """
+    if len(schema_inputs) < 2 or not any(schema_input.type == "url" for schema_input in schema_inputs):
+        return [process_schema_input(schema_input) for schema_input in schema_inputs]
+
+    with ThreadPoolExecutor(max_workers=min(MAX_SCHEMA_DOWNLOAD_WORKERS, len(schema_inputs))) as executor:
+        return list(executor.map(process_schema_input, schema_inputs))
+
+
 def path_for_content(source: BaseInput | FileContentInput, filename: str, extension: str) -> Path:
     """
     Get a Path for a BaseInput, creating a temp file if needed.
@@ -38,7 +54,10 @@ def path_for_content(source: BaseInput | FileContentInput, filename: str, extens
         FileNotFoundError: If PathInput path doesn't exist
     """
     if source.type == "path":
-        return Path(source.path)
+        path = Path(source.path)
+        if not path.is_file():
+            raise FileNotFoundError(f"File not found: {path}")
+        return path
     if source.type == "file_content":
         return temp_file_from_content(content=source.content, filename=source.filename)
     return temp_file_from_content(
@@ -69,7 +88,7 @@ def load_validated_schema(
         Tuple of (AnnotatedSchema, selection query DocumentNode)
     """
     try:
-        schema_paths = [process_schema_input(schema_input) for schema_input in schemas]
+        schema_paths = process_schema_inputs(schemas)
 
         naming_config_path = (
             path_for_content(naming_config_input, "naming_config", ".yaml") if naming_config_input else None
@@ -0,0 +1 @@
+"""Helpers for assembling the S2DM REST API application."""
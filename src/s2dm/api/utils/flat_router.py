@@ -0,0 +1,37 @@
+"""Router that collects sub-routers and hands their routes to an application in one pass."""
+
+from enum import Enum
+
+from fastapi import APIRouter, FastAPI
+
+from s2dm.api.utils.hash_router import HashRouter
+
+
+class FlatAPIRouter(APIRouter):
+    """APIRouter whose routes are built once, already configured for ``app``.
+
+    ``app.include_router`` re-creates every route it includes, so including the sub-routers into an
+    intermediate router and that into the application builds each route twice. This router takes
+    the application's default response class and dependency overrides up front, so the routes
+    ``include_flat`` builds through the public ``include_router`` are final and ``install`` only
+    has to append them to the application router. The sub-routers themselves are left untouched.
+    """
+
+    def __init__(self, app: FastAPI) -> None:
+        super().__init__(
+            default_response_class=app.router.default_response_class,
+            dependency_overrides_provider=app,
+        )
+
+    def include_flat(self, router: APIRouter, *, prefix: str = "", tags: list[str | Enum] | None = None) -> None:
+        """Add copies of the routes of ``router`` to this router under ``prefix`` and ``tags``."""
+        self.include_router(router, prefix=prefix, tags=tags)
+
+    def install(self, app: FastAPI) -> None:
+        """Append the collected routes to the application router and index them for dispatch.
+
+        The index is placed ahead of every other route and covers the static routes registered so
+        far; routes added afterwards are still found by Starlette's regular matching.
+        """
+        app.router.routes.extend(self.routes)
+        app.router.routes.insert(0, HashRouter(app.router.routes))
@@ -0,0 +1,64 @@
+"""Dictionary-based dispatch for routes with static paths."""
+
+from collections.abc import Iterable
+from typing import Any
+
+from starlette.datastructures import URLPath
+from starlette.routing import BaseRoute, Match, NoMatchFound, Route
+from starlette.types import Receive, Scope, Send
+
+
+def _route_path(scope: Scope) -> str:
+    """Return the request path relative to the application's root path."""
+    path: str = scope["path"]
+    root_path: str = scope.get("root_path", "")
+    if not root_path or not path.startswith(root_path):
+        return path
+    if path == root_path:
+        return ""
+    if path[len(root_path)] == "/":
+        return path[len(root_path) :]
+    return path
+
+
+class HashRouter(BaseRoute):
+    """Route that resolves the static routes of a router with a single dict lookup.
+
+    Starlette's router tries every route's path regex in turn. Placed first in the route list, this
+    route indexes the routes without path parameters by ``(method, path)`` and matches a request
+    on their behalf. Any other request does not match it, so the router carries on with its usual
+    linear matching. That includes parametric paths, mounts, 404/405 handling, slash redirects and
+    routes registered after the index was built. Static routes therefore take precedence over
+    parametric ones matching the same path.
+    """
+
+    def __init__(self, routes: Iterable[BaseRoute]) -> None:
+        self.static_routes: dict[tuple[str, str], Route] = {}
+        for route in routes:
+            if isinstance(route, Route) and route.methods and not route.param_convertors:
+                for method in route.methods:
+                    self.static_routes.setdefault((method, route.path), route)
+
+    def _lookup(self, scope: Scope) -> Route | None:
+        if scope["type"] != "http":
+            return None
+        return self.static_routes.get((scope["method"], _route_path(scope)))
+
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+        route = self._lookup(scope)
+        if route is None:
+            return Match.NONE, {}
+        match, child_scope = route.matches(scope)
+        if match != Match.FULL:
+            return Match.NONE, {}
+        return match, child_scope
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        route = self._lookup(scope)
+        if route is None:
+            raise RuntimeError("HashRouter handled a request it did not match")
+        await route.handle(scope, receive, send)
+
+    def url_path_for(self, name: str, /, **path_params: Any) -> URLPath:
+        # URLs are built from the indexed routes themselves, which follow this one in the route list
+        raise NoMatchFound(name, path_params)
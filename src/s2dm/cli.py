@@ -1,6 +1,8 @@
+import filecmp
 import functools
 import json
 import logging
+import multiprocessing
 import os
 import queue
 import re
@@ -10,39 +12,33 @@ import sys
 import threading
 import time
 import webbrowser
+from collections import Counter
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, cast
 from urllib.parse import urlparse
 
 import rich_click as click
 import yaml
-from graphql import DocumentNode, GraphQLError, GraphQLSchema
+from graphql import (
+    DocumentNode,
+    GraphQLEnumType,
+    GraphQLError,
+    GraphQLInputObjectType,
+    GraphQLInterfaceType,
+    GraphQLNamedType,
+    GraphQLObjectType,
+    GraphQLScalarType,
+    GraphQLSchema,
+    GraphQLUnionType,
+)
 from pydantic import ValidationError
 from rdflib import Graph
 from rich.traceback import install
 
 from s2dm import __version__, log
-from s2dm.concept.services import iter_all_concepts
-from s2dm.deps.helpers import (
-    build_resolver_context,
-    get_dependency_config_path,
-    get_dependency_identity_path,
-    load_dependency_config,
-    load_dependency_identity_config,
-    load_vendored_dependency_schema_inputs,
-    prepare_dependency_schemas_for_composition,
-    resolve_dependency_config_to_lock_path,
-    validate_cached_dependency_workspace,
-)
-from s2dm.deps.resolve.common import VENDOR_DIRECTORY
-from s2dm.deps.resolve.warnings import LoggingWarningCollector
 from s2dm.docs import docs
-from s2dm.exporters.avro import translate_to_avro_protocol, translate_to_avro_schema
-from s2dm.exporters.id import IDExporter
-from s2dm.exporters.jsonschema import translate_to_jsonschema
-from s2dm.exporters.linkml import translate_to_linkml
-from s2dm.exporters.protobuf import translate_to_protobuf
 from s2dm.exporters.rdf_materializer import (
     FORMAT_ALIASES,
     FORMAT_REGISTRY,
@@ -52,7 +48,6 @@ from s2dm.exporters.rdf_materializer import (
     materialize_skos_graph,
     write_rdf_artifacts,
 )
-from s2dm.exporters.shacl import translate_to_shacl
 from s2dm.exporters.sparql_queries import QUERIES as SPARQL_QUERIES
 from s2dm.exporters.sparql_queries import (
     format_results_as_table,
@@ -60,9 +55,8 @@ from s2dm.exporters.sparql_queries import (
     run_query,
     run_query_from_file,
 )
-from s2dm.exporters.spec_history import SpecHistoryExporter
 from s2dm.exporters.utils.extraction import get_all_named_types, get_all_object_types, get_root_level_types_from_query
-from s2dm.exporters.utils.graphql_type import is_builtin_scalar_type, is_introspection_type
+from s2dm.exporters.utils.graphql_type import BUILTIN_SCALAR_TYPES
 from s2dm.exporters.utils.naming_config import ValidationMode, load_naming_convention_config
 from s2dm.exporters.utils.schema import search_schema
 from s2dm.exporters.utils.schema_loader import (
@@ -76,9 +70,6 @@ from s2dm.exporters.utils.schema_loader import (
     resolve_files_by_extensions,
 )
 from s2dm.exporters.utils.violations import Severity
-from s2dm.exporters.vspec import translate_to_vspec
-from s2dm.ledger import Ledger
-from s2dm.registry.concept_uris import create_concept_uri_model
 from s2dm.registry.search import NO_LIMIT_KEYWORDS, SearchResult, SKOSSearchService
 from s2dm.tools.constraint_checker import ConstraintChecker
 from s2dm.tools.diff_parser import DiffChange
@@ -94,20 +85,36 @@ from s2dm.tools.insights.summary import (
     build_relationships_summary,
 )
 from s2dm.tools.validators import validate_language_tag, validate_linkml_uri
-from s2dm.units.sync import (
-    UNITS_README_FILENAME,
-    UNITS_README_VERSION_PATTERN,
-    UnitEnumError,
-    get_latest_qudt_version,
-    sync_qudt_units,
-)
 from s2dm.utils.download import download_url_to_temp
-from s2dm.utils.json_output import format_json_output
+from s2dm.utils.file import ensure_parent_dir, write_bytes_atomic
+from s2dm.utils.json_output import format_json_output, write_json_output
 from s2dm.utils.url import is_url
 
 S2DM_HOME = Path.home() / ".s2dm"
 DEFAULT_QUDT_UNITS_DIR = S2DM_HOME / "units" / "qudt"
 
+# Path parameter types shared by the options below; click keeps no per-option state in them.
+EXISTING_PATH = click.Path(exists=True, path_type=Path)
+EXISTING_FILE_PATH = click.Path(exists=True, dir_okay=False, path_type=Path)
+EXISTING_DIR_PATH = click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path)
+FILE_PATH = click.Path(dir_okay=False, path_type=Path)
+OUTPUT_FILE_PATH = click.Path(dir_okay=False, writable=True, path_type=Path)
+OUTPUT_DIR_PATH = click.Path(file_okay=False, writable=True, path_type=Path)
+
+LOG_FILE_FORMATTER = logging.Formatter("%(asctime)s:%(levelname)s:%(message)s")
+
+_log_file_handler: logging.FileHandler | None = None
+
+# Label under which `stats graphql` counts each kind of named type.
+TYPE_KIND_LABELS: dict[type[GraphQLNamedType], str] = {
+    GraphQLObjectType: "object",
+    GraphQLEnumType: "enum",
+    GraphQLScalarType: "scalar",
+    GraphQLInterfaceType: "interface",
+    GraphQLUnionType: "union",
+    GraphQLInputObjectType: "input_object",
+}
+
 
 def get_free_port() -> int:
     """Get a free port allocated by the OS."""
@@ -204,11 +211,13 @@ class RdfResolverOption(_PathResolverOption):
     _file_extensions = frozenset(FORMAT_REGISTRY.values())
 
 
+@functools.cache
 def selection_query_option(required: bool = False) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    # click builds a fresh Option on every application, so the two variants are shared between commands
     return click.option(
         "--selection-query",
         "-q",
-        type=click.Path(exists=True, dir_okay=False, path_type=Path),
+        type=EXISTING_FILE_PATH,
         required=required,
         help="GraphQL query file to filter the passed schema",
     )
@@ -217,14 +226,14 @@ def selection_query_option(required: bool = False) -> Callable[[Callable[..., An
 deps_config_option = click.option(
     "--config",
     "config_path",
-    type=click.Path(dir_okay=False, path_type=Path),
+    type=FILE_PATH,
     help="Dependency manifest file. Defaults to s2dm.deps.yaml in the current working directory.",
 )
 
 deps_identity_option = click.option(
     "--identity",
     "identity_path",
-    type=click.Path(dir_okay=False, path_type=Path),
+    type=FILE_PATH,
     help=(
         "Dependency identity file containing tokens; do not commit it. "
         "Defaults to .s2dm.identity.yaml in the current working directory when present."
@@ -243,7 +252,7 @@ root_type_option = click.option(
 output_option = click.option(
     "--output",
     "-o",
-    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    type=OUTPUT_FILE_PATH,
     required=True,
     help="Output file",
 )
@@ -260,7 +269,7 @@ merge_shared_definitions_option = click.option(
 optional_output_option = click.option(
     "--output",
     "-o",
-    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    type=OUTPUT_FILE_PATH,
     required=False,
     help="Output file",
 )
@@ -276,7 +285,7 @@ def apply_version_tag_suffix(output: Path, version_tag: str) -> Path:
 def ensure_output_parent(output: Path | None) -> None:
     """Create parent directory for the given output path if provided."""
     if output is not None:
-        output.parent.mkdir(parents=True, exist_ok=True)
+        ensure_parent_dir(output)
 
 
 def derive_variant_ids_path(base_dir: Path, version_tag: str) -> Path:
@@ -347,44 +356,45 @@ avro_namespace_option = click.option(
 naming_config_option = click.option(
     "--naming-config",
     "-n",
-    type=click.Path(exists=True, path_type=Path),
+    type=EXISTING_PATH,
     help="YAML file containing naming configuration",
 )
 
 ledger_option = click.option(
     "--ledger",
     "ledger_dir",
-    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    type=EXISTING_DIR_PATH,
     help="Ledger directory (concepts.csv, contracts.csv) used to annotate types, fields, and enum values "
     "with @modl directives.",
 )
 
 node_modules_path_option = click.option(
     "--node-modules-path",
-    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
+    type=EXISTING_DIR_PATH,
     default=None,
     help="Path to node_modules directory containing graphql-inspector (auto-detected if not provided).",
 )
 
 
-def pretty_print_dict_json(result: dict[str, Any]) -> dict[str, Any]:
-    """
-    Recursively pretty-print a dict for JSON output:
-    - Converts string values with newlines to lists of lines.
-    - Processes nested dicts and lists.
-    Returns a new dict suitable for pretty JSON output.
-    """
+def _same_schema_inputs(schemas: list[Path], other_schemas: list[Path]) -> bool:
+    """Return whether both schema inputs resolve to the same set of files."""
+    return sorted(path.resolve() for path in schemas) == sorted(path.resolve() for path in other_schemas)
 
-    def multiline_str_representer(obj: Any) -> Any:
-        if isinstance(obj, str) and "\n" in obj:
-            return obj.splitlines()
-        elif isinstance(obj, dict):
-            return {k: multiline_str_representer(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [multiline_str_representer(i) for i in obj]
-        return obj
 
-    return {k: multiline_str_representer(v) for k, v in result.items()}
+def _compose_schemas_for_diff(old_schemas: list[Path], new_schemas: list[Path]) -> tuple[Path, Path] | None:
+    """Compose both sides of a schema diff, or return None if they cannot differ.
+
+    Inputs resolving to the same files are composed once, so an invalid schema still fails, and inputs
+    that compose to the same SDL (e.g. a copy of the previous release) are detected before
+    graphql-inspector is started.
+    """
+    old_temp_path = create_tempfile_to_composed_schema(old_schemas)
+    if _same_schema_inputs(old_schemas, new_schemas):
+        return None
+    new_temp_path = create_tempfile_to_composed_schema(new_schemas)
+    if old_temp_path == new_temp_path or filecmp.cmp(old_temp_path, new_temp_path, shallow=False):
+        return None
+    return old_temp_path, new_temp_path
 
 
 def assert_correct_schema(schema: GraphQLSchema) -> None:
@@ -408,18 +418,30 @@ def assert_correct_schema(schema: GraphQLSchema) -> None:
 )
 @click.option(
     "--log-file",
-    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    type=OUTPUT_FILE_PATH,
     help="Log file",
 )
 @click.version_option(__version__)
 def cli(log_level: str, log_file: Path | None) -> None:
+    global _log_file_handler
+    # The CLI can be invoked repeatedly in one process (tests, CliRunner), so the file handler of a
+    # previous invocation is replaced instead of piling up and writing every record once per run.
+    if _log_file_handler is not None:
+        log.removeHandler(_log_file_handler)
+        _log_file_handler.close()
+        _log_file_handler = None
     if log_file:
-        file_handler = logging.FileHandler(log_file, mode="w")
-        file_handler.setFormatter(logging.Formatter("%(asctime)s:%(levelname)s:%(message)s"))
-        log.addHandler(file_handler)
-
-    log.setLevel(log_level)
-    if log_level == "DEBUG":
+        _log_file_handler = logging.FileHandler(log_file, mode="w")
+        _log_file_handler.setFormatter(LOG_FILE_FORMATTER)
+        log.addHandler(_log_file_handler)
+
+    # setLevel clears the level cache of every logger, which is wasted work for the default level
+    level = logging.getLevelName(log_level)
+    if log.level != level:
+        log.setLevel(level)
+    # The locals-rendering exception hook only helps someone reading the terminal; piped output
+    # (e.g. CI logs) keeps the plain traceback instead of walking every frame on errors.
+    if log_level == "DEBUG" and sys.stderr.isatty():
         _ = install(show_locals=True)
 
 
@@ -516,7 +538,7 @@ def _query_epilog() -> str:
     "--query-file",
     "-q",
     "query_file",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    type=EXISTING_FILE_PATH,
     default=None,
     help="Path to a custom .sparql file to execute instead of a predefined query",
 )
@@ -566,6 +588,16 @@ def query(
 @click.option("--clean", is_flag=True, default=False, help="Remove the lock file and vendored dependencies first.")
 def deps_resolve(config_path: Path | None, identity_path: Path | None, clean: bool) -> None:
     """Resolve dependencies from the configured dependency manifest."""
+    from s2dm.deps.helpers import (
+        build_resolver_context,
+        get_dependency_config_path,
+        get_dependency_identity_path,
+        load_dependency_config,
+        load_dependency_identity_config,
+        resolve_dependency_config_to_lock_path,
+    )
+    from s2dm.deps.resolve.warnings import LoggingWarningCollector
+
     working_directory = Path.cwd()
     resolved_config_path = config_path or get_dependency_config_path(working_directory)
 
@@ -598,6 +630,15 @@ def deps_resolve(config_path: Path | None, identity_path: Path | None, clean: bo
 @output_option
 def deps_build(config_path: Path | None, auto_prefix: bool, merge_shared_definitions: bool, output: Path) -> None:
     """Compose all vendored dependency schemas into a single output file."""
+    from s2dm.deps.helpers import (
+        get_dependency_config_path,
+        load_dependency_config,
+        load_vendored_dependency_schema_inputs,
+        prepare_dependency_schemas_for_composition,
+        validate_cached_dependency_workspace,
+    )
+    from s2dm.deps.resolve.common import VENDOR_DIRECTORY
+
     working_directory = Path.cwd()
     resolved_config_path = config_path or get_dependency_config_path(working_directory)
     vendor_root = working_directory / VENDOR_DIRECTORY
@@ -667,6 +708,7 @@ def units_sync(version: str | None, directory: Path, dry_run: bool) -> None:
         directory: Output directory for generated QUDT unit enums (default: ~/.s2dm/units/qudt)
         dry_run: Show what would be generated without actually writing files
     """
+    from s2dm.units.sync import UnitEnumError, get_latest_qudt_version, sync_qudt_units
 
     version_to_use = version or get_latest_qudt_version()
 
@@ -693,6 +735,7 @@ def units_check_version(directory: Path) -> None:
     Args:
         directory: Directory containing generated QUDT unit enums (default: ~/.s2dm/units/qudt)
     """
+    from s2dm.units.sync import UNITS_README_FILENAME, UNITS_README_VERSION_PATTERN, get_latest_qudt_version
 
     meta_path = directory / UNITS_README_FILENAME
     if not meta_path.exists():
@@ -960,6 +1003,8 @@ def _compose_schemas(
     schema_selection_resolver: Callable[[Path], DocumentNode | None] | None = None,
     merge_shared_definitions: bool = False,
 ) -> None:
+    from s2dm.ledger import Ledger
+
     try:
         ledger = Ledger.from_directory(ledger_dir) if ledger_dir is not None else None
         composed_schema_str = compose_schemas_to_string(
@@ -996,52 +1041,99 @@ def _compose_schemas(
 
 # SHACL
 # ----------
+_shacl_options = (
+    click.option(
+        "--serialization-format",
+        "-f",
+        type=str,
+        default="ttl",
+        help="RDF serialization format of the output file",
+        show_default=True,
+    ),
+    click.option(
+        "--shapes-namespace",
+        "-sn",
+        type=str,
+        default="http://example.ns/shapes#",
+        help="The namespace for SHACL shapes",
+        show_default=True,
+    ),
+    click.option(
+        "--shapes-namespace-prefix",
+        "-snpref",
+        type=str,
+        default="shapes",
+        help="The prefix for the SHACL shapes",
+        show_default=True,
+    ),
+    click.option(
+        "--model-namespace",
+        "-mn",
+        type=str,
+        default="http://example.ns/model#",
+        help="The namespace for the data model",
+        show_default=True,
+    ),
+    click.option(
+        "--model-namespace-prefix",
+        "-mnpref",
+        type=str,
+        default="model",
+        help="The prefix for the data model",
+        show_default=True,
+    ),
+)
+
+
+def shacl_options(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Apply the serialization and namespace options shared by the SHACL exports."""
+    for option in reversed(_shacl_options):
+        func = option(func)
+    return func
+
+
+def _export_shacl(
+    schemas: list[Path],
+    output: Path,
+    selection_query: Path | None,
+    root_type: str | None,
+    naming_config: Path | None,
+    serialization_format: str,
+    shapes_namespace: str,
+    shapes_namespace_prefix: str,
+    model_namespace: str,
+    model_namespace_prefix: str,
+    expanded_instances: bool,
+) -> Path:
+    from s2dm.exporters.shacl import translate_to_shacl
+
+    annotated_schema, _, _ = load_and_process_schema(
+        schema_paths=schemas,
+        naming_config_path=naming_config,
+        selection_query_path=selection_query,
+        root_type=root_type,
+        expanded_instances=expanded_instances,
+    )
+    assert_correct_schema(annotated_schema.schema)
+
+    result = translate_to_shacl(
+        annotated_schema,
+        shapes_namespace,
+        shapes_namespace_prefix,
+        model_namespace,
+        model_namespace_prefix,
+    )
+    write_bytes_atomic(output, result.serialize(format=serialization_format, encoding="utf-8"))
+    return output
+
+
 @export.command
 @schema_option
 @selection_query_option()
 @output_option
 @root_type_option
 @naming_config_option
-@click.option(
-    "--serialization-format",
-    "-f",
-    type=str,
-    default="ttl",
-    help="RDF serialization format of the output file",
-    show_default=True,
-)
-@click.option(
-    "--shapes-namespace",
-    "-sn",
-    type=str,
-    default="http://example.ns/shapes#",
-    help="The namespace for SHACL shapes",
-    show_default=True,
-)
-@click.option(
-    "--shapes-namespace-prefix",
-    "-snpref",
-    type=str,
-    default="shapes",
-    help="The prefix for the SHACL shapes",
-    show_default=True,
-)
-@click.option(
-    "--model-namespace",
-    "-mn",
-    type=str,
-    default="http://example.ns/model#",
-    help="The namespace for the data model",
-    show_default=True,
-)
-@click.option(
-    "--model-namespace-prefix",
-    "-mnpref",
-    type=str,
-    default="model",
-    help="The prefix for the data model",
-    show_default=True,
-)
+@shacl_options
 @expanded_instances_option
 @handle_export_errors
 def shacl(
@@ -1058,24 +1150,113 @@ def shacl(
     expanded_instances: bool,
 ) -> None:
     """Generate SHACL shapes from a given GraphQL schema."""
-    annotated_schema, naming_config_dict, _ = load_and_process_schema(
-        schema_paths=schemas,
-        naming_config_path=naming_config,
-        selection_query_path=selection_query,
-        root_type=root_type,
-        expanded_instances=expanded_instances,
-    )
-    assert_correct_schema(annotated_schema.schema)
-
-    result = translate_to_shacl(
-        annotated_schema,
+    _export_shacl(
+        schemas,
+        output,
+        selection_query,
+        root_type,
+        naming_config,
+        serialization_format,
         shapes_namespace,
         shapes_namespace_prefix,
         model_namespace,
         model_namespace_prefix,
+        expanded_instances,
     )
-    output.parent.mkdir(parents=True, exist_ok=True)
-    _ = result.serialize(destination=output, format=serialization_format)
+
+
+@export.command(name="shacl-batch")
+@click.option(
+    "--schema",
+    "-s",
+    "schemas",
+    type=str,
+    cls=SchemaResolverOption,
+    multiple=True,
+    help="GraphQL schema file, directory, or URL shared by every batch schema. Can be specified multiple times.",
+)
+@click.option(
+    "--batch-schema",
+    "-b",
+    "batch_schemas",
+    type=str,
+    cls=SchemaResolverOption,
+    required=True,
+    multiple=True,
+    help=(
+        "GraphQL schema file, directory, or URL. Every resolved file is exported on its own, together with the "
+        "shared schemas. Can be specified multiple times."
+    ),
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    type=OUTPUT_DIR_PATH,
+    required=True,
+    help="Output directory, one file named after each batch schema file is written to it",
+)
+@root_type_option
+@naming_config_option
+@shacl_options
+@expanded_instances_option
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes, defaults to the number of CPUs",
+)
+@handle_export_errors
+def shacl_batch(
+    schemas: list[Path] | None,
+    batch_schemas: list[Path],
+    output_dir: Path,
+    root_type: str | None,
+    naming_config: Path | None,
+    serialization_format: str,
+    shapes_namespace: str,
+    shapes_namespace_prefix: str,
+    model_namespace: str,
+    model_namespace_prefix: str,
+    expanded_instances: bool,
+    jobs: int | None,
+) -> None:
+    """Generate SHACL shapes for several GraphQL schemas in parallel worker processes."""
+    outputs = {
+        batch_schema: output_dir / f"{batch_schema.stem}.{serialization_format}" for batch_schema in batch_schemas
+    }
+    if len(set(outputs.values())) != len(outputs):
+        raise ValueError("Batch schema file names must be unique, they name the output files")
+
+    failed = False
+    # Forked workers would inherit the configured logging and rich handlers, start fresh interpreters instead
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = {
+            batch_schema: executor.submit(
+                _export_shacl,
+                [*(schemas or []), batch_schema],
+                output,
+                None,
+                root_type,
+                naming_config,
+                serialization_format,
+                shapes_namespace,
+                shapes_namespace_prefix,
+                model_namespace,
+                model_namespace_prefix,
+                expanded_instances,
+            )
+            for batch_schema, output in outputs.items()
+        }
+        for batch_schema, future in futures.items():
+            try:
+                log.info(f"Wrote {future.result()}")
+            except Exception as error:
+                log.error(f"Export of {batch_schema} failed: {error}")
+                failed = True
+
+    if failed:
+        sys.exit(1)
 
 
 # Export -> yaml
@@ -1097,6 +1278,8 @@ def vspec(
     expanded_instances: bool,
 ) -> None:
     """Generate VSPEC from a given GraphQL schema."""
+    from s2dm.exporters.vspec import write_vspec
+
     annotated_schema, _, _ = load_and_process_schema(
         schema_paths=schemas,
         naming_config_path=naming_config,
@@ -1106,9 +1289,8 @@ def vspec(
     )
     assert_correct_schema(annotated_schema.schema)
 
-    result = translate_to_vspec(annotated_schema)
-    output.parent.mkdir(parents=True, exist_ok=True)
-    _ = output.write_text(result)
+    ensure_parent_dir(output)
+    write_vspec(annotated_schema, output)
 
 
 # Export -> linkml
@@ -1152,6 +1334,8 @@ def linkml(
     default_prefix_url: str,
 ) -> None:
     """Generate LinkML schema from a given GraphQL schema."""
+    from s2dm.exporters.linkml import translate_to_linkml
+
     annotated_schema, _, _ = load_and_process_schema(
         schema_paths=schemas,
         naming_config_path=naming_config,
@@ -1192,6 +1376,8 @@ def jsonschema(
     expanded_instances: bool,
 ) -> None:
     """Generate JSON Schema from a given GraphQL schema."""
+    from s2dm.exporters.jsonschema import translate_to_jsonschema
+
     annotated_schema, _, _ = load_and_process_schema(
         schema_paths=schemas,
         naming_config_path=naming_config,
@@ -1232,6 +1418,8 @@ def schema(
     expanded_instances: bool,
 ) -> None:
     """Generate Apache Avro schema from a given GraphQL schema."""
+    from s2dm.exporters.avro import translate_to_avro_schema
+
     annotated_schema, _, query_document = load_and_process_schema(
         schema_paths=schemas,
         naming_config_path=naming_config,
@@ -1251,7 +1439,7 @@ def schema(
 @click.option(
     "--output",
     "-o",
-    type=click.Path(file_okay=False, writable=True, path_type=Path),
+    type=OUTPUT_DIR_PATH,
     required=True,
     help="Output directory for .avdl files",
 )
@@ -1272,6 +1460,8 @@ def protocol(
     strict: bool,
 ) -> None:
     """Generate Avro IDL protocols for types marked with @struct directive."""
+    from s2dm.exporters.avro import translate_to_avro_protocol
+
     annotated_schema, _, _ = load_and_process_schema(
         schema_paths=schemas,
         naming_config_path=naming_config,
@@ -1326,6 +1516,8 @@ def protobuf(
     expanded_instances: bool,
 ) -> None:
     """Generate Protocol Buffers (.proto) file from GraphQL schema."""
+    from s2dm.exporters.protobuf import translate_to_protobuf
+
     annotated_schema, _, query_document = load_and_process_schema(
         schema_paths=schemas,
         naming_config_path=naming_config,
@@ -1352,7 +1544,7 @@ def protobuf(
 @click.option(
     "--output",
     "-o",
-    type=click.Path(file_okay=False, writable=True, path_type=Path),
+    type=OUTPUT_DIR_PATH,
     required=True,
     help="Output directory for RDF artifacts (skos and data_graph in selected formats)",
 )
@@ -1448,43 +1640,46 @@ def version_bump(
     - "minor": Dangerous changes detected (⚠ symbols)
     - "major": Breaking changes detected (✖ symbols)
     """
-    # Note: GraphQL Inspector expects old schema first, then new schema
-    # So we pass previous first, then schema (current)
-    previous_schema_temp_path = create_tempfile_to_composed_schema(previous)
-    inspector = GraphQLInspector(previous_schema_temp_path, node_modules_path=inspector_path)
-
-    schema_temp_path = create_tempfile_to_composed_schema(schemas)
-    diff_result = inspector.diff(schema_temp_path)
-
     # Determine version bump type based on exit code and output symbols.
     # graphql-inspector exit codes: 0 = no breaking changes, 1 = breaking changes found
     version_bump_type = None
 
-    if diff_result.returncode == 0:
-        # No breaking changes — check for dangerous (⚠) or non-breaking (✔) changes
-        if "⚠" in diff_result.output:
-            log.warning("Dangerous changes detected - minor version bump needed")
-            version_bump_type = "minor"
-        elif "✔" in diff_result.output:
-            log.success("Non-breaking changes detected - patch version bump needed")
-            version_bump_type = "patch"
-        else:
-            log.success("No changes detected - no version bump needed")
-            version_bump_type = None
-    elif diff_result.returncode == 1:
-        # Exit code 1 means breaking changes were detected
-        if "✖" in diff_result.output or "breaking change" in diff_result.output:
-            log.error("Breaking changes detected - major version bump needed")
-            version_bump_type = "major"
+    # Note: GraphQL Inspector expects old schema first, then new schema
+    # So we pass previous first, then schema (current)
+    composed_paths = _compose_schemas_for_diff(previous, schemas)
+    if composed_paths is None:
+        # Identical schemas have no changes, no need to diff them
+        log.success("No changes detected - no version bump needed")
+    else:
+        previous_schema_temp_path, schema_temp_path = composed_paths
+        inspector = GraphQLInspector(previous_schema_temp_path, node_modules_path=inspector_path)
+        diff_result = inspector.diff(schema_temp_path)
+
+        if diff_result.returncode == 0:
+            # No breaking changes — check for dangerous (⚠) or non-breaking (✔) changes
+            if "⚠" in diff_result.output:
+                log.warning("Dangerous changes detected - minor version bump needed")
+                version_bump_type = "minor"
+            elif "✔" in diff_result.output:
+                log.success("Non-breaking changes detected - patch version bump needed")
+                version_bump_type = "patch"
+            else:
+                log.success("No changes detected - no version bump needed")
+                version_bump_type = None
+        elif diff_result.returncode == 1:
+            # Exit code 1 means breaking changes were detected
+            if "✖" in diff_result.output or "breaking change" in diff_result.output:
+                log.error("Breaking changes detected - major version bump needed")
+                version_bump_type = "major"
+            else:
+                # Exit code 1 without recognizable diff output may indicate an actual error
+                log.error("Schema comparison failed with exit code 1")
+                if diff_result.output:
+                    log.error(f"graphql-inspector output: {diff_result.output}")
         else:
-            # Exit code 1 without recognizable diff output may indicate an actual error
-            log.error("Schema comparison failed with exit code 1")
+            log.error(f"Schema comparison failed with exit code {diff_result.returncode}")
             if diff_result.output:
                 log.error(f"graphql-inspector output: {diff_result.output}")
-    else:
-        log.error(f"Schema comparison failed with exit code {diff_result.returncode}")
-        if diff_result.output:
-            log.error(f"graphql-inspector output: {diff_result.output}")
 
     # Output the version bump type for pipeline usage
     if output_type:
@@ -1575,11 +1770,12 @@ def diff_graphql(
     """
     log.info(f"Comparing schemas: {schemas} and {val_schemas} and writing output to {output}")
 
+    structured_diff: list[DiffChange] = []
     # Use schema composer to create composed schemas (includes directives and all types)
-    input_temp_path = create_tempfile_to_composed_schema(schemas)
-    val_temp_path = create_tempfile_to_composed_schema(val_schemas)
+    composed_paths = _compose_schemas_for_diff(schemas, val_schemas)
+    if composed_paths is not None:
+        input_temp_path, val_temp_path = composed_paths
 
-    try:
         # Use GraphQLInspector's structured diff method
         inspector = GraphQLInspector(input_temp_path, node_modules_path=inspector_path)
         try:
@@ -1588,29 +1784,20 @@ def diff_graphql(
             log.error(f"Failed to get structured diff: {e}")
             sys.exit(2)
 
-        # Format JSON output as a direct array
-        json_output = format_json_output([change.model_dump() for change in structured_diff])
-
-        if output is not None:
-            log.info(f"writing file to {output=}")
-            output.parent.mkdir(parents=True, exist_ok=True)
-            # Write file synchronously to ensure it's on disk before exit
-            with open(output, "w", encoding="utf-8") as f:
-                f.write(json_output)
-                f.flush()
-                os.fsync(f.fileno())
-        else:
-            # If no output file specified, still print structured format
-            log.print(json_output)
+    # Format JSON output as a direct array
+    changes = [change.model_dump() for change in structured_diff]
 
-        # Exit with code 1 if breaking changes detected, 0 otherwise
-        has_breaking = any(change.criticality != "NON_BREAKING" for change in structured_diff)
-        exit_code = 1 if has_breaking else 0
-        sys.exit(exit_code)
-    finally:
-        # Clean up temporary files
-        input_temp_path.unlink(missing_ok=True)
-        val_temp_path.unlink(missing_ok=True)
+    if output is not None:
+        log.info(f"writing file to {output=}")
+        write_json_output(changes, output)
+    else:
+        # If no output file specified, still print structured format
+        log.print(format_json_output(changes))
+
+    # Exit with code 1 if breaking changes detected, 0 otherwise
+    has_breaking = any(change.criticality != "NON_BREAKING" for change in structured_diff)
+    exit_code = 1 if has_breaking else 0
+    sys.exit(exit_code)
 
 
 # registry -> concept-uri
@@ -1629,16 +1816,17 @@ def diff_graphql(
 )
 def export_concept_uri(schemas: list[Path], output: Path | None, namespace: str, prefix: str) -> None:
     """Generate concept URIs for a GraphQL schema and output as JSON-LD."""
+    from s2dm.concept.services import iter_all_concepts
+    from s2dm.registry.concept_uris import create_concept_uri_model
+
     graphql_schema = load_schema(schemas)
     concepts = iter_all_concepts(get_all_named_types(graphql_schema))
     concept_uri_model = create_concept_uri_model(concepts, namespace, prefix)
     data = concept_uri_model.to_json_ld()
 
     if output:
-        output.parent.mkdir(parents=True, exist_ok=True)
-        with open(output, "w", encoding="utf-8") as output_file:
-            log.info(f"Writing data to '{output}'")
-            json.dump(data, output_file, indent=2)
+        log.info(f"Writing data to '{output}'")
+        write_json_output(data, output)
         log.success(f"Concept URIs written to {output}")
 
     log.rule("Concept URIs (JSON-LD)")
@@ -1651,13 +1839,13 @@ def export_concept_uri(schemas: list[Path], output: Path | None, namespace: str,
 @optional_output_option
 @click.option(
     "--previous-ids",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    type=EXISTING_FILE_PATH,
     help="Path to previous ID file for comparison",
 )
 @click.option(
     "--diff-file",
     "diff_file",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    type=EXISTING_FILE_PATH,
     help="Path to structured diff JSON output from 'diff graphql' command",
 )
 @click.option(
@@ -1690,6 +1878,8 @@ def export_id(
     - diff_file: Path to structured diff JSON from 'diff graphql' command (required if previous_ids provided)
     - version-tag: Version tag/identifier for metadata (required)
     """
+    from s2dm.exporters.id import IDExporter
+
     composed_schema = load_schema(schemas)
 
     # Validate: if previous_ids is provided, diff_file must also be provided
@@ -1754,6 +1944,11 @@ def registry_init(
     This creates a spec history file with concept IDs.
     Use 'registry update' to update an existing spec history with schema changes.
     """
+    from s2dm.concept.services import iter_all_concepts
+    from s2dm.exporters.id import IDExporter
+    from s2dm.exporters.spec_history import SpecHistoryExporter
+    from s2dm.registry.concept_uris import create_concept_uri_model
+
     output = apply_version_tag_suffix(output, version_tag)
     ensure_output_parent(output)
 
@@ -1769,7 +1964,8 @@ def registry_init(
         output=variant_ids_output,
         namespace_prefix=concept_prefix,
     )
-    id_result = id_exporter.run()
+    all_named_types = get_all_named_types(composed_schema)
+    id_result = id_exporter.run(named_types=all_named_types)
 
     # Extract variant IDs dict (format: {"concept_name": "[prefix:]Concept/vN"})
     variant_ids: dict[str, str] = {}
@@ -1777,7 +1973,6 @@ def registry_init(
         variant_ids[concept_name] = variant_entry.id
 
     # Generate concept URIs
-    all_named_types = get_all_named_types(composed_schema)
     concepts = iter_all_concepts(all_named_types)
     concept_uri_model = create_concept_uri_model(concepts, concept_namespace, concept_prefix)
     concept_uris = concept_uri_model.to_json_ld()
@@ -1809,20 +2004,20 @@ def registry_init(
 @click.option(
     "--spec-history",
     "-sh",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    type=EXISTING_FILE_PATH,
     required=True,
     help="Path to the previously generated spec history file",
 )
 @click.option(
     "--previous-ids",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    type=EXISTING_FILE_PATH,
     required=True,
     help="Path to previous variant IDs file (e.g., variant_ids_v1.0.0.json)",
 )
 @click.option(
     "--diff-file",
     "diff_file",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    type=EXISTING_FILE_PATH,
     help="Path to structured diff JSON output from 'diff graphql' command",
 )
 @output_option
@@ -1857,6 +2052,11 @@ def registry_update(
     Uses graphql-inspector diff to detect changes and only increments
     variants for fields that actually changed.
     """
+    from s2dm.concept.services import iter_all_concepts
+    from s2dm.exporters.id import IDExporter
+    from s2dm.exporters.spec_history import SpecHistoryExporter
+    from s2dm.registry.concept_uris import create_concept_uri_model
+
     output = apply_version_tag_suffix(output, version_tag)
     ensure_output_parent(output)
 
@@ -1876,7 +2076,8 @@ def registry_update(
         diff_output=diff_output,
         namespace_prefix=concept_prefix,
     )
-    id_result = id_exporter.run()
+    all_named_types = get_all_named_types(composed_schema)
+    id_result = id_exporter.run(named_types=all_named_types)
 
     # Extract variant IDs dict (format: {"concept_name": "[prefix:]Concept/vN"})
     variant_ids: dict[str, str] = {}
@@ -1884,7 +2085,6 @@ def registry_update(
         variant_ids[concept_name] = variant_entry.id
 
     # Generate concept URIs
-    all_named_types = get_all_named_types(composed_schema)
     concepts = iter_all_concepts(all_named_types)
     concept_uri_model = create_concept_uri_model(concepts, concept_namespace, concept_prefix)
     concept_uris = concept_uri_model.to_json_ld()
@@ -2004,7 +2204,7 @@ def display_search_results(
 @click.option(
     "--ttl-file",
     "-f",
-    type=click.Path(exists=True, path_type=Path),
+    type=EXISTING_PATH,
     required=True,
     help="Path to the TTL/RDF file containing SKOS concepts",
 )
@@ -2083,7 +2283,7 @@ def search_skos(ttl_file: Path, term: str, case_insensitive: bool, limit: str) -
 @click.option(
     "--output",
     "-o",
-    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    type=OUTPUT_FILE_PATH,
     required=False,
     help="Output file, only .json allowed here",
 )
@@ -2113,37 +2313,14 @@ def stats_graphql(schemas: list[Path]) -> None:
     """Get stats of schema."""
     gql_schema = load_schema(schemas)
 
-    # Count types by kind
-    type_map = gql_schema.type_map
-    type_counts: dict[str, Any] = {
-        "object": 0,
-        "enum": 0,
-        "scalar": 0,
-        "interface": 0,
-        "union": 0,
-        "input_object": 0,
-        "custom_types": {},
+    # Count types by kind, skipping introspection types such as __Schema and __Type
+    named_types = [t for name, t in gql_schema.type_map.items() if name[:2] != "__"]
+    kind_counts = Counter(map(type, named_types))
+    type_counts: dict[str, Any] = {label: kind_counts[kind] for kind, label in TYPE_KIND_LABELS.items()}
+    # Detect custom types e.g. (not built-in scalars)
+    type_counts["custom_types"] = {
+        t.name: 1 for t in named_types if type(t) is GraphQLScalarType and t.name not in BUILTIN_SCALAR_TYPES
     }
-    for t in type_map.values():
-        name = getattr(t, "name", "")
-        if is_introspection_type(name):
-            continue
-        kind = type(t).__name__
-        if kind == "GraphQLObjectType":
-            type_counts["object"] += 1
-        elif kind == "GraphQLEnumType":
-            type_counts["enum"] += 1
-        elif kind == "GraphQLScalarType":
-            type_counts["scalar"] += 1
-        elif kind == "GraphQLInterfaceType":
-            type_counts["interface"] += 1
-        elif kind == "GraphQLUnionType":
-            type_counts["union"] += 1
-        elif kind == "GraphQLInputObjectType":
-            type_counts["input_object"] += 1
-        # Detect custom types e.g. (not built-in scalars)
-        if kind == "GraphQLScalarType" and not is_builtin_scalar_type(name):
-            type_counts["custom_types"][name] = type_counts["custom_types"].get(name, 0) + 1
 
     log.rule("GraphQL Schema Type Counts")
     log.print_dict(type_counts)
@@ -2192,7 +2369,7 @@ def insights_quality(schemas: list[Path]) -> None:
     "--output",
     "-o",
     required=True,
-    type=click.Path(path_type=Path, dir_okay=False),
+    type=FILE_PATH,
     help="Write the full insight result bundle to this JSON file.",
 )
 def insights_export(schemas: list[Path], output: Path) -> None:
@@ -2204,8 +2381,7 @@ def insights_export(schemas: list[Path], output: Path) -> None:
         coverage=compute_coverage(graphql_schema),
         quality=compute_quality_issues(graphql_schema),
     )
-    output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(bundle.model_dump_json(indent=2) + "\n")
+    write_bytes_atomic(output, bundle.model_dump_json(indent=2).encode("utf-8") + b"\n")
     log.success(f"Insights written to {output}")
 
 
@@ -2263,8 +2439,7 @@ def _output_results(
         output: Optional file path to write JSON results to.
     """
     if output is not None:
-        output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text(format_json_output(results), encoding="utf-8")
+        write_json_output(results, output)
         log.success(f"Query results written to {output}")
         return
 
@@ -8,18 +8,18 @@ For spec history models (Concept URI, Spec History, Concept ID), see
 s2dm.registry.* modules.
 """
 
-from collections import defaultdict
 from dataclasses import dataclass, field
+from typing import NamedTuple
 
 from graphql import GraphQLField
-from typing_extensions import TypedDict
 
 
-class FieldMetadata(TypedDict):
+class FieldMetadata(NamedTuple):
     """Metadata for a GraphQL field in the concepts extraction.
 
     This provides structured access to GraphQL field information without
-    requiring string parsing, ensuring type safety and consistency.
+    requiring string parsing, ensuring type safety and consistency. A record is
+    created per leaf field, so it is a compact tuple rather than a dict.
     """
 
     object_name: str  # The GraphQL object type name (e.g., "Vehicle")
@@ -41,7 +41,7 @@ class Concepts:
 
     fields: list[str] = field(default_factory=list)
     enums: list[str] = field(default_factory=list)
-    objects: dict[str, list[str]] = field(default_factory=lambda: defaultdict(list))
+    objects: dict[str, list[str]] = field(default_factory=dict)
     nested_objects: dict[str, str] = field(default_factory=dict)
     # Enhanced metadata for advanced functionality (SKOS generation, etc.)
     field_metadata: dict[str, FieldMetadata] = field(default_factory=dict)
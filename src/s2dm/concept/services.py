@@ -5,7 +5,6 @@ from graphql import (
     GraphQLObjectType,
     GraphQLScalarType,
     get_named_type,
-    is_scalar_type,
 )
 
 from s2dm import log
@@ -32,43 +31,40 @@ def iter_all_concepts(named_types: list[GraphQLNamedType]) -> Concepts:
             continue
 
         if isinstance(named_type, GraphQLEnumType):
-            log.debug(f"Processing enum: {named_type.name}")
+            log.debug("Processing enum: %s", named_type.name)
             concepts.enums.append(named_type.name)
 
         elif isinstance(named_type, GraphQLObjectType):
-            log.debug(f"Processing object: {named_type.name}")
+            log.debug("Processing object: %s", named_type.name)
+            object_name = named_type.name
+            object_fields: list[str] = []
+            nested_objects = concepts.nested_objects
             # Get the ID of all fields in the object
             for field_name, field in named_type.fields.items():
+                # The named type is also what list types unwrap to, so it is looked up only once
+                field_type = field.type
+                named_field_type = get_named_type(field_type)
                 # Check if field's type is ID scalar - skip ID fields
-                field_type = get_named_type(field.type)
-                if (
-                    is_scalar_type(field_type)
-                    and isinstance(field_type, GraphQLScalarType)
-                    and is_id_type(field_type.name)
-                ):
+                if isinstance(named_field_type, GraphQLScalarType) and is_id_type(named_field_type.name):
                     continue
 
-                field_fqn = f"{named_type.name}.{field_name}"
+                field_fqn = f"{object_name}.{field_name}"
 
-                if isinstance(field.type, GraphQLObjectType):
+                if isinstance(field_type, GraphQLObjectType):
                     # field uses the object type
-                    concepts.nested_objects[field_fqn] = field.type.name
-                elif isinstance(field.type, GraphQLList):
+                    nested_objects[field_fqn] = field_type.name
+                elif isinstance(field_type, GraphQLList):
                     # field uses a list of the object type
-                    internal_type = field.type
-                    while hasattr(internal_type, "of_type"):
-                        internal_type = internal_type.of_type
-                    # Get the name from the internal type if it has one
-                    internal_type_name = getattr(internal_type, "name", None)
-                    if internal_type_name:
-                        concepts.nested_objects[field_fqn] = internal_type_name
+                    nested_objects[field_fqn] = named_field_type.name
                 else:
                     # field uses a scalar type or enum type
-                    concepts.objects[named_type.name].append(field_fqn)
-                    concepts.fields.append(field_fqn)
+                    object_fields.append(field_fqn)
                     # Enhanced metadata for advanced functionality (SKOS generation, etc.)
-                    concepts.field_metadata[field_fqn] = FieldMetadata(
-                        object_name=named_type.name, field_name=field_name, field_definition=field
-                    )
+                    concepts.field_metadata[field_fqn] = FieldMetadata(object_name, field_name, field)
+
+            # Fields of an object are contiguous, so they are grouped locally and stored once
+            if object_fields:
+                concepts.objects[object_name] = object_fields
+                concepts.fields.extend(object_fields)
 
     return concepts
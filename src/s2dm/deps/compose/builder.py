@@ -171,8 +171,7 @@ class DependencySchemaBuilder:
         seen_type_names: set[str] = set()
         duplicate_type_names: set[str] = set()
         for schema_document in schema_documents:
-            for type_name in schema_document.defined_type_names:
-                if type_name in seen_type_names:
-                    duplicate_type_names.add(type_name)
-                seen_type_names.add(type_name)
+            # Names are unique within a document, so duplicates are the overlap with earlier documents
+            duplicate_type_names |= seen_type_names & schema_document.defined_type_names
+            seen_type_names |= schema_document.defined_type_names
         return duplicate_type_names
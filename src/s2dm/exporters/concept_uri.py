@@ -6,6 +6,7 @@ from s2dm.concept.services import iter_all_concepts
 from s2dm.exporters.utils.extraction import get_all_named_types
 from s2dm.exporters.utils.schema_loader import load_schema
 from s2dm.registry.concept_uris import create_concept_uri_model
+from s2dm.utils.json_output import write_json_output
 
 
 def process_schema(
@@ -38,9 +39,8 @@ def process_schema(
 
     # Output options
     if output:
-        with open(output, "w", encoding="utf-8") as output_file:
-            log.info(f"Writing data to '{output}'")
-            json.dump(concept_uri_model.to_json_ld(), output_file, indent=2)
+        log.info(f"Writing data to '{output}'")
+        write_json_output(concept_uri_model.to_json_ld(), output)
     else:
         print("-" * 80)
         print(json.dumps(concept_uri_model.to_json_ld(), indent=2))
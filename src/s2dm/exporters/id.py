@@ -5,8 +5,10 @@ This module generates unique identifiers for schema elements in the format
 when a concept's specification changes according to graphql-inspector diff.
 """
 
+import functools
 import json
-from collections.abc import Generator
+from collections import defaultdict
+from collections.abc import Generator, Iterable
 from pathlib import Path
 
 from graphql import (
@@ -16,12 +18,10 @@ from graphql import (
     GraphQLScalarType,
     GraphQLSchema,
     get_named_type,
-    is_scalar_type,
 )
 
 from s2dm import log
-from s2dm.exporters.utils.extraction import get_all_named_types
-from s2dm.exporters.utils.graphql_type import is_id_type, is_introspection_or_root_type
+from s2dm.exporters.utils.graphql_type import ROOT_TYPES, is_id_type
 from s2dm.registry.variant_ids import VariantEntry, VariantIDFile
 from s2dm.tools.diff_parser import DiffChange
 
@@ -76,43 +76,17 @@ class IDExporter:
         self.version_tag = version_tag
         self.namespace_prefix = namespace_prefix
 
-    def iter_all_concept_names(self, named_types: list[GraphQLNamedType]) -> Generator[str, None, None]:
+    def iter_all_concept_names(self, named_types: Iterable[GraphQLNamedType]) -> Generator[str, None, None]:
         """Iterate over all concept names for enums, object types, and object fields.
 
         Args:
-            named_types: List of GraphQL named types to process
+            named_types: GraphQL named types to process
 
         Yields:
             Concept names (e.g., "Vehicle", "Vehicle.averageSpeed", "WarningTypeEnum")
         """
-        # Process enums, object types, and their fields
-        for named_type in named_types:
-            if is_introspection_or_root_type(named_type.name):
-                continue
-
-            if isinstance(named_type, GraphQLEnumType):
-                log.debug(f"Processing enum: {named_type.name}")
-                yield named_type.name
-
-            elif isinstance(named_type, GraphQLObjectType):
-                log.debug(f"Processing object: {named_type.name}")
-                # Yield the object type itself
-                yield named_type.name
-                # Get the ID of all fields in the object
-                for field_name, field in named_type.fields.items():
-                    # Check if field's type is ID scalar - skip ID fields
-                    field_type = get_named_type(field.type)
-                    if (
-                        is_scalar_type(field_type)
-                        and isinstance(field_type, GraphQLScalarType)
-                        and is_id_type(field_type.name)
-                    ):
-                        continue
-
-                    # Check if it's a leaf field (not an object type)
-                    if not isinstance(field_type, GraphQLObjectType):
-                        concept_name = f"{named_type.name}.{field_name}"
-                        yield concept_name
+        concept_names, _ = self._index_schema(named_types)
+        yield from concept_names
 
     def get_fields_using_enum(self, enum_name: str) -> set[str]:
         """Find all fields in the schema that use a specific enum type.
@@ -123,31 +97,102 @@ class IDExporter:
         Returns:
             Set of field paths (e.g., "Vehicle.warningType") that use this enum
         """
-        fields_using_enum: set[str] = set()
-        enum_type = self.schema.type_map.get(enum_name)
+        return set(self._fields_by_enum.get(enum_name, ()))
+
+    @functools.cached_property
+    def _fields_by_enum(self) -> dict[str, set[str]]:
+        """Map each enum name to the object fields returning it or taking it as an argument."""
+        _, fields_by_enum = self._index_schema(self.schema.type_map.values())
+        return fields_by_enum
+
+    def _index_schema(self, named_types: Iterable[GraphQLNamedType]) -> tuple[list[str], dict[str, set[str]]]:
+        """Collect concept names and enum usages in a single pass over the named types.
+
+        Introspection types are skipped, so the schema's type map can be passed in as-is.
 
-        if not isinstance(enum_type, GraphQLEnumType):
-            return fields_using_enum
+        Args:
+            named_types: GraphQL named types to process
+
+        Returns:
+            Tuple of the ordered concept names and a mapping of enum names to the object fields
+            returning that enum or taking it as an argument
+        """
+        concept_names: list[str] = []
+        fields_by_enum: dict[str, set[str]] = defaultdict(set)
+        # Bound once, both are called for most named types and fields
+        add_concept = concept_names.append
+        debug = log.debug
 
-        # Iterate through all object types and their fields
-        for type_name, type_obj in self.schema.type_map.items():
-            if not isinstance(type_obj, GraphQLObjectType):
+        for named_type in named_types:
+            # Inlined is_introspection_or_root_type, which is called once per named type otherwise
+            type_name = named_type.name
+            if type_name.startswith("__"):
                 continue
+            is_concept = type_name not in ROOT_TYPES
+
+            # Object types far outnumber enums, so they are tested first
+            if isinstance(named_type, GraphQLObjectType):
+                if is_concept:
+                    debug("Processing object: %s", type_name)
+                    add_concept(type_name)
 
-            for field_name, field in type_obj.fields.items():
-                # Check if field's return type is the enum
-                field_type = get_named_type(field.type)
-                if isinstance(field_type, GraphQLEnumType) and field_type.name == enum_name:
-                    fields_using_enum.add(f"{type_name}.{field_name}")
+                for field_name, field in named_type.fields.items():
+                    field_path = f"{type_name}.{field_name}"
+                    field_type = get_named_type(field.type)
+
+                    # Track enum usages on every object type, root types included; for arguments,
+                    # we still track the field itself
+                    if isinstance(field_type, GraphQLEnumType):
+                        fields_by_enum[field_type.name].add(field_path)
+                    for arg in field.args.values():
+                        arg_type = get_named_type(arg.type)
+                        if isinstance(arg_type, GraphQLEnumType):
+                            fields_by_enum[arg_type.name].add(field_path)
+
+                    # ID fields and fields referencing other object types are not concepts
+                    if (
+                        is_concept
+                        and not (isinstance(field_type, GraphQLScalarType) and is_id_type(field_type.name))
+                        and not isinstance(field_type, GraphQLObjectType)
+                    ):
+                        add_concept(field_path)
 
-                # Check if any field arguments use the enum
-                for arg in field.args.values():
-                    arg_type = get_named_type(arg.type)
-                    if isinstance(arg_type, GraphQLEnumType) and arg_type.name == enum_name:
-                        # For arguments, we still track the field itself
-                        fields_using_enum.add(f"{type_name}.{field_name}")
+            elif isinstance(named_type, GraphQLEnumType):
+                if is_concept:
+                    debug("Processing enum: %s", type_name)
+                    add_concept(type_name)
 
-        return fields_using_enum
+        return concept_names, fields_by_enum
+
+    def _carry_over_previous_ids(
+        self, concept_names: list[str], previous_ids: VariantIDFile
+    ) -> dict[str, VariantEntry] | None:
+        """Reuse the previous entries when regenerating them would yield the same entries.
+
+        That is the case when the schema has exactly the previously known concepts, none of them
+        marked as removed, and every previous ID already carries the current namespace prefix.
+
+        Args:
+            concept_names: Concept names of the current schema
+            previous_ids: VariantIDFile instance with previous variant IDs
+
+        Returns:
+            The previous entries in schema order, or None if any of them would have to change
+        """
+        previous_concepts = previous_ids.concepts
+        if len(concept_names) != len(previous_concepts) or previous_concepts.keys() != set(concept_names):
+            return None
+
+        prefix = f"{self.namespace_prefix}:" if self.namespace_prefix else ""
+        concepts: dict[str, VariantEntry] = {}
+        for concept_name in concept_names:
+            previous_entry = previous_concepts[concept_name]
+            if previous_entry.removed_in_version is not None or not previous_entry.id.startswith(
+                f"{prefix}{concept_name}/v"
+            ):
+                return None
+            concepts[concept_name] = previous_entry
+        return concepts
 
     def increment_semantic_version(
         self,
@@ -165,11 +210,11 @@ class IDExporter:
         Returns:
             Tuple of (major, minor) version numbers
         """
-        if previous_ids is None or concept_name not in previous_ids.concepts:
+        previous_entry = previous_ids.concepts.get(concept_name) if previous_ids is not None else None
+        if previous_entry is None:
             # New concept - start at v1.0
             return (1, 0)
 
-        previous_entry = previous_ids.concepts[concept_name]
         major, minor = previous_entry.variant
 
         # Increment based on change type
@@ -198,9 +243,13 @@ class IDExporter:
             return f"{self.namespace_prefix}:{base}"
         return base
 
-    def run(self) -> VariantIDFile:
+    def run(self, named_types: Iterable[GraphQLNamedType] | None = None) -> VariantIDFile:
         """Generate variant-based IDs for GraphQL schema fields and enums.
 
+        Args:
+            named_types: Named types of the schema, e.g. as returned by ``get_all_named_types``.
+                Defaults to the values of the schema's type map, walked without copying them into a list.
+
         Returns:
             VariantIDFile instance with metadata and concepts
         """
@@ -219,70 +268,80 @@ class IDExporter:
         # Collect all changed concepts from diff output with their breaking status
         # Using a dict ensures that each concept appears only once, regardless of
         # how many changes affect it (e.g., multiple enum values added = one increment).
+        # Walk the schema once for both the concept names and the enum usages needed by the diff
+        all_named_types = named_types if named_types is not None else self.schema.type_map.values()
+        concept_names, fields_by_enum = self._index_schema(all_named_types)
+
+        # Without any diff changes, an unchanged set of concepts keeps every previous entry as-is
+        if not self.diff_output and previous_ids is not None:
+            carried_over = self._carry_over_previous_ids(concept_names, previous_ids)
+            if carried_over is not None:
+                log.info(f"No changes since previous IDs, keeping all {len(carried_over)} concepts unchanged")
+                return self._build_result(carried_over)
+
         changed_concepts: dict[str, bool] = {}  # concept_name -> is_breaking
         if self.diff_output:
             # Extract changed concepts directly from diff
             # Note: The Node.js script always sets concept_name (initialized from path,
             # or set to typeName for enum changes), so we can use it directly.
+            type_map = self.schema.type_map
+            is_breaking_change = self.is_breaking_change
+            changed_enums: dict[str, bool] = {}  # enum_name -> is_breaking
             for change in self.diff_output:
                 concept_name = change.concept_name
                 if concept_name:
-                    is_breaking = self.is_breaking_change(change.criticality)
+                    is_breaking = is_breaking_change(change.criticality)
                     # Track whether concept has any breaking changes
                     # Multiple changes to the same concept are deduplicated here
-                    if concept_name not in changed_concepts:
-                        changed_concepts[concept_name] = is_breaking
-                    else:
-                        # Update to breaking if any change is breaking
-                        changed_concepts[concept_name] = changed_concepts[concept_name] or is_breaking
+                    changed_concepts[concept_name] = changed_concepts.get(concept_name, False) or is_breaking
 
                     # If this is a field change (contains a dot), also mark the parent object type as changed
-                    if "." in concept_name:
-                        parent_type_name = concept_name.split(".")[0]
-                        if parent_type_name not in changed_concepts:
-                            changed_concepts[parent_type_name] = is_breaking
-                        else:
-                            # Update to breaking if any change is breaking
-                            changed_concepts[parent_type_name] = changed_concepts[parent_type_name] or is_breaking
+                    parent_type_name, is_field, _ = concept_name.partition(".")
+                    if is_field:
+                        changed_concepts[parent_type_name] = (
+                            changed_concepts.get(parent_type_name, False) or is_breaking
+                        )
                         log.debug(
-                            f"Field {concept_name} changed ({change.type}), "
-                            f"also marking parent type {parent_type_name} as changed"
+                            "Field %s changed (%s), also marking parent type %s as changed",
+                            concept_name,
+                            change.type,
+                            parent_type_name,
                         )
 
-                    # If this is an enum change, find all fields using this enum
+                    # If this is an enum change, remember it to mark all fields using this enum below
                     # The Node.js script sets concept_name to the enum name for enum changes
-                    concept_type = self.schema.type_map.get(concept_name)
-                    if isinstance(concept_type, GraphQLEnumType):
-                        fields_using_enum = self.get_fields_using_enum(concept_name)
-                        for field_name in fields_using_enum:
-                            if field_name not in changed_concepts:
-                                changed_concepts[field_name] = is_breaking
-                            else:
-                                # Update to breaking if any change is breaking
-                                changed_concepts[field_name] = changed_concepts[field_name] or is_breaking
-                        if fields_using_enum:
-                            log.debug(f"Enum {concept_name} changed, affecting fields: {sorted(fields_using_enum)}")
+                    if isinstance(type_map.get(concept_name), GraphQLEnumType):
+                        changed_enums[concept_name] = changed_enums.get(concept_name, False) or is_breaking
+
+            # Expand each changed enum once, however many of its values changed
+            for enum_name, is_breaking in changed_enums.items():
+                fields_using_enum = fields_by_enum.get(enum_name, ())
+                for field_name in fields_using_enum:
+                    changed_concepts[field_name] = changed_concepts.get(field_name, False) or is_breaking
+                if fields_using_enum:
+                    log.debug("Enum %s changed, affecting fields: %s", enum_name, sorted(fields_using_enum))
 
             log.info(f"Found {len(changed_concepts)} changed concepts that will get variant increments")
 
         # Generate IDs for all concepts in current schema
-        all_named_types = get_all_named_types(schema=self.schema)
+        # IDs are formatted inline rather than through generate_variant_id, with the prefix resolved once
+        id_prefix = f"{self.namespace_prefix}:" if self.namespace_prefix else ""
         concepts: dict[str, VariantEntry] = {}
+        previous_concepts = previous_ids.concepts if previous_ids else {}
+        increment_semantic_version = self.increment_semantic_version
 
-        for concept_name in self.iter_all_concept_names(named_types=all_named_types):
+        for concept_name in concept_names:
+            previous_entry = previous_concepts.get(concept_name)
             # Determine semantic version: increment if changed, keep if unchanged, start at v1.0 if new
-            if concept_name in changed_concepts:
-                is_breaking = changed_concepts[concept_name]
-                major, minor = self.increment_semantic_version(concept_name, previous_ids, is_breaking)
+            # The breaking flags are booleans, so None marks an unchanged concept
+            is_breaking = changed_concepts.get(concept_name)
+            if is_breaking is not None:
+                major, minor = increment_semantic_version(concept_name, previous_ids, is_breaking)
                 # Increment variant_counter for this concept by exactly 1
                 # Note: Even if multiple changes affect this concept, changed_concepts
                 # deduplicates them, so this increments only once per update.
-                if previous_ids and concept_name in previous_ids.concepts:
-                    variant_counter = previous_ids.concepts[concept_name].variant_counter + 1
-                else:
-                    variant_counter = 1
-            elif previous_ids and concept_name in previous_ids.concepts:
-                previous_entry = previous_ids.concepts[concept_name]
+                variant_counter = previous_entry.variant_counter + 1 if previous_entry is not None else 1
+            elif previous_entry is not None:
                 major, minor = previous_entry.variant
                 variant_counter = previous_entry.variant_counter
             else:
@@ -290,18 +349,22 @@ class IDExporter:
                 major, minor = (1, 0)
                 variant_counter = 1
 
+            variant_id = f"{id_prefix}{concept_name}/v{major}.{minor}"
             concepts[concept_name] = VariantEntry(
-                id=self.generate_variant_id(concept_name, major, minor),
+                id=variant_id,
                 variant_counter=variant_counter,
                 removed_in_version=None,
             )
 
-            log.debug(f"Concept: {concept_name} -> {concepts[concept_name].id} (counter: {variant_counter})")
+            log.debug("Concept: %s -> %s (counter: %d)", concept_name, variant_id, variant_counter)
 
         # Add removed concepts that are no longer in schema
-        if previous_ids:
-            for concept_name, previous_entry in previous_ids.concepts.items():
-                if concept_name not in concepts:
+        # The key set difference is computed in C and is usually empty; the previous concepts are only
+        # walked, in their original order, when something was actually removed
+        removed_names = previous_concepts.keys() - concepts.keys()
+        if removed_names:
+            for concept_name, previous_entry in previous_concepts.items():
+                if concept_name in removed_names:
                     removed_version = (
                         previous_entry.removed_in_version
                         if previous_entry.removed_in_version is not None
@@ -309,12 +372,22 @@ class IDExporter:
                     )
                     major, minor = previous_entry.variant
                     concepts[concept_name] = VariantEntry(
-                        id=self.generate_variant_id(concept_name, major, minor),
+                        id=f"{id_prefix}{concept_name}/v{major}.{minor}",
                         variant_counter=previous_entry.variant_counter,
                         removed_in_version=removed_version,
                     )
 
-        # Build result with metadata
+        return self._build_result(concepts)
+
+    def _build_result(self, concepts: dict[str, VariantEntry]) -> VariantIDFile:
+        """Wrap the concepts in a VariantIDFile and write it to the output file, if any.
+
+        Args:
+            concepts: Variant ID entries keyed by concept name
+
+        Returns:
+            VariantIDFile instance with metadata and concepts
+        """
         result = VariantIDFile(
             version_tag=self.version_tag,
             concepts=concepts,
@@ -1,3 +1,4 @@
+import logging
 from dataclasses import dataclass
 from typing import cast
 
@@ -192,7 +193,8 @@ def process_field(
     annotated_schema: AnnotatedSchema,
 ) -> None:
     """Process a field of a GraphQL object type and generate the corresponding SHACL triples."""
-    log.debug(f"Processing field... '{print_field_sdl(field)}'")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Processing field... '%s'", print_field_sdl(field))
     field_case = get_field_case_extended(field)
     log.debug(f"Field case: {field_case}")
     if field_case not in SUPPORTED_FIELD_CASES:
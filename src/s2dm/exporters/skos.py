@@ -160,7 +160,7 @@ def collect_skos_concepts(
         # Get typed field metadata
         if field_fqn in concepts.field_metadata:
             metadata: FieldMetadata = concepts.field_metadata[field_fqn]
-            field_def = metadata["field_definition"]
+            field_def = metadata.field_definition
 
             # Create concept directly from GraphQL field definition
             concept = SKOSConcept(
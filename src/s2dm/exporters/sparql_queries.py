@@ -13,8 +13,10 @@ Multiple RDF files (or directories) can be loaded and merged with
 :func:`load_rdf_graphs`.
 """
 
+import functools
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
 from rdflib import Graph
@@ -24,6 +26,9 @@ from s2dm.exporters.rdf_materializer import FORMAT_REGISTRY
 from s2dm.exporters.utils.schema_loader import resolve_files_by_extensions
 from s2dm.utils.download import download_url_to_temp
 
+if TYPE_CHECKING:
+    from rdflib.plugins.sparql.sparql import Query
+
 log = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -206,12 +211,32 @@ def load_rdf_graphs(paths: list[Path]) -> Graph:
 # ---------------------------------------------------------------------------
 
 
-def _execute_sparql(graph: Graph, sparql: str) -> list[dict[str, str]]:
-    """Execute a raw SPARQL SELECT string against *graph*.
+@functools.cache
+def _prepared_query(query_name: str) -> "Query":
+    """Parse and translate a predefined query once per process.
+
+    Args:
+        query_name: Key in the QUERIES registry.
+
+    Returns:
+        The prepared query, reusable against any graph.
+
+    Raises:
+        KeyError: If *query_name* is not in the registry.
+    """
+    # Importing the SPARQL plugin builds its grammar, so the CLI only pays for it when running a query
+    from rdflib.plugins.sparql import prepareQuery
+
+    _, sparql = QUERIES[query_name]
+    return prepareQuery(sparql)
+
+
+def _execute_sparql(graph: Graph, sparql: "str | Query") -> list[dict[str, str]]:
+    """Execute a raw or prepared SPARQL SELECT query against *graph*.
 
     Args:
         graph: The rdflib Graph to query.
-        sparql: SPARQL SELECT query string.
+        sparql: SPARQL SELECT query string, or a query prepared with ``prepareQuery``.
 
     Returns:
         List of result rows, each a dict mapping variable name to string value.
@@ -238,8 +263,7 @@ def run_query(graph: Graph, query_name: str) -> list[dict[str, str]]:
     Raises:
         KeyError: If *query_name* is not in the registry.
     """
-    _, sparql = QUERIES[query_name]
-    return _execute_sparql(graph, sparql)
+    return _execute_sparql(graph, _prepared_query(query_name))
 
 
 def run_query_from_file(graph: Graph, path: Path) -> list[dict[str, str]]:
@@ -24,6 +24,11 @@ from s2dm.constants.directive import BuiltInDirective
 
 GRAPHQL_TYPE_DEFINITION_PATTERN = r"^(type|interface|input|enum|union|scalar)\s+(\w+)"
 
+# Compiled once: add_directives_to_schema matches these against every line of the schema
+_TYPE_DEFINITION_RE = re.compile(GRAPHQL_TYPE_DEFINITION_PATTERN)
+_FIELD_DEFINITION_RE = re.compile(r"^\s+(\w+)(?:\([^)]*\))?\s*:\s*")
+_ENUM_VALUE_DEFINITION_RE = re.compile(r"^\s+(\w+)\s*$")
+
 DirectiveElement = (
     GraphQLField
     | GraphQLInputField
@@ -254,7 +259,7 @@ def add_directives_to_schema(schema_str: str, directive_map: dict[str | tuple[st
     current_type = None
 
     for line in lines:
-        type_match = re.match(GRAPHQL_TYPE_DEFINITION_PATTERN, line)
+        type_match = _TYPE_DEFINITION_RE.match(line)
         if type_match:
             type_kind = type_match.group(1)
             type_name = type_match.group(2)
@@ -270,14 +275,14 @@ def add_directives_to_schema(schema_str: str, directive_map: dict[str | tuple[st
                     line = line.replace(f"{type_kind} {type_name}", f"{type_kind} {type_name}{directives_str}")
 
         elif current_type:
-            field_match = re.match(r"^\s+(\w+)(?:\([^)]*\))?\s*:\s*", line)
+            field_match = _FIELD_DEFINITION_RE.match(line)
             if field_match:
                 field_name = field_match.group(1)
                 if current_type and (current_type, field_name) in directive_map:
                     directives_str = " " + " ".join(directive_map[(current_type, field_name)])
                     line = line.rstrip() + directives_str
 
-            enum_match = re.match(r"^\s+(\w+)\s*$", line)
+            enum_match = _ENUM_VALUE_DEFINITION_RE.match(line)
             if enum_match:
                 enum_value_name = enum_match.group(1)
                 if current_type and (current_type, enum_value_name) in directive_map:
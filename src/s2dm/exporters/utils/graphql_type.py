@@ -1,13 +1,13 @@
+ROOT_TYPES = frozenset({"Query", "Mutation", "Subscription"})
+BUILTIN_SCALAR_TYPES = frozenset({"ID", "String", "Int", "Float", "Boolean"})
+
+
 def is_introspection_type(type_name: str) -> bool:
     return type_name.startswith("__")
 
 
 def is_root_type(type_name: str) -> bool:
-    return type_name in {
-        "Query",
-        "Mutation",
-        "Subscription",
-    }
+    return type_name in ROOT_TYPES
 
 
 def is_introspection_or_root_type(type_name: str) -> bool:
@@ -19,13 +19,7 @@ def is_id_type(type_name: str) -> bool:
 
 
 def is_builtin_scalar_type(type_name: str) -> bool:
-    return type_name in {
-        "ID",
-        "String",
-        "Int",
-        "Float",
-        "Boolean",
-    }
+    return type_name in BUILTIN_SCALAR_TYPES
 
 
 def is_graphql_system_type(type_name: str) -> bool:
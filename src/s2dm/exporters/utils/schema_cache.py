@@ -0,0 +1,87 @@
+"""On-disk cache of parsed GraphQL schema documents.
+
+Entries are pickled ASTs, and unpickling a file can run arbitrary code. The cache directory is
+therefore created readable and writable by the current user only (mode 0o700); do not point
+``SCHEMA_CACHE_DIR`` at a directory other users can write to.
+"""
+
+import contextlib
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+import graphql
+from graphql import DocumentNode, GraphQLSchema, build_ast_schema, build_schema, parse
+
+from s2dm import log
+
+SCHEMA_CACHE_DIR = Path.home() / ".cache" / "s2dm" / "schema"
+# Smaller schemas parse in a few milliseconds, which is cheaper than a round trip through the cache.
+SCHEMA_CACHE_MIN_SIZE = 64 * 1024
+SCHEMA_CACHE_MAX_ENTRIES = 32
+
+
+def _cache_path(schema_str: str) -> Path:
+    digest = hashlib.blake2b(schema_str.encode("utf-8"), digest_size=20)
+    # Pickled ASTs are only valid for the graphql-core version that produced them.
+    digest.update(graphql.__version__.encode("ascii"))
+    return SCHEMA_CACHE_DIR / f"{digest.hexdigest()}.pickle"
+
+
+def _read_document(cache_path: Path) -> DocumentNode | None:
+    try:
+        document = pickle.loads(cache_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as error:
+        log.debug("Ignoring unreadable schema cache entry %s: %s", cache_path, error)
+        return None
+    return document if isinstance(document, DocumentNode) else None
+
+
+def _write_document(cache_path: Path, document: DocumentNode) -> None:
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_path.parent, suffix=".tmp", delete=False) as temp_file:
+            pickle.dump(document, temp_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file.name, cache_path)
+        _prune(cache_path.parent)
+    except OSError as error:
+        log.debug("Could not write schema cache entry %s: %s", cache_path, error)
+
+
+def _prune(cache_dir: Path) -> None:
+    entries = sorted(cache_dir.glob("*.pickle"), key=lambda entry: entry.stat().st_mtime_ns, reverse=True)
+    for stale_entry in entries[SCHEMA_CACHE_MAX_ENTRIES:]:
+        stale_entry.unlink(missing_ok=True)
+
+
+def build_schema_cached(schema_str: str) -> GraphQLSchema:
+    """Build a GraphQL schema from SDL, reusing the parsed document of a previous run if possible.
+
+    Only documents of SDL that built successfully are cached, so a cache hit skips both parsing and
+    SDL validation. Cached documents carry no source locations; they are never needed because a
+    valid SDL produces no schema errors that would point into it.
+
+    Args:
+        schema_str: GraphQL SDL to build
+
+    Returns:
+        The built GraphQL schema
+    """
+    if len(schema_str) < SCHEMA_CACHE_MIN_SIZE:
+        return build_schema(schema_str)
+
+    cache_path = _cache_path(schema_str)
+    document = _read_document(cache_path)
+    if document is not None:
+        # Another process may prune the entry right after it was read
+        with contextlib.suppress(OSError):
+            os.utime(cache_path)
+        return build_ast_schema(document, assume_valid_sdl=True)
+
+    schema = build_schema(schema_str)
+    _write_document(cache_path, parse(schema_str, no_location=True))
+    return schema
@@ -1,4 +1,8 @@
+import atexit
+import functools
+import logging
 import re
+import stat
 import tempfile
 from collections.abc import Callable
 from pathlib import Path
@@ -53,12 +57,16 @@ from s2dm.exporters.utils.graphql_type import is_introspection_or_root_type, is_
 from s2dm.exporters.utils.instance_tag import expand_instances_in_schema, is_valid_instance_tag_field
 from s2dm.exporters.utils.naming import apply_naming_to_schema, convert_name, load_naming_config
 from s2dm.exporters.utils.naming_config import ContextType, ElementType, NamingConventionConfig, get_case_for_element
+from s2dm.exporters.utils.schema_cache import build_schema_cached
 from s2dm.exporters.utils.violations import ConstraintViolation, Severity
 from s2dm.ledger import Ledger, annotate_schema_with_ledger
 from s2dm.tools.constraint_checker import ConstraintChecker
 from s2dm.utils.compose import SchemaDefinition, SharedDefinitionResolver
 from s2dm.utils.download import download_url_to_temp
 
+# File suffixes read by ariadne's ``load_schema_from_path`` when given a directory.
+COMPOSED_SCHEMA_EXTENSIONS = frozenset({".graphql", ".graphqls", ".gql"})
+
 SourceMapValueResolver = Callable[[Path, str], str]
 SchemaSelectionResolver = Callable[[Path], DocumentNode | None]
 
@@ -181,16 +189,49 @@ def _resolve_shared_schema_definitions(
 
 
 def build_schema_str(graphql_schema_paths: list[Path]) -> str:
-    """Build a GraphQL schema from a file or folder."""
-    schema_str, _ = build_schema_str_with_optional_source_map(graphql_schema_paths)
+    """Build a GraphQL schema from a file or folder.
+
+    Composing is far slower than stat'ing the files, so the result is memoized for the rest of the
+    process by the path, modification time and size of every file involved.
+    """
+    return _compose_schema_str(tuple(graphql_schema_paths), _schema_paths_fingerprint(graphql_schema_paths))
+
+
+def _schema_paths_fingerprint(graphql_schema_paths: list[Path]) -> tuple[tuple[str, int, int], ...]:
+    """Identify the current state of every schema file the given paths resolve to by path, mtime and size.
+
+    Each path is stat'ed once; the result both classifies it and fingerprints it if it is a file.
+    """
+    fingerprint = []
+    directories = []
+    for path in graphql_schema_paths:
+        try:
+            stat_result = path.stat()
+        except OSError:
+            continue
+        if stat.S_ISDIR(stat_result.st_mode):
+            directories.append(path)
+        elif stat.S_ISREG(stat_result.st_mode):
+            fingerprint.append((str(path), stat_result.st_mtime_ns, stat_result.st_size))
+
+    for schema_file in resolve_files_by_extensions(directories, COMPOSED_SCHEMA_EXTENSIONS):
+        stat_result = schema_file.stat()
+        fingerprint.append((str(schema_file), stat_result.st_mtime_ns, stat_result.st_size))
+    return tuple(fingerprint)
+
+
+@functools.lru_cache(maxsize=8)
+def _compose_schema_str(graphql_schema_paths: tuple[Path, ...], fingerprint: tuple[tuple[str, int, int], ...]) -> str:
+    schema_str, _ = build_schema_str_with_optional_source_map(list(graphql_schema_paths))
     return schema_str
 
 
 def build_schema_with_query(schema_str: str) -> GraphQLSchema:
     """Build a GraphQL schema from a schema string, ensuring it has a Query type."""
-    schema = build_schema(schema_str)  # Convert GraphQL SDL to a GraphQLSchema object
+    schema = build_schema_cached(schema_str)  # Convert GraphQL SDL to a GraphQLSchema object
     log.info("Successfully built the given GraphQL schema string.")
-    log.debug(f"Read schema: \n{print_schema(schema)}")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Read schema: \n%s", print_schema(schema))
     return ensure_query(schema)
 
 
@@ -401,14 +442,31 @@ def load_schema_as_str(graphql_schema_paths: list[Path], add_references: bool =
     return print_schema_with_directives_preserved(schema, source_map)
 
 
-def create_tempfile_to_composed_schema(graphql_schema_paths: list[Path]) -> Path:
-    """Load, build, and create temp file for schema to feed to e.g. GraphQL inspector."""
+@functools.lru_cache(maxsize=32)
+def _compose_to_tempfile(graphql_schema_paths: tuple[Path, ...], fingerprint: tuple[tuple[str, int, int], ...]) -> Path:
     with tempfile.NamedTemporaryFile(mode="w+", suffix=".graphql", delete=False) as temp_file:
-        temp_path: str = temp_file.name
-        temp_file.write(load_schema_as_str(graphql_schema_paths))
+        temp_path = Path(temp_file.name)
+        schema = build_schema_with_query(_compose_schema_str(graphql_schema_paths, fingerprint))
+        temp_file.write(print_schema_with_directives_preserved(schema))
         temp_file.flush()
 
-    return Path(temp_path)
+    atexit.register(temp_path.unlink, missing_ok=True)
+    return temp_path
+
+
+def create_tempfile_to_composed_schema(graphql_schema_paths: list[Path]) -> Path:
+    """Load, build, and create temp file for schema to feed to e.g. GraphQL inspector.
+
+    The temp file is shared by every call within the process for the same, unchanged schema files
+    and removed when the process exits.
+    """
+    paths = tuple(path.resolve() for path in graphql_schema_paths)
+    fingerprint = _schema_paths_fingerprint(list(paths))
+    temp_path = _compose_to_tempfile(paths, fingerprint)
+    if not temp_path.exists():
+        _compose_to_tempfile.cache_clear()
+        temp_path = _compose_to_tempfile(paths, fingerprint)
+    return temp_path
 
 
 @overload
@@ -189,12 +189,23 @@ CustomDumper.add_representer(list, CustomDumper.represent_list)
 
 def translate_to_vspec(annotated_schema: AnnotatedSchema) -> str:
     """Translate a GraphQL schema to YAML."""
+    return yaml.dump(_build_vspec_dict(annotated_schema), default_flow_style=False, Dumper=CustomDumper, sort_keys=True)
+
+
+def write_vspec(annotated_schema: AnnotatedSchema, output: Path) -> None:
+    """Translate a GraphQL schema to YAML written to ``output``, without building the document in memory."""
+    yaml_dict = _build_vspec_dict(annotated_schema)
+    with output.open("w", encoding="utf-8", buffering=1 << 20) as output_file:
+        yaml.dump(yaml_dict, output_file, default_flow_style=False, Dumper=CustomDumper, sort_keys=True)
+
+
+def _build_vspec_dict(annotated_schema: AnnotatedSchema) -> dict[str, Any]:
     schema = annotated_schema.schema
 
     all_object_types = get_all_object_types(schema)
     log.debug(f"Object types: {all_object_types}")
     nested_types: list[tuple[str, str]] = []  # List to collect nested structures to reconstruct the path
-    yaml_dict = {}
+    yaml_dict: dict[str, Any] = {}
     for object_type in all_object_types:
         if is_introspection_or_root_type(object_type.name):
             log.debug(f"Skipping internal object type '{object_type.name}'.")
@@ -239,7 +250,7 @@ def translate_to_vspec(annotated_schema: AnnotatedSchema) -> str:
                 new_key = ".".join(path_parts[:-1] + [key])
                 yaml_dict[new_key] = yaml_dict.pop(key)
                 break
-    return yaml.dump(yaml_dict, default_flow_style=False, Dumper=CustomDumper, sort_keys=True)
+    return yaml_dict
 
 
 def process_field(
@@ -2,11 +2,12 @@
 
 from pathlib import Path
 
-from modl.ledger import LedgerValidationError, validate_model_labels
-
 
 def validate_modl_annotation(labels: list[tuple[str, str]], ledger_dir: Path) -> bool:
     """Return whether the model's ``(label, kind)`` labels match the ledger at ``ledger_dir``."""
+    # modl.ledger pulls in pandas, so it is only imported once a ledger is actually applied.
+    from modl.ledger import LedgerValidationError, validate_model_labels
+
     try:
         validate_model_labels(labels, ledger_dir)
     except LedgerValidationError:
@@ -9,6 +9,20 @@ from rich.console import Console
 from rich.logging import RichHandler
 from rich.table import Table
 
+_console: Console | None = None
+
+
+def _get_console() -> Console:
+    """Return the console shared by all S2DM loggers.
+
+    ``Console()`` probes the terminal (size, colour support, encoding) on creation, and every logger
+    created after ``get_logger`` sets the logger class is an ``S2DMLogger``, third-party ones included.
+    """
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
+
 
 class S2DMLogger(logging.Logger):
     """
@@ -27,7 +41,7 @@ class S2DMLogger(logging.Logger):
             level: Initial log level
         """
         super().__init__(name, level)
-        self.console = Console()
+        self.console = _get_console()
 
         # Prevent double-emission when a dependency configures its own root handler
         self.propagate = False
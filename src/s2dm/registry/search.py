@@ -7,7 +7,6 @@ from pathlib import Path
 from typing import cast
 
 from rdflib import Graph, Literal
-from rdflib.plugins.sparql import prepareQuery
 from rdflib.query import ResultRow
 
 from s2dm.tools.string import normalize_whitespace
@@ -114,6 +113,9 @@ class SKOSSearchService:
         }}
         """
 
+        # Importing the SPARQL plugin builds its grammar, so commands that never search skip it
+        from rdflib.plugins.sparql import prepareQuery
+
         try:
             prepared_query = prepareQuery(count_query_template)
             results = self.graph.query(prepared_query, initBindings={"keyword": Literal(keyword)})
@@ -162,6 +164,8 @@ class SKOSSearchService:
         if limit_value is not None:
             query_template += f"\nLIMIT {limit_value}"
 
+        from rdflib.plugins.sparql import prepareQuery
+
         try:
             prepared_query = prepareQuery(query_template)
         except Exception as e:
@@ -6,6 +6,7 @@ from typing import Any
 
 from s2dm import log
 from s2dm.registry.concept_uris import ConceptBaseModel, ConceptUriModel, ConceptUriNode, HasIdMixin
+from s2dm.utils.json_output import write_json_output
 
 
 class SpecHistoryEntry(HasIdMixin):
@@ -77,8 +78,7 @@ def load_json_file(file_path: Path) -> dict[str, Any]:
 
 def save_spec_history(spec_history: SpecHistoryModel, file_path: Path) -> None:
     """Save a spec history model to a JSON-LD file."""
-    with open(file_path, "w") as f:
-        json.dump(spec_history.to_json_ld(), f, indent=2)
+    write_json_output(spec_history.to_json_ld(), file_path)
 
 
 def create_jsonld_context(namespace: str, include_spec_history: bool = False) -> dict[str, Any]:
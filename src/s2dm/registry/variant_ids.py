@@ -1,15 +1,25 @@
 """Variant ID models and helpers."""
 
-import json
 import re
 from pathlib import Path
 from typing import Any
 
+import orjson
 from pydantic import BaseModel, Field, field_validator
+from pydantic.dataclasses import dataclass
 
+from s2dm.utils.json_output import write_json_output
 
-class VariantEntry(BaseModel):
-    """Entry for a single concept in the variant ID file."""
+_SEMANTIC_VERSION_RE = re.compile(r"^(\d+)\.(\d+)$")
+
+
+@dataclass(frozen=True, slots=True)
+class VariantEntry:
+    """Entry for a single concept in the variant ID file.
+
+    A slotted dataclass rather than a model: a file holds one entry per concept of every schema version,
+    and entries are shared as-is between the previous and the new ID file.
+    """
 
     id: str = Field(..., description="Variant-based ID in format Concept/vM.m (semantic version)")
     variant_counter: int = Field(
@@ -42,7 +52,7 @@ class VariantEntry(BaseModel):
             raise ValueError(f"Invalid ID format: {id_str}. Expected format: [prefix:]Concept/vM.m")
         try:
             variant_part = id_str.split("/v")[-1]
-            match = re.match(r"^(\d+)\.(\d+)$", variant_part)
+            match = _SEMANTIC_VERSION_RE.match(variant_part)
             if not match:
                 raise ValueError(f"Invalid semantic version format: {variant_part}. Expected format: M.m")
             major = int(match.group(1))
@@ -80,15 +90,11 @@ class VariantIDFile(BaseModel):
     @classmethod
     def load(cls, path: Path) -> "VariantIDFile":
         """Load a variant ID file from a JSON file."""
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
-        return cls.model_validate(data)
+        return cls.model_validate(orjson.loads(path.read_bytes()))
 
     def save(self, path: Path) -> None:
         """Save the variant ID file to a JSON file."""
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.model_dump(exclude_none=True), f, indent=2)
+        write_json_output(self.model_dump(exclude_none=True), path)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary format."""
@@ -13,17 +13,34 @@ Example:
         result = inspector.diff(other_schema)
 """
 
+import atexit
+import functools
+import hashlib
+import itertools
 import json
+import os
 import shutil
 import subprocess
+import tempfile
+import threading
+from collections import OrderedDict, deque
 from collections.abc import Callable
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Protocol
 
-from s2dm import log
+from s2dm import __version__, log
 from s2dm.tools.diff_parser import DiffChange, parse_diff_output
 
+INSPECTOR_CACHE_DIR = Path.home() / ".cache" / "s2dm" / "inspector"
+INSPECTOR_CACHE_MAX_ENTRIES = 256
+# Set to a non-empty value to keep inspector results in memory only, e.g. in CI or on a shared home directory
+INSPECTOR_NO_DISK_CACHE_ENV = "S2DM_NO_INSPECTOR_DISK_CACHE"
+WORKER_SCRIPT_PATH = Path(__file__).parent / "graphql_inspector_worker.js"
+DIFF_SCRIPT_PATH = Path(__file__).parent / "graphql_inspector_diff.js"
+# Lines of Node.js stderr kept per worker to explain a failure
+WORKER_STDERR_TAIL_LINES = 50
+
 
 def locate_graphql_inspector(node_modules_path: Path | None = None, start_path: Path | None = None) -> Path | None:
     """Locate the GraphQL Inspector installation by finding the node_modules directory.
@@ -84,11 +101,19 @@ def requires_graphql_inspector(func: Callable[..., Any]) -> Callable[..., Any]:
     return wrapper
 
 
+_REQUIRED_NODE_PACKAGES = ("@graphql-inspector/core", "graphql")
+
+# node_modules directories whose packages loaded successfully; probing them again would only cost a Node.js start
+_verified_node_modules: set[Path] = set()
+
+
 def _check_node_dependencies(node_modules_path: Path) -> bool:
     """Check if required Node.js dependencies are installed by attempting to require them.
 
     This is more reliable than checking file existence as it verifies the actual
-    runtime environment and catches issues like broken installations.
+    runtime environment and catches issues like broken installations. Successful checks
+    are remembered for the rest of the process; failed ones are retried, e.g. after an
+    ``npm install``.
 
     Args:
         node_modules_path: Path to the node_modules directory
@@ -96,6 +121,12 @@ def _check_node_dependencies(node_modules_path: Path) -> bool:
     Returns:
         True if all required dependencies can be loaded, False otherwise
     """
+    if node_modules_path in _verified_node_modules:
+        return True
+
+    # Missing package directories cannot be required, so skip starting Node.js to find out
+    if not all((node_modules_path / package).is_dir() for package in _REQUIRED_NODE_PACKAGES):
+        return False
 
     # Check if node is available
     if not shutil.which("node"):
@@ -115,9 +146,336 @@ def _check_node_dependencies(node_modules_path: Path) -> bool:
             text=True,
             timeout=5,
         )
-        return result.returncode == 0
     except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
         return False
+    if result.returncode != 0:
+        return False
+    _verified_node_modules.add(node_modules_path)
+    return True
+
+
+def _read_cached_result(key: str) -> dict[str, Any] | None:
+    """Return the cached inspector result stored under ``key``, if any."""
+    cache_path = INSPECTOR_CACHE_DIR / f"{key}.json"
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        # Mark the entry as recently used so pruning evicts older ones first
+        os.utime(cache_path)
+    except (OSError, ValueError):
+        return None
+    return cached if isinstance(cached, dict) else None
+
+
+def _write_cached_result(key: str, result: dict[str, Any]) -> None:
+    """Atomically store an inspector result under ``key``; failures only cost a future cache miss."""
+    try:
+        INSPECTOR_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w", encoding="utf-8", dir=INSPECTOR_CACHE_DIR, suffix=".tmp", delete=False
+        ) as temp_file:
+            json.dump(result, temp_file)
+        os.replace(temp_file.name, INSPECTOR_CACHE_DIR / f"{key}.json")
+        _prune_cached_results()
+    except OSError as e:
+        log.debug("Could not cache graphql-inspector result: %s", e)
+
+
+def _prune_cached_results() -> None:
+    """Keep only the ``INSPECTOR_CACHE_MAX_ENTRIES`` most recently used results."""
+    entries = sorted(INSPECTOR_CACHE_DIR.glob("*.json"), key=lambda entry: entry.stat().st_mtime_ns, reverse=True)
+    for stale_entry in entries[INSPECTOR_CACHE_MAX_ENTRIES:]:
+        stale_entry.unlink(missing_ok=True)
+
+
+class InspectorCache(Protocol):
+    """Store for graphql-inspector results, keyed by ``GraphQLInspector._cache_key``."""
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the result stored under ``key``, or None on a miss."""
+        ...
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        """Store ``result`` under ``key``."""
+        ...
+
+
+class DiskInspectorCache:
+    """Inspector results kept as JSON files in ``INSPECTOR_CACHE_DIR``, shared by all s2dm processes."""
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the result stored under ``key``, or None on a miss."""
+        return _read_cached_result(key)
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        """Store ``result`` under ``key``."""
+        _write_cached_result(key, result)
+
+
+class MemoryInspectorCache:
+    """Thread-safe LRU cache of inspector results, local to the process and never written to disk."""
+
+    def __init__(self, max_size: int = 128) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the result stored under ``key``, or None on a miss."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        """Store ``result`` under ``key``, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+disk_inspector_cache = DiskInspectorCache()
+memory_inspector_cache = MemoryInspectorCache()
+
+
+def _default_inspector_cache() -> InspectorCache:
+    """Return the on-disk cache unless ``INSPECTOR_NO_DISK_CACHE_ENV`` opts out of it."""
+    if os.environ.get(INSPECTOR_NO_DISK_CACHE_ENV):
+        return memory_inspector_cache
+    return disk_inspector_cache
+
+
+@functools.lru_cache(maxsize=64)
+def _file_digest(path: Path, mtime_ns: int, size: int) -> bytes:
+    """Hash a file's content; the modification time and size only key the in-process memo."""
+    return hashlib.blake2b(path.read_bytes(), digest_size=20).digest()
+
+
+class InspectorWorker:
+    """Long-lived Node.js process answering graphql-inspector requests with the packages of one node_modules directory.
+
+    Starting Node.js and loading @graphql-inspector/core costs more than most requests, so the process is
+    reused by every request in this Python process. See ``graphql_inspector_worker.js`` for the line
+    protocol and the supported commands.
+    """
+
+    def __init__(self, node_modules_path: Path) -> None:
+        self._lock = threading.Lock()
+        self._request_ids = itertools.count(1)
+        self._process = subprocess.Popen(
+            ["node", str(WORKER_SCRIPT_PATH)],
+            cwd=str(node_modules_path.parent),
+            env={**os.environ, "NODE_PATH": str(node_modules_path.absolute())},
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+        )
+        self._stderr_tail: deque[str] = deque(maxlen=WORKER_STDERR_TAIL_LINES)
+        self._stderr_reader = threading.Thread(
+            target=self._drain_stderr, name="graphql-inspector-worker-stderr", daemon=True
+        )
+        self._stderr_reader.start()
+
+    def _drain_stderr(self) -> None:
+        """Keep the last lines Node.js writes to stderr; reading them also keeps the pipe from filling up."""
+        stderr = self._process.stderr
+        if stderr is None:
+            return
+        for line in stderr:
+            self._stderr_tail.append(line)
+
+    def stderr_tail(self) -> str:
+        """Return the last lines the Node.js process wrote to stderr."""
+        return "".join(self._stderr_tail).strip()
+
+    def _error(self, message: str) -> RuntimeError:
+        """Build an error about the worker that includes the tail of its stderr."""
+        if not self.is_alive():
+            # Let the reader collect what the process wrote before it exited
+            self._stderr_reader.join(timeout=1)
+        return RuntimeError(log.format_error_with_stderr(message, self.stderr_tail()))
+
+    def is_alive(self) -> bool:
+        """Return whether the Node.js process is still running."""
+        return self._process.poll() is None
+
+    def request(self, cmd: str, **args: Any) -> dict[str, Any]:
+        """Send one request to the worker and wait for its answer.
+
+        Args:
+            cmd: Worker command to run, e.g. ``diff``
+            **args: JSON-serializable command arguments
+
+        Returns:
+            Result holding the command's ``exit_code`` and either its ``output`` or an ``error`` message
+
+        Raises:
+            RuntimeError: If the worker process is gone or answers out of order or with something other than JSON
+        """
+        stdin, stdout = self._process.stdin, self._process.stdout
+        if stdin is None or stdout is None:
+            raise RuntimeError("graphql_inspector_worker.js has no open pipes")
+
+        with self._lock:
+            request_id = next(self._request_ids)
+            try:
+                stdin.write(json.dumps({"id": request_id, "cmd": cmd, "args": args}) + "\n")
+                stdin.flush()
+                line = stdout.readline()
+            except OSError as e:
+                raise self._error(f"graphql_inspector_worker.js is not running: {e}") from e
+
+        if not line:
+            raise self._error(f"graphql_inspector_worker.js exited with code {self._process.wait()}")
+        try:
+            response = json.loads(line)
+        except ValueError as e:
+            raise self._error(f"graphql_inspector_worker.js answered with invalid JSON: {line[:200]!r}") from e
+        if not isinstance(response, dict) or response.get("id") != request_id:
+            answered = response.get("id") if isinstance(response, dict) else None
+            raise self._error(f"graphql_inspector_worker.js answered request {answered}, not {request_id}")
+        result: dict[str, Any] = response["result"]
+        return result
+
+    def close(self) -> None:
+        """Stop the Node.js process by closing its input."""
+        if self._process.stdin is not None:
+            self._process.stdin.close()
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        self._stderr_reader.join(timeout=1)
+
+
+_inspector_workers: dict[Path, InspectorWorker] = {}
+# Guards _inspector_workers so concurrent requests start at most one worker per node_modules directory
+_inspector_workers_lock = threading.Lock()
+
+
+def _get_inspector_worker(node_modules_path: Path) -> InspectorWorker:
+    """Return the running worker for ``node_modules_path``, starting one if needed."""
+    with _inspector_workers_lock:
+        worker = _inspector_workers.get(node_modules_path)
+        if worker is not None:
+            if worker.is_alive():
+                return worker
+            log.debug("graphql_inspector_worker.js exited: %s", worker.stderr_tail())
+            # Reap the exited process before replacing it
+            worker.close()
+            del _inspector_workers[node_modules_path]
+        return _start_inspector_worker(node_modules_path)
+
+
+def _start_inspector_worker(node_modules_path: Path) -> InspectorWorker:
+    """Start and register a worker for ``node_modules_path``; the caller holds ``_inspector_workers_lock``."""
+    # Verify the npm packages are installed (not just the CLI binary)
+    if not _check_node_dependencies(node_modules_path):
+        raise RuntimeError(
+            "Required npm packages (@graphql-inspector/core, graphql) not found. "
+            "Please run 'npm install' in the project root."
+        )
+
+    if not WORKER_SCRIPT_PATH.exists():
+        raise RuntimeError(f"Node.js script not found at {WORKER_SCRIPT_PATH}")
+
+    worker = InspectorWorker(node_modules_path)
+    _inspector_workers[node_modules_path] = worker
+    return worker
+
+
+def _close_inspector_workers() -> None:
+    with _inspector_workers_lock:
+        for worker in _inspector_workers.values():
+            worker.close()
+        _inspector_workers.clear()
+
+
+atexit.register(_close_inspector_workers)
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_cli_path(node_modules_path: Path | None) -> str:
+    """Resolve the graphql-inspector CLI once per node_modules directory and process."""
+    # Try local installation first if node_modules_path is provided
+    if node_modules_path:
+        local_cli_path = node_modules_path / ".bin" / "graphql-inspector"
+        if local_cli_path.exists():
+            return str(local_cli_path)
+
+    # Fall back to global installation
+    if shutil.which("graphql-inspector"):
+        return "graphql-inspector"
+
+    # Not found - provide helpful error message
+    raise RuntimeError(
+        "graphql-inspector CLI not found. Please run 'npm install' in the project root "
+        "to install @graphql-inspector/cli, or install it globally with "
+        "'npm install -g @graphql-inspector/cli'."
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _inspector_package_json(cli_cmd: str) -> Path | None:
+    """Find the ``package.json`` of the @graphql-inspector/cli package providing ``cli_cmd``.
+
+    The CLI binary is a symlink into the package, so the manifest is found by walking up from the
+    resolved binary.
+    """
+    cli_path = shutil.which(cli_cmd)
+    if cli_path is None:
+        return None
+    for parent in Path(cli_path).resolve().parents:
+        try:
+            package = json.loads((parent / "package.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if isinstance(package, dict) and package.get("name") == "@graphql-inspector/cli":
+            return parent / "package.json"
+    return None
+
+
+def _inspector_version(cli_cmd: str) -> str:
+    """Return the installed version of the CLI behind ``cli_cmd``, or an empty string if it is unknown.
+
+    The manifest is read on every call so that an ``npm install`` upgrading the package in place is noticed.
+    """
+    package_json = _inspector_package_json(cli_cmd)
+    if package_json is None:
+        return ""
+    try:
+        package = json.loads(package_json.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return ""
+    return str(package.get("version", "")) if isinstance(package, dict) else ""
+
+
+@functools.cache
+def _structured_diff_scripts_digest() -> str:
+    """Hash the Node.js scripts computing structured diffs; they only change with the installed s2dm."""
+    digest = hashlib.blake2b(digest_size=20)
+    for script_path in (WORKER_SCRIPT_PATH, DIFF_SCRIPT_PATH):
+        try:
+            digest.update(script_path.read_bytes())
+        except OSError:
+            digest.update(b"missing")
+    return digest.hexdigest()
+
+
+def _node_package_version(node_modules_path: Path | None, package: str) -> str:
+    """Return the installed version of ``package``, or an empty string if it is unknown."""
+    if node_modules_path is None:
+        return ""
+    try:
+        manifest = json.loads((node_modules_path / package / "package.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return ""
+    return str(manifest.get("version", "")) if isinstance(manifest, dict) else ""
 
 
 class InspectorCommands(Enum):
@@ -127,6 +485,15 @@ class InspectorCommands(Enum):
     SIMILAR = "similar"
 
 
+# Whether a command takes the schema right after its name (True) or after its own arguments (False)
+_SCHEMA_FIRST: dict[InspectorCommands, bool] = {
+    InspectorCommands.DIFF: True,
+    InspectorCommands.VALIDATE: False,
+    InspectorCommands.INTROSPECT: True,
+    InspectorCommands.SIMILAR: True,
+}
+
+
 class InspectorOutput:
     def __init__(
         self,
@@ -147,19 +514,26 @@ class InspectorOutput:
 
 
 class GraphQLInspector:
-    def __init__(self, schema_path: Path, node_modules_path: Path | None = None) -> None:
+    def __init__(
+        self, schema_path: Path, node_modules_path: Path | None = None, cache: InspectorCache | None = None
+    ) -> None:
         """Initialize GraphQL Inspector.
 
         Args:
             schema_path: Path to the GraphQL schema file
             node_modules_path: Path to node_modules directory (for finding local binaries).
                               Optional - if None, will only use globally installed CLI.
+            cache: Store for the results of cacheable commands. Optional - defaults to the on-disk
+                cache shared by all s2dm processes, or to an in-memory one if the
+                ``S2DM_NO_INSPECTOR_DISK_CACHE`` environment variable is set; pass one
+                ``MemoryInspectorCache`` to several inspectors to share results within the process only.
 
         Raises:
             RuntimeError: If graphql-inspector CLI is not found
         """
         self.schema_path = schema_path
         self.node_modules_path = node_modules_path
+        self.cache: InspectorCache = cache if cache is not None else _default_inspector_cache()
 
         # Resolve CLI path once during initialization
         self.cli_cmd = self._resolve_cli_path()
@@ -173,22 +547,68 @@ class GraphQLInspector:
         Raises:
             RuntimeError: If graphql-inspector CLI is not found
         """
-        # Try local installation first if node_modules_path is provided
-        if self.node_modules_path:
-            local_cli_path = self.node_modules_path / ".bin" / "graphql-inspector"
-            if local_cli_path.exists():
-                return str(local_cli_path)
+        return _resolve_cli_path(self.node_modules_path)
+
+    def _cache_key(self, operation: str, *schema_paths: Path) -> str:
+        """Fingerprint an operation by the s2dm and inspector versions and the content of the schemas involved."""
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{operation}|{__version__}|{self.cli_cmd}|{_inspector_version(self.cli_cmd)}".encode())
+        for schema_path in (self.schema_path, *schema_paths):
+            stat_result = schema_path.stat()
+            digest.update(b"||")
+            digest.update(_file_digest(schema_path.resolve(), stat_result.st_mtime_ns, stat_result.st_size))
+        return digest.hexdigest()
+
+    def _run_cached(
+        self,
+        key: str,
+        command: InspectorCommands,
+        *args: Any,
+        write: Path | None = None,
+        cacheable_returncodes: tuple[int, ...] = (0,),
+    ) -> InspectorOutput:
+        """Run a command whose result only depends on ``key``, reusing the result of a previous run.
 
-        # Fall back to global installation
-        if shutil.which("graphql-inspector"):
-            return "graphql-inspector"
+        Args:
+            key: Cache key, see ``_cache_key``
+            command: The inspector command to run
+            *args: Additional command arguments
+            write: File the command writes its result to (``--write``); its content is cached too
+                and restored on a cache hit
+            cacheable_returncodes: Return codes of successful runs, only those are cached
 
-        # Not found - provide helpful error message
-        raise RuntimeError(
-            "graphql-inspector CLI not found. Please run 'npm install' in the project root "
-            "to install @graphql-inspector/cli, or install it globally with "
-            "'npm install -g @graphql-inspector/cli'."
-        )
+        Returns:
+            InspectorOutput containing command results
+        """
+        cached = self.cache.get(key)
+        if cached is not None and (write is None or "written" in cached):
+            log.info("Using cached graphql-inspector %s result", command.value)
+            if write is not None:
+                write.write_text(cached["written"], encoding="utf-8")
+                args = (*args, "--write", write)
+            # The cached command line may name temporary files of an earlier run, describe this one instead
+            command_line = " ".join(self._build_command(command, *args))
+            return InspectorOutput(command_line, cached["returncode"], cached["output"])
+
+        if write is not None:
+            args = (*args, "--write", write)
+        result = self._run_command(command, *args)
+        if result.returncode in cacheable_returncodes:
+            if write is None:
+                self.cache.put(key, result.as_dict())
+            elif write.is_file():
+                self.cache.put(key, {**result.as_dict(), "written": write.read_text(encoding="utf-8")})
+        return result
+
+    def _build_command(self, command: InspectorCommands, *args: Any) -> list[str]:
+        """Build the command line running ``command`` on this schema using the pre-resolved CLI path."""
+        schema_first = _SCHEMA_FIRST.get(command)
+        if schema_first is None:
+            raise ValueError(f"Unknown command: {command.value}")
+        command_args = [str(a) for a in args]
+        if schema_first:
+            return [self.cli_cmd, command.value, str(self.schema_path), *command_args]
+        return [self.cli_cmd, command.value, *command_args, str(self.schema_path)]
 
     def _run_command(
         self: "GraphQLInspector",
@@ -206,15 +626,9 @@ class GraphQLInspector:
         Returns:
             InspectorOutput containing command results
         """
-        # Build command using the pre-resolved CLI path
-        if command in [InspectorCommands.DIFF, InspectorCommands.INTROSPECT, InspectorCommands.SIMILAR]:
-            cmd = [self.cli_cmd, command.value, str(self.schema_path)] + [str(a) for a in args]
-        elif command == InspectorCommands.VALIDATE:
-            cmd = [self.cli_cmd, command.value] + [str(a) for a in args] + [str(self.schema_path)]
-        else:
-            raise ValueError(f"Unknown command: {command.value}")
-
-        log.info(f"Running command: {' '.join(cmd)}")
+        cmd = self._build_command(command, *args)
+        command_line = " ".join(cmd)
+        log.info("Running command: %s", command_line)
         result = subprocess.run(
             cmd,
             capture_output=True,
@@ -231,48 +645,72 @@ class GraphQLInspector:
                 output = stderr
 
         if output:
-            log.debug(f"OUTPUT:\n{output}")
+            # Formatted lazily, the output of a diff or similar run can be large
+            log.debug("OUTPUT:\n%s", output)
         if result.returncode != 0:
-            log.warning(f"Command failed with return code {result.returncode}")
-        log.info(f"Process completed with return code: {result.returncode}")
+            log.warning("Command failed with return code %d", result.returncode)
+        log.info("Process completed with return code: %d", result.returncode)
 
         return InspectorOutput(
-            command=" ".join(cmd),
+            command=command_line,
             returncode=result.returncode,
             output=output,
         )
 
     def validate(self, query: str) -> InspectorOutput:
-        """Validate schema with logging"""
-        return self._run_command(InspectorCommands.VALIDATE, query)
+        """Validate schema with logging.
+
+        When ``query`` names a single document file, results are cached on disk by the content of the
+        schema and the document. Glob patterns are always run, their matches may change between runs.
+        """
+        query_path = Path(query)
+        if not query_path.is_file():
+            return self._run_command(InspectorCommands.VALIDATE, query)
+        # 0 means the documents are valid and 1 that they are not; anything else failed.
+        return self._run_cached(
+            self._cache_key("validate", query_path),
+            InspectorCommands.VALIDATE,
+            query,
+            cacheable_returncodes=(0, 1),
+        )
 
     def diff(self, other_schema: Path) -> InspectorOutput:
-        """Compare schemas with logging"""
-        return self._run_command(InspectorCommands.DIFF, str(other_schema))
+        """Compare schemas with logging.
+
+        Results are cached on disk by schema content, so repeating a diff skips the Node.js run.
+        """
+        # 0 means no breaking changes and 1 means breaking changes were found; anything else failed.
+        return self._run_cached(
+            self._cache_key("diff", other_schema),
+            InspectorCommands.DIFF,
+            str(other_schema),
+            cacheable_returncodes=(0, 1),
+        )
 
     def introspect(self, output: Path) -> InspectorOutput:
-        """Introspect schema."""
-        return self._run_command(InspectorCommands.INTROSPECT, "--write", output)
+        """Introspect schema.
+
+        Results are cached on disk by schema content, so repeating an introspection skips the
+        Node.js run and only rewrites the output file.
+        """
+        return self._run_cached(self._cache_key("introspect"), InspectorCommands.INTROSPECT, write=output)
 
     def similar(self, output: Path | None) -> InspectorOutput:
         """Similar table"""
-        if output:
-            return self._run_command(InspectorCommands.SIMILAR, "--write", output)
-        else:
-            return self._run_command(InspectorCommands.SIMILAR)
+        return self._run_cached(self._cache_key("similar"), InspectorCommands.SIMILAR, write=output)
 
     def similar_keyword(self, keyword: str, output: Path | None) -> InspectorOutput:
         """Search single type in schema"""
-        if output:
-            return self._run_command(InspectorCommands.SIMILAR, "-n", keyword, "--write", output)
-        else:
-            return self._run_command(InspectorCommands.SIMILAR, "-n", keyword)
+        return self._run_cached(
+            self._cache_key(f"similar|{keyword}"), InspectorCommands.SIMILAR, "-n", keyword, write=output
+        )
 
     def diff_structured(self, other_schema: Path) -> list[DiffChange]:
         """Compare schemas using custom Node.js script and return structured diff changes.
 
         This method uses a custom Node.js script that directly requires the npm packages
-        (@graphql-inspector/core and graphql) to get structured JSON output.
+        (@graphql-inspector/core and graphql) to get structured JSON output. The script runs
+        in an ``InspectorWorker`` that is reused by later calls within the process.
 
         Note: Unlike other methods that use the CLI binary, this requires the actual npm
         packages to be installed locally.
@@ -287,6 +725,17 @@ class GraphQLInspector:
             RuntimeError: If node_modules_path wasn't provided, npm packages aren't installed,
                          or the Node.js script fails
         """
+        # Structured diffs come from s2dm's own scripts and @graphql-inspector/core rather than the CLI
+        operation = (
+            f"diff_structured|{_structured_diff_scripts_digest()}"
+            f"|{_node_package_version(self.node_modules_path, '@graphql-inspector/core')}"
+        )
+        key = self._cache_key(operation, other_schema)
+        cached = self.cache.get(key)
+        if cached is not None:
+            log.info("Using cached structured diff result")
+            return parse_diff_output(raw_output=cached["output"])
+
         # Ensure node_modules_path was provided (required for npm package resolution)
         if not self.node_modules_path:
             raise RuntimeError(
@@ -294,68 +743,30 @@ class GraphQLInspector:
                 "in the project root and provide the path during initialization."
             )
 
-        # Verify the npm packages are installed (not just the CLI binary)
-        if not _check_node_dependencies(self.node_modules_path):
-            raise RuntimeError(
-                "Required npm packages (@graphql-inspector/core, graphql) not found. "
-                "Please run 'npm install' in the project root."
-            )
-
-        # Find the Node.js script relative to this file
-        script_dir = Path(__file__).parent
-        node_script_path = script_dir / "graphql_inspector_diff.js"
-
-        if not node_script_path.exists():
-            raise RuntimeError(f"Node.js script not found at {node_script_path}")
-
-        # Use absolute paths for script and schema files
-        node_cmd = [
-            "node",
-            str(node_script_path.absolute()),
-            str(self.schema_path.absolute()),
-            str(other_schema.absolute()),
-        ]
-
-        log.info(f"Running structured diff: {' '.join(node_cmd)}")
-
-        # Run from node_modules parent to ensure node_modules can be found
-        result = subprocess.run(
-            node_cmd,
-            capture_output=True,
-            text=True,
-            check=False,  # Don't raise exception for non-zero exit codes
-            cwd=str(self.node_modules_path.parent),  # Run from node_modules parent for module resolution
+        worker = _get_inspector_worker(self.node_modules_path)
+        log.info("Running structured diff of %s and %s", self.schema_path, other_schema)
+        response = worker.request(
+            "diff", old_schema=str(self.schema_path.absolute()), new_schema=str(other_schema.absolute())
         )
 
         # Exit code 1 is OK - it means breaking changes were detected
         # Exit code 2 means an error occurred
-        if result.returncode == 2:
-            base_error_msg = "Node.js script encountered an error (exit code 2)"
-            # Try to parse stderr as JSON (error output from script) for better error message
-            if result.stderr:
-                try:
-                    error_json = json.loads(result.stderr)
-                    base_error_msg = f"{base_error_msg}: {error_json.get('error', 'Unknown error')}"
-                    # If JSON parsing succeeded, we already have the error message,
-                    # so don't append stderr again (format_error_with_stderr will log it at debug)
-                except json.JSONDecodeError:
-                    # Non-JSON error output - format_error_with_stderr will append it
-                    pass
-            error_msg = log.format_error_with_stderr(base_error_msg, result.stderr)
+        if response["exit_code"] == 2:
+            base_error_msg = f"Node.js script encountered an error (exit code 2): {response.get('error')}"
+            error_msg = log.format_error_with_stderr(base_error_msg, None)
             raise RuntimeError(error_msg)
 
-        output_text = result.stdout.strip()
+        output_text = str(response.get("output", "")).strip()
         if not output_text:
-            error_msg = log.format_error_with_stderr(
-                "graphql_inspector_diff.js script returned empty output", result.stderr
-            )
+            error_msg = log.format_error_with_stderr("graphql_inspector_worker.js returned empty output", None)
             raise RuntimeError(error_msg)
 
         try:
             # Parse JSON output from Node.js script
             diff_output = parse_diff_output(raw_output=output_text)
             log.info("Successfully obtained structured diff from Node.js script")
+            self.cache.put(key, {"output": output_text})
             return diff_output
         except (json.JSONDecodeError, ValueError) as e:
-            error_msg = log.format_error_with_stderr(f"Failed to parse Node.js script output: {e}", result.stderr)
+            error_msg = log.format_error_with_stderr(f"Failed to parse Node.js script output: {e}", None)
             raise RuntimeError(error_msg) from e
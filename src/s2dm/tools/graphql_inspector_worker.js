@@ -0,0 +1,50 @@
+#!/usr/bin/env node
+/**
+ * Long-running Node.js process answering graphql-inspector requests.
+ *
+ * Starting Node.js and loading @graphql-inspector/core costs more than most requests,
+ * so GraphQLInspector keeps one worker alive and sends it one request per line:
+ *
+ *     {"id": 1, "cmd": "diff", "args": {"old_schema": "<path>", "new_schema": "<path>"}}
+ *
+ * Each request is answered, in order, by one line {"id": 1, "result": ...} where the result is
+ * either {"exit_code": 0 | 1, "output": "<changes JSON>"} or {"exit_code": 2, "error": "<message>"},
+ * mirroring the exit codes and stdout of graphql_inspector_diff.js.
+ */
+
+const fs = require('fs');
+const readline = require('readline');
+const { structuredDiff } = require('./graphql_inspector_diff');
+
+const commands = {
+    async diff({ old_schema, new_schema }) {
+        const oldSchemaSDL = fs.readFileSync(old_schema, 'utf8');
+        const newSchemaSDL = fs.readFileSync(new_schema, 'utf8');
+        const result = await structuredDiff(oldSchemaSDL, newSchemaSDL);
+        const hasBreakingChanges = result.some(change => change.criticality !== 'NON_BREAKING');
+        return { exit_code: hasBreakingChanges ? 1 : 0, output: JSON.stringify(result, null, 2) };
+    },
+};
+
+async function handleRequest(line) {
+    let id = null;
+    try {
+        const request = JSON.parse(line);
+        id = request.id ?? null;
+        const command = Object.hasOwn(commands, request.cmd) ? commands[request.cmd] : null;
+        if (command === null) {
+            return { id, result: { exit_code: 2, error: `Unknown command: ${request.cmd}` } };
+        }
+        return { id, result: await command(request.args || {}) };
+    } catch (error) {
+        return { id, result: { exit_code: 2, error: error.message } };
+    }
+}
+
+// Requests are chained so responses are written in the order the requests arrived
+let pending = Promise.resolve();
+readline.createInterface({ input: process.stdin }).on('line', (line) => {
+    pending = pending
+        .then(() => handleRequest(line))
+        .then((response) => process.stdout.write(JSON.stringify(response) + '\n'));
+});
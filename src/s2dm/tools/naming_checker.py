@@ -1,4 +1,6 @@
-import inflect
+import functools
+from typing import TYPE_CHECKING
+
 from graphql import (
     GraphQLEnumType,
     GraphQLInputObjectType,
@@ -18,7 +20,16 @@ from s2dm.exporters.utils.naming_config import (
     get_case_for_element,
 )
 
-_inflect_engine = inflect.engine()
+if TYPE_CHECKING:
+    import inflect
+
+
+@functools.cache
+def _inflect_engine() -> "inflect.engine":
+    """Create the inflect engine on first use; importing inflect takes over a second."""
+    import inflect
+
+    return inflect.engine()
 
 
 def _matches_case_format(name: str, case_format: CaseFormat) -> tuple[bool, str]:
@@ -46,7 +57,7 @@ def _is_plural(name: str) -> bool:
     Returns:
         True if the name is plural, False otherwise
     """
-    singular = _inflect_engine.singular_noun(name)
+    singular = _inflect_engine().singular_noun(name)
     return singular is not False
 
 
@@ -128,7 +139,7 @@ def check_naming_conventions(
                     )
                     and not _is_plural(field_name)
                 ):
-                    suggestion = _inflect_engine.plural(field_name)
+                    suggestion = _inflect_engine().plural(field_name)
                     plural_errors.append(
                         f"[naming] List field '{object_type.name}.{field_name}' should be plural "
                         f"(suggestion: '{suggestion}')"
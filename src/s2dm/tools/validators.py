@@ -1,6 +1,4 @@
 import click
-import langcodes
-from linkml_runtime.utils.metamodelcore import URI
 
 
 def validate_language_tag(ctx: click.Context, param: click.Parameter, value: str) -> str:
@@ -21,6 +19,9 @@ def validate_language_tag(ctx: click.Context, param: click.Parameter, value: str
     if not value.strip():
         raise click.BadParameter("Language tag cannot be empty")
 
+    # langcodes loads its language data on import, so only commands that validate a tag pay for it
+    import langcodes
+
     # Check for valid BCP 47 format using langcodes
     try:
         if not langcodes.get(value).is_valid():
@@ -44,6 +45,9 @@ def validate_linkml_uri_value(value: str) -> str:
     Raises:
         ValueError: If the URI is empty or invalid
     """
+    # linkml_runtime is slow to import, so it is only loaded when a URI is actually validated.
+    from linkml_runtime.utils.metamodelcore import URI
+
     normalized_value = value.strip()
     if not normalized_value:
         raise ValueError("Value cannot be empty")
@@ -55,6 +55,8 @@ def _extract_uri_segment(uri: str) -> str:
 
 # Precompiled regex utilities to keep transformations DRY
 _DIR_SAFE_RE = re.compile(r"[^0-9A-Za-z_-]+")
+# Separators in QUDT URI segments that become underscores in enum symbols, mapped in one translate pass
+_ENUM_SYMBOL_SEPARATORS = str.maketrans({"-": "_", ".": "_"})
 QUDT_NS = rdflib.Namespace("http://qudt.org/schema/qudt/")
 
 
@@ -123,7 +125,7 @@ def _uri_to_enum_symbol(uri: str) -> str:
 
     # Simple case conversion: uppercase and replace separators with underscores
     # QUDT URI segments primarily use hyphens (-) and underscores (_), with rare edge cases
-    symbol = uri_segment.upper().replace("-", "_").replace(".", "_")
+    symbol = uri_segment.translate(_ENUM_SYMBOL_SEPARATORS).upper()
 
     if not symbol:
         raise UnitEnumError(f"{UnitEnumErrorMessages.ENUM_SYMBOL_EMPTY}: '{uri_segment}'")
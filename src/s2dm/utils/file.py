@@ -1,9 +1,14 @@
 """File utility functions."""
 
+import codecs
+import mmap
+import os
 import tempfile
 from collections.abc import Iterable
 from pathlib import Path
 
+MMAP_READ_THRESHOLD = 1024 * 1024
+
 
 def temp_file_from_content(
     content: str,
@@ -72,3 +77,58 @@ def temp_files_from_contents(
         )
         for content in contents
     ]
+
+
+def ensure_parent_dir(path: Path) -> None:
+    """Create the parent directory of ``path`` unless it already exists."""
+    parent = path.parent
+    if not parent.is_dir():
+        parent.mkdir(parents=True, exist_ok=True)
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """
+    Write ``data`` to ``path`` in a single write, replacing the file only once it is complete.
+
+    The data goes to a temporary file next to ``path`` that is then renamed over it, so readers
+    and interrupted runs never see a truncated file. Missing parent directories are created.
+
+    Args:
+        path: Path of the file to write
+        data: Complete file content
+    """
+    ensure_parent_dir(path)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    # Unlike tempfile, os.open honours the umask, so the result gets the usual permissions.
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def read_text_mapped(path: Path, encoding: str = "utf-8", mmap_threshold: int = MMAP_READ_THRESHOLD) -> str:
+    """
+    Read a text file, decoding large files directly from a memory map.
+
+    ``Path.read_text`` reads the whole file into a bytes object before decoding it, so both copies
+    are alive at once. Files of at least ``mmap_threshold`` bytes are decoded straight from a
+    read-only memory map instead, which keeps only the decoded string on the heap. Newlines of
+    mapped files are not translated.
+
+    Args:
+        path: Path of the file to read
+        encoding: File encoding (default: "utf-8")
+        mmap_threshold: Minimum file size in bytes for which the file is memory mapped
+
+    Returns:
+        Decoded file content
+    """
+    with path.open("rb") as file:
+        if os.fstat(file.fileno()).st_size < mmap_threshold:
+            return path.read_text(encoding=encoding)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return codecs.decode(mapped, encoding)
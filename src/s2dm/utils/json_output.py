@@ -1,9 +1,25 @@
 """Helpers for consistent JSON CLI output formatting."""
 
-import json
+from pathlib import Path
 from typing import Any
 
+import orjson
+
+from s2dm.utils.file import write_bytes_atomic
+
+# Matches ``json.dumps(data, indent=2, ensure_ascii=False)``, including its coercion of non-string keys.
+_JSON_OUTPUT_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 
 def format_json_output(data: Any) -> str:
     """Serialize data to stable, human-readable JSON."""
-    return json.dumps(data, indent=2, ensure_ascii=False)
+    return orjson.dumps(data, option=_JSON_OUTPUT_OPTIONS).decode("utf-8")
+
+
+def write_json_output(data: Any, path: Path) -> None:
+    """Write data to ``path`` formatted like ``format_json_output``.
+
+    The encoded bytes are written as-is, without an intermediate ``str`` copy of the document, and
+    replace ``path`` atomically (see ``write_bytes_atomic``), creating its parent directory if needed.
+    """
+    write_bytes_atomic(path, orjson.dumps(data, option=_JSON_OUTPUT_OPTIONS))
@@ -16,8 +16,11 @@ from hypothesis import strategies as st
 from hypothesis.strategies import composite
 
 from s2dm.api.main import app
+from s2dm.api.services.response_service import result_cache
+from s2dm.exporters.utils import schema_cache
 from s2dm.exporters.utils.extraction import get_all_named_types
 from s2dm.exporters.utils.schema_loader import ensure_query
+from s2dm.tools import graphql_inspector
 from s2dm.tools.graphql_inspector import locate_graphql_inspector
 from s2dm.units.sync import UnitRow, _uri_to_enum_symbol
 
@@ -284,8 +287,8 @@ def units_sync_mocks(
     test_units_dir = tmp_path / "test_units"
     monkeypatch.setattr("s2dm.cli.DEFAULT_QUDT_UNITS_DIR", test_units_dir)
 
-    monkeypatch.setattr("s2dm.cli.sync_qudt_units", mock_sync_qudt_units)
-    monkeypatch.setattr("s2dm.cli.get_latest_qudt_version", mock_get_latest_qudt_version)
+    monkeypatch.setattr("s2dm.units.sync.sync_qudt_units", mock_sync_qudt_units)
+    monkeypatch.setattr("s2dm.units.sync.get_latest_qudt_version", mock_get_latest_qudt_version)
     return mock_sync_qudt_units, mock_get_latest_qudt_version
 
 
@@ -365,3 +368,25 @@ def pytest_configure(config: pytest.Config) -> None:
 def test_client() -> TestClient:
     """FastAPI TestClient for API integration tests."""
     return TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def clear_api_result_cache() -> None:
+    """Keep cached API export results from leaking between tests."""
+    result_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_schema_cache(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the on-disk schema cache out of the user's home directory."""
+    cache_dir = tmp_path_factory.mktemp("schema-cache")
+    monkeypatch.setattr(schema_cache, "SCHEMA_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def isolated_inspector_cache(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep cached graphql-inspector results out of the user's home directory and between tests."""
+    cache_dir = tmp_path_factory.mktemp("inspector-cache")
+    monkeypatch.setattr(graphql_inspector, "INSPECTOR_CACHE_DIR", cache_dir)
+    return cache_dir
@@ -1,8 +1,12 @@
 """Core API tests for health, capabilities, and error handling."""
 
+import json
+from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
 
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
 from fastapi.testclient import TestClient
 from graphql import GraphQLError, GraphQLSyntaxError, Source
 from rdflib.plugin import PluginException
@@ -10,7 +14,11 @@ from rdflib.plugin import PluginException
 from s2dm import __version__
 from s2dm.api.errors import ResponseError, format_error_list
 from s2dm.api.main import app
-from s2dm.api.services.response_service import execute_and_respond
+from s2dm.api.models.base import ApiResponse, BaseExportRequest
+from s2dm.api.routes import shacl
+from s2dm.api.services.response_service import execute_and_respond, request_cache_key
+from s2dm.api.utils.flat_router import FlatAPIRouter
+from s2dm.api.utils.hash_router import HashRouter
 
 
 class TestCoreEndpoints:
@@ -39,6 +47,84 @@ class TestCoreEndpoints:
         assert "paths" in data
 
 
+class TestRouting:
+    """Test dispatch through the static route table."""
+
+    def test_static_routes_are_indexed(self) -> None:
+        """Static API routes are resolved through the hash-based dispatcher."""
+        dispatcher = app.router.routes[0]
+
+        assert isinstance(dispatcher, HashRouter)
+        assert ("POST", "/api/v1/export/shacl") in dispatcher.static_routes
+        assert ("GET", "/api/v1/health") in dispatcher.static_routes
+
+    def test_unmatched_method_falls_back_to_router(self, test_client: TestClient) -> None:
+        """Requests missing the static table still get Starlette's 404/405 handling."""
+        assert test_client.get("/api/v1/export/shacl").status_code == 405
+        assert test_client.get("/api/v1/unknown").status_code == 404
+
+    def test_routes_added_after_install_are_dispatched(self) -> None:
+        """Routes registered after the static table was built fall through to Starlette's matching."""
+        late_app = FastAPI()
+        FlatAPIRouter(late_app).install(late_app)
+        late_app.add_api_route("/late", lambda: {"late": True}, methods=["GET"])
+
+        response = TestClient(late_app).get("/late")
+
+        assert response.status_code == 200
+        assert response.json() == {"late": True}
+
+
+class TestRouteTable:
+    """Pin the routes the API exposes."""
+
+    def test_api_routes(self) -> None:
+        """Sub-routers are mounted under their prefixes and tags."""
+        routes = {
+            (method, route.path, tuple(route.tags))
+            for route in app.routes
+            if isinstance(route, APIRoute)
+            for method in route.methods
+        }
+
+        assert routes == {
+            ("POST", "/api/v1/export/shacl", ("export",)),
+            ("POST", "/api/v1/export/vspec", ("export",)),
+            ("POST", "/api/v1/export/jsonschema", ("export",)),
+            ("POST", "/api/v1/export/linkml", ("export",)),
+            ("POST", "/api/v1/export/avro/schema", ("export",)),
+            ("POST", "/api/v1/export/avro/protocol", ("export",)),
+            ("POST", "/api/v1/export/protobuf", ("export",)),
+            ("GET", "/api/v1/deps/config", ("deps",)),
+            ("POST", "/api/v1/deps/config", ("deps",)),
+            ("GET", "/api/v1/deps/status", ("deps",)),
+            ("GET", "/api/v1/deps/identities", ("deps",)),
+            ("POST", "/api/v1/deps/identities", ("deps",)),
+            ("DELETE", "/api/v1/deps/identities", ("deps",)),
+            ("POST", "/api/v1/deps/resolve", ("deps",)),
+            ("POST", "/api/v1/deps/build", ("deps",)),
+            ("POST", "/api/v1/insights/concepts", ("insights",)),
+            ("POST", "/api/v1/insights/relationships", ("insights",)),
+            ("POST", "/api/v1/insights/coverage", ("insights",)),
+            ("POST", "/api/v1/insights/quality", ("insights",)),
+            ("POST", "/api/v1/schema/filter", ("schema",)),
+            ("POST", "/api/v1/schema/validate", ("schema",)),
+            ("POST", "/api/v1/query/validate", ("query",)),
+        }
+
+    def test_including_a_router_twice_leaves_it_unchanged(self) -> None:
+        """Sub-routers can be included under several prefixes without being modified."""
+        paths = [route.path for route in shacl.router.routes]
+        flat_router = FlatAPIRouter(app)
+        flat_router.include_flat(shacl.router, prefix="/v1", tags=["v1"])
+        flat_router.include_flat(shacl.router, prefix="/v2", tags=["v2"])
+
+        assert [route.path for route in shacl.router.routes] == paths
+        assert [route.path for route in flat_router.routes] == [f"/v1{path}" for path in paths] + [
+            f"/v2{path}" for path in paths
+        ]
+
+
 class TestErrorHandling:
     """Test global error handling."""
 
@@ -83,6 +169,17 @@ class TestErrorHandling:
         data = response.json()
         assert data["error"] == "BadRequest"
 
+    def test_schema_input_is_validated_against_its_tagged_type(self, test_client: TestClient) -> None:
+        """A malformed schema input reports errors for the member named by its type only."""
+        response = test_client.post(
+            "/api/v1/export/vspec",
+            json={"schemas": [{"type": "content"}]},
+        )
+
+        assert response.status_code == 400
+        validation_errors = response.json()["details"]["validation_errors"]
+        assert [error["loc"] for error in validation_errors] == [["body", "schemas", 0, "content", "content"]]
+
     def test_cors_allows_localhost(self, test_client: TestClient) -> None:
         """CORS middleware allows localhost requests."""
         response = test_client.get(
@@ -94,6 +191,53 @@ class TestErrorHandling:
         assert "access-control-allow-origin" in response.headers
 
 
+class TestCorsMiddleware:
+    """Test the pure ASGI CORS middleware."""
+
+    def test_simple_request_mirrors_allowed_origin(self, test_client: TestClient) -> None:
+        """Allowed origins are mirrored back with credentials and a Vary header."""
+        response = test_client.get("/api/v1/health", headers={"Origin": "http://127.0.0.1:8000"})
+
+        assert response.headers["access-control-allow-origin"] == "http://127.0.0.1:8000"
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.headers["vary"] == "Origin"
+
+    def test_simple_request_ignores_disallowed_origin(self, test_client: TestClient) -> None:
+        """Disallowed origins do not receive CORS headers."""
+        response = test_client.get("/api/v1/health", headers={"Origin": "http://evil.example.com"})
+
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_preflight_request_is_answered_by_middleware(self, test_client: TestClient) -> None:
+        """Preflight requests return the allowed methods and mirror requested headers."""
+        response = test_client.options(
+            "/api/v1/export/shacl",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "content-type, x-custom",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.text == "OK"
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+        assert response.headers["access-control-allow-headers"] == "content-type, x-custom"
+        assert "POST" in response.headers["access-control-allow-methods"]
+
+    def test_preflight_request_rejects_disallowed_origin(self, test_client: TestClient) -> None:
+        """Preflight requests from disallowed origins fail with 400."""
+        response = test_client.options(
+            "/api/v1/export/shacl",
+            headers={"Origin": "http://evil.example.com", "Access-Control-Request-Method": "POST"},
+        )
+
+        assert response.status_code == 400
+        assert response.text == "Disallowed CORS origin"
+        assert "access-control-allow-origin" not in response.headers
+
+
 class TestResponseServiceErrorTranslation:
     """Test shared translation of domain/library errors."""
 
@@ -103,6 +247,15 @@ class TestResponseServiceErrorTranslation:
 
         assert message == "Schema validation failed:\n  - first\n  - second"
 
+    def test_execute_and_respond_returns_api_response_body(self) -> None:
+        """Responses are serialized directly in the ApiResponse shape."""
+        response = execute_and_respond(executor=lambda: ["type Query"], result_format="graphql")
+
+        body = ApiResponse.model_validate_json(bytes(response.body))
+        assert body.result == ["type Query"]
+        assert body.metadata is not None
+        assert body.metadata.result_format == "graphql"
+
     def test_execute_and_respond_translates_plugin_exception(self) -> None:
         """Exporter/library exceptions are normalized into ResponseError."""
 
@@ -116,6 +269,89 @@ class TestResponseServiceErrorTranslation:
             assert str(exc) == "unsupported format"
 
 
+class TestResultCache:
+    """Test caching of idempotent export results."""
+
+    @staticmethod
+    def _vspec_request(schema: dict[str, str]) -> dict[str, object]:
+        return {"schemas": [schema]}
+
+    def test_repeated_export_is_served_from_cache(self, test_client: TestClient) -> None:
+        """Identical export requests reuse the first result."""
+        request = self._vspec_request({"type": "content", "content": "type Query { ping: String }"})
+
+        first = test_client.post("/api/v1/export/vspec", json=request)
+        with patch("s2dm.exporters.vspec.translate_to_vspec", side_effect=AssertionError("not cached")):
+            second = test_client.post("/api/v1/export/vspec", json=request)
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert first.json()["metadata"]["cache"] == "miss"
+        assert second.json()["metadata"]["cache"] == "hit"
+        assert second.json()["result"] == first.json()["result"]
+
+    def test_cache_key_changes_when_path_input_changes(self, tmp_path: Path) -> None:
+        """Editing a referenced file invalidates the request fingerprint."""
+        schema_path = tmp_path / "schema.graphql"
+        schema_path.write_text("type Query { ping: String }", encoding="utf-8")
+        request = BaseExportRequest.model_validate(self._vspec_request({"type": "path", "path": str(schema_path)}))
+
+        first_key = request_cache_key("vspec", request)
+        schema_path.write_text("type Query { ping: String, pong: String }", encoding="utf-8")
+        second_key = request_cache_key("vspec", request)
+
+        assert first_key is not None
+        assert first_key != second_key
+
+    def test_url_inputs_are_not_cacheable(self) -> None:
+        """Requests referencing remote schemas are never cached."""
+        request = BaseExportRequest.model_validate(
+            self._vspec_request({"type": "url", "url": "https://example.com/schema.graphql"})
+        )
+
+        assert request_cache_key("vspec", request) is None
+
+
+class TestStreamedResponses:
+    """Test NDJSON streaming of export results."""
+
+    def test_export_streams_ndjson_when_requested(self, test_client: TestClient) -> None:
+        """Clients accepting NDJSON receive a metadata line followed by one line per result."""
+        response = test_client.post(
+            "/api/v1/export/vspec",
+            json={"schemas": [{"type": "content", "content": "type Query { ping: String }"}]},
+            headers={"Accept": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0]["metadata"]["result_format"] == "vspec"
+        assert len(lines) == 2
+        assert "result_chunk" in lines[1]
+
+
+class TestExportPool:
+    """Test offloading CPU-bound exports to worker processes."""
+
+    def test_exports_run_in_worker_processes_during_lifespan(self) -> None:
+        """Within the application lifespan, exports and their errors round-trip through the pool."""
+        with TestClient(app) as client:
+            exported = client.post(
+                "/api/v1/export/vspec",
+                json={"schemas": [{"type": "content", "content": "type Query { ping: String }"}]},
+            )
+            invalid = client.post(
+                "/api/v1/export/vspec",
+                json={"schemas": [{"type": "content", "content": "type Query {"}]},
+            )
+
+        assert exported.status_code == 200
+        assert exported.json()["metadata"]["result_format"] == "vspec"
+        assert invalid.status_code == 422
+        assert invalid.json()["error"] == "ValidationError"
+
+
 class TestExceptionHandlers:
     """Test specific exception handlers in API app."""
 
@@ -151,7 +387,7 @@ class TestExceptionHandlers:
         with (
             patch("s2dm.api.routes.avro.load_validated_schema", return_value=(annotated_schema, object())),
             patch("s2dm.api.services.schema_service.check_correct_schema", return_value=[]),
-            patch("s2dm.api.routes.avro.translate_to_avro_schema", side_effect=TypeError("bad type")),
+            patch("s2dm.exporters.avro.translate_to_avro_schema", side_effect=TypeError("bad type")),
         ):
             response = test_client.post("/api/v1/export/avro/schema", json=self._valid_avro_request())
 
@@ -183,10 +419,8 @@ class TestExceptionHandlers:
 
     def test_unhandled_exception_returns_500(self) -> None:
         """Unexpected exceptions are mapped to 500."""
-        with (
-            patch("s2dm.api.routes.avro.load_validated_schema", side_effect=Exception("unexpected")),
-            TestClient(app, raise_server_exceptions=False) as non_raising_client,
-        ):
+        non_raising_client = TestClient(app, raise_server_exceptions=False)
+        with patch("s2dm.api.routes.avro.load_validated_schema", side_effect=Exception("unexpected")):
             response = non_raising_client.post("/api/v1/export/avro/schema", json=self._valid_avro_request())
 
         assert response.status_code == 500
@@ -335,7 +335,7 @@ class TestExportersInternalFunctionsCalled:
                 "s2dm.api.routes.avro.load_validated_schema",
                 return_value=(SimpleNamespace(schema=object()), object()),
             ) as wrapper_mock,
-            patch("s2dm.api.routes.avro.translate_to_avro_schema", return_value='{"type":"record"}') as exporter_mock,
+            patch("s2dm.exporters.avro.translate_to_avro_schema", return_value='{"type":"record"}') as exporter_mock,
         ):
             response = test_client.post("/api/v1/export/avro/schema", json=payload)
 
@@ -358,7 +358,7 @@ class TestExportersInternalFunctionsCalled:
                 return_value=(SimpleNamespace(schema=object()), object()),
             ) as wrapper_mock,
             patch(
-                "s2dm.api.routes.avro.translate_to_avro_protocol",
+                "s2dm.exporters.avro.translate_to_avro_protocol",
                 return_value={"Selection": "protocol Selection {}"},
             ) as exporter_mock,
         ):
@@ -382,7 +382,7 @@ class TestExportersInternalFunctionsCalled:
                 return_value=(SimpleNamespace(schema=object()), object()),
             ) as wrapper_mock,
             patch(
-                "s2dm.api.routes.jsonschema.translate_to_jsonschema", return_value='{"type":"object"}'
+                "s2dm.exporters.jsonschema.translate_to_jsonschema", return_value='{"type":"object"}'
             ) as exporter_mock,
         ):
             response = test_client.post("/api/v1/export/jsonschema", json=payload)
@@ -404,7 +404,7 @@ class TestExportersInternalFunctionsCalled:
                 "s2dm.api.routes.protobuf.load_validated_schema",
                 return_value=(SimpleNamespace(schema=object()), object()),
             ) as wrapper_mock,
-            patch("s2dm.api.routes.protobuf.translate_to_protobuf", return_value='syntax = "proto3";') as exporter_mock,
+            patch("s2dm.exporters.protobuf.translate_to_protobuf", return_value='syntax = "proto3";') as exporter_mock,
         ):
             response = test_client.post("/api/v1/export/protobuf", json=payload)
 
@@ -427,7 +427,7 @@ class TestExportersInternalFunctionsCalled:
                 "s2dm.api.routes.shacl.load_validated_schema",
                 return_value=(SimpleNamespace(schema=object()), object()),
             ) as wrapper_mock,
-            patch("s2dm.api.routes.shacl.translate_to_shacl", return_value=graph_mock) as exporter_mock,
+            patch("s2dm.exporters.shacl.translate_to_shacl", return_value=graph_mock) as exporter_mock,
         ):
             response = test_client.post("/api/v1/export/shacl", json=payload)
 
@@ -447,7 +447,7 @@ class TestExportersInternalFunctionsCalled:
                 "s2dm.api.routes.vspec.load_validated_schema",
                 return_value=(SimpleNamespace(schema=object()), object()),
             ) as wrapper_mock,
-            patch("s2dm.api.routes.vspec.translate_to_vspec", return_value="Vehicle:\n  id: {}") as exporter_mock,
+            patch("s2dm.exporters.vspec.translate_to_vspec", return_value="Vehicle:\n  id: {}") as exporter_mock,
         ):
             response = test_client.post("/api/v1/export/vspec", json=payload)
 
@@ -471,7 +471,7 @@ class TestExportersInternalFunctionsCalled:
                 "s2dm.api.routes.linkml.load_validated_schema",
                 return_value=(SimpleNamespace(schema=object()), object()),
             ) as wrapper_mock,
-            patch("s2dm.api.routes.linkml.translate_to_linkml", return_value="name: test_schema") as exporter_mock,
+            patch("s2dm.exporters.linkml.translate_to_linkml", return_value="name: test_schema") as exporter_mock,
         ):
             response = test_client.post("/api/v1/export/linkml", json=payload)
 
@@ -485,7 +485,7 @@ class TestExportSchemaValidationGuards:
     """Test that exporters are skipped when schema validation fails."""
 
     @pytest.mark.parametrize(
-        ("route", "payload", "route_module", "exporter_function_name"),
+        ("route", "payload", "route_module", "exporter_target"),
         [
             (
                 "/api/v1/export/avro/schema",
@@ -497,7 +497,7 @@ class TestExportSchemaValidationGuards:
                     "namespace": "com.example.test",
                 },
                 "s2dm.api.routes.avro",
-                "translate_to_avro_schema",
+                "s2dm.exporters.avro.translate_to_avro_schema",
             ),
             (
                 "/api/v1/export/avro/protocol",
@@ -509,7 +509,7 @@ class TestExportSchemaValidationGuards:
                     "strict": True,
                 },
                 "s2dm.api.routes.avro",
-                "translate_to_avro_protocol",
+                "s2dm.exporters.avro.translate_to_avro_protocol",
             ),
             (
                 "/api/v1/export/jsonschema",
@@ -520,7 +520,7 @@ class TestExportSchemaValidationGuards:
                     "strict": False,
                 },
                 "s2dm.api.routes.jsonschema",
-                "translate_to_jsonschema",
+                "s2dm.exporters.jsonschema.translate_to_jsonschema",
             ),
             (
                 "/api/v1/export/protobuf",
@@ -531,7 +531,7 @@ class TestExportSchemaValidationGuards:
                     "selection_query": {"type": "content", "content": "query Selection { vehicle { id } }"},
                 },
                 "s2dm.api.routes.protobuf",
-                "translate_to_protobuf",
+                "s2dm.exporters.protobuf.translate_to_protobuf",
             ),
             (
                 "/api/v1/export/shacl",
@@ -542,7 +542,7 @@ class TestExportSchemaValidationGuards:
                     "serialization_format": "ttl",
                 },
                 "s2dm.api.routes.shacl",
-                "translate_to_shacl",
+                "s2dm.exporters.shacl.translate_to_shacl",
             ),
             (
                 "/api/v1/export/vspec",
@@ -552,7 +552,7 @@ class TestExportSchemaValidationGuards:
                     ],
                 },
                 "s2dm.api.routes.vspec",
-                "translate_to_vspec",
+                "s2dm.exporters.vspec.translate_to_vspec",
             ),
             (
                 "/api/v1/export/linkml",
@@ -566,7 +566,7 @@ class TestExportSchemaValidationGuards:
                     "default_prefix_url": LINKML_DEFAULT_PREFIX_URL,
                 },
                 "s2dm.api.routes.linkml",
-                "translate_to_linkml",
+                "s2dm.exporters.linkml.translate_to_linkml",
             ),
         ],
     )
@@ -576,7 +576,7 @@ class TestExportSchemaValidationGuards:
         route: str,
         payload: dict[str, object],
         route_module: str,
-        exporter_function_name: str,
+        exporter_target: str,
     ) -> None:
         """Schema check failures return 422 and short-circuit exporter execution."""
         with (
@@ -584,7 +584,7 @@ class TestExportSchemaValidationGuards:
                 f"{route_module}.load_validated_schema",
                 side_effect=ResponseError("invalid schema"),
             ),
-            patch(f"{route_module}.{exporter_function_name}") as exporter_mock,
+            patch(exporter_target) as exporter_mock,
         ):
             response = test_client.post(route, json=payload)
 
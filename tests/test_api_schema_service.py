@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import cast
 from unittest.mock import Mock, patch
 
+import pytest
 from pydantic import AnyHttpUrl
 
 from s2dm.api.models.base import ContentInput, FileContentInput, PathInput, UrlInput
@@ -162,7 +163,7 @@ class TestProcessSchemaInputDispatch:
         """Path inputs are delegated to path_for_content with schema parameters."""
         source_path = tmp_path / "schema.graphql"
         source_path.write_text("type Query { ping: String }", encoding="utf-8")
-        schema_input = PathInput(type="path", path=source_path)
+        schema_input = PathInput(type="path", path=str(source_path))
 
         with patch("s2dm.api.services.schema_service.path_for_content", return_value=source_path) as path_mock:
             result = schema_service.process_schema_input(schema_input)
@@ -185,8 +186,33 @@ class TestProcessSchemaInputDispatch:
         path_mock.assert_called_once_with(schema_input, "schema", ".graphql")
         assert result == expected_path
 
+    def test_mixed_inputs_with_urls_keep_input_order(self, tmp_path: Path) -> None:
+        """URL inputs are downloaded concurrently while paths stay in input order."""
+        source_path = tmp_path / "schema.graphql"
+        source_path.write_text("type Query { ping: String }", encoding="utf-8")
+        schema_inputs = [
+            UrlInput(type="url", url=cast(AnyHttpUrl, "https://example.com/first.graphql")),
+            PathInput(type="path", path=str(source_path)),
+            UrlInput(type="url", url=cast(AnyHttpUrl, "https://example.com/second.graphql")),
+        ]
+
+        def download(url: str) -> Path:
+            return tmp_path / Path(url).name
+
+        with patch("s2dm.api.services.schema_service.download_schema_to_temp", side_effect=download):
+            result = schema_service.process_schema_inputs(schema_inputs)
+
+        assert result == [tmp_path / "first.graphql", source_path, tmp_path / "second.graphql"]
+
 
 class TestPathForContent:
+    def test_missing_path_raises_file_not_found(self, tmp_path: Path) -> None:
+        """Path inputs are checked for existence lazily, when the path is resolved."""
+        schema_input = PathInput(type="path", path=str(tmp_path / "missing.graphql"))
+
+        with pytest.raises(FileNotFoundError):
+            schema_service.path_for_content(schema_input, "schema", ".graphql")
+
     def test_file_content_preserves_filename(self) -> None:
         """File content inputs preserve the provided filename in temp storage."""
         schema_input = FileContentInput(
@@ -1,4 +1,5 @@
 import json
+import logging
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any, cast
@@ -10,10 +11,15 @@ from click.exceptions import MissingParameter
 from click.testing import CliRunner
 from graphql import GraphQLObjectType, build_schema, parse
 from linkml_runtime.loaders import yaml_loader
+from rdflib import Graph
+from rdflib.compare import isomorphic
 
+from s2dm import log
 from s2dm.cli import cli
 from s2dm.deps import DEPENDENCY_LOCK_FILENAME
 from s2dm.deps.resolve.common import METADATA_FILENAME, SCHEMA_FILENAME, VENDOR_DIRECTORY
+from s2dm.exporters.utils.schema_loader import load_and_process_schema
+from s2dm.exporters.vspec import translate_to_vspec
 from s2dm.tools.string import normalize_whitespace
 from tests.conftest import TestSchemaData as TSD
 from tests.deps.helpers import file_sha256, write_dependency_lock, write_metadata_file
@@ -108,6 +114,28 @@ def test_export_shacl(runner: CliRunner, tmp_outputs: Path, spec_directory: Path
     assert "shapes:Vehicle_ADAS_ObstacleDetection" in content
 
 
+def test_export_shacl_batch(runner: CliRunner, tmp_path: Path, spec_directory: Path, units_directory: Path) -> None:
+    batch_schemas = [TSD.TESTS_DATA_DIR / "schema1.graphql", TSD.TESTS_DATA_DIR / "schema2.graphql"]
+    output_dir = tmp_path / "shacl"
+    shared_args = ["-s", str(spec_directory), "-s", str(units_directory)]
+
+    result = runner.invoke(
+        cli,
+        ["export", "shacl-batch", *shared_args, "-b", str(batch_schemas[0]), "-b", str(batch_schemas[1])]
+        + ["-o", str(output_dir), "-j", "2"],
+    )
+    assert result.exit_code == 0, result.output
+
+    for batch_schema in batch_schemas:
+        single_output = tmp_path / f"single_{batch_schema.stem}.ttl"
+        single_result = runner.invoke(
+            cli, ["export", "shacl", *shared_args, "-s", str(batch_schema), "-o", str(single_output)]
+        )
+        assert single_result.exit_code == 0, single_result.output
+        batch_graph = Graph().parse(output_dir / f"{batch_schema.stem}.ttl")
+        assert isomorphic(batch_graph, Graph().parse(single_output))
+
+
 # ToDo(DA): please update this test to do proper asserts for the vspec exporter
 def test_export_vspec(runner: CliRunner, tmp_outputs: Path, spec_directory: Path, units_directory: Path) -> None:
     out = tmp_outputs / "vspec.yaml"
@@ -136,6 +164,15 @@ def test_export_vspec(runner: CliRunner, tmp_outputs: Path, spec_directory: Path
     assert "Vehicle:" in content
     assert "Vehicle_ADAS_ObstacleDetection:" in content
 
+    annotated_schema, _, _ = load_and_process_schema(
+        schema_paths=[spec_directory, TSD.SAMPLE1_1, TSD.SAMPLE1_2, units_directory],
+        naming_config_path=None,
+        selection_query_path=None,
+        root_type=None,
+        expanded_instances=False,
+    )
+    assert content == translate_to_vspec(annotated_schema)
+
 
 def test_export_jsonschema(runner: CliRunner, tmp_outputs: Path, spec_directory: Path, units_directory: Path) -> None:
     out = tmp_outputs / "jsonschema.yaml"
@@ -1242,6 +1279,41 @@ def test_diff_graphql(
         assert len(diff_output) > 0
 
 
+def test_diff_graphql_skips_inspector_for_identical_copies(runner: CliRunner, tmp_path: Path) -> None:
+    schema = tmp_path / "release" / "schema.graphql"
+    copied_schema = tmp_path / "copy" / "schema.graphql"
+    for path in (schema, copied_schema):
+        path.parent.mkdir()
+        path.write_text("type Query { vehicle: Vehicle }\ntype Vehicle { speed: Float }\n", encoding="utf-8")
+    out = tmp_path / "diff.json"
+
+    with patch("s2dm.cli.GraphQLInspector") as inspector_class:
+        result = runner.invoke(
+            cli, ["diff", "graphql", "-s", str(schema), "--val-schema", str(copied_schema), "-o", str(out)]
+        )
+
+    assert result.exit_code == 0, result.output
+    inspector_class.assert_not_called()
+    assert json.loads(out.read_text()) == []
+
+
+@pytest.mark.parametrize(
+    "command,other_schema_option",
+    [(["diff", "graphql"], "--val-schema"), (["check", "version-bump"], "--previous")],
+)
+def test_diff_of_identical_invalid_schemas_fails(
+    runner: CliRunner, tmp_path: Path, command: list[str], other_schema_option: str
+) -> None:
+    schema = tmp_path / "schema.graphql"
+    schema.write_text("type Query { vehicle: Missing }\n", encoding="utf-8")
+
+    with patch("s2dm.cli.GraphQLInspector") as inspector_class:
+        result = runner.invoke(cli, [*command, "-s", str(schema), other_schema_option, str(schema)])
+
+    assert result.exit_code != 0, result.output
+    inspector_class.assert_not_called()
+
+
 def test_registry_export_concept_uri(
     runner: CliRunner, tmp_outputs: Path, spec_directory: Path, units_directory: Path
 ) -> None:
@@ -2169,6 +2241,34 @@ def test_stats_graphql(runner: CliRunner, spec_directory: Path, units_directory:
     assert '"UInt32": 1' in normalize_whitespace(result.output)
 
 
+def test_debug_log_level_skips_traceback_hook_without_tty(runner: CliRunner) -> None:
+    log_level = log.level
+    try:
+        with patch("s2dm.cli.install") as install_mock:
+            result = runner.invoke(cli, ["--log-level", "DEBUG", "stats", "--help"])
+    finally:
+        log.setLevel(log_level)
+
+    assert result.exit_code == 0, result.output
+    install_mock.assert_not_called()
+
+
+def test_log_file_handler_is_replaced_on_repeated_invocations(runner: CliRunner, tmp_outputs: Path) -> None:
+    try:
+        for log_file in (tmp_outputs / "first.log", tmp_outputs / "second.log"):
+            result = runner.invoke(cli, ["--log-file", str(log_file), "stats", "--help"])
+            assert result.exit_code == 0, result.output
+        log_files = [
+            handler.baseFilename
+            for handler in log.handlers
+            if isinstance(handler, logging.FileHandler) and Path(handler.baseFilename).parent == tmp_outputs.resolve()
+        ]
+    finally:
+        runner.invoke(cli, ["stats", "--help"])
+
+    assert log_files == [str((tmp_outputs / "second.log").resolve())]
+
+
 def test_units_sync_cli(
     runner: CliRunner,
     units_sync_mocks: tuple[Callable[..., list[Path]], Callable[[], str]],
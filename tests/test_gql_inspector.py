@@ -1,15 +1,41 @@
+import shutil
+import subprocess
 import tempfile
 from collections.abc import Generator
 from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from s2dm.exporters.utils.schema_loader import create_tempfile_to_composed_schema
-from s2dm.tools.graphql_inspector import GraphQLInspector
+from s2dm.tools.graphql_inspector import (
+    GraphQLInspector,
+    InspectorWorker,
+    MemoryInspectorCache,
+    _close_inspector_workers,
+    _get_inspector_worker,
+)
 from s2dm.tools.string import normalize_whitespace
 from tests.conftest import TestSchemaData as TSD
 
 
+@pytest.fixture(autouse=True)
+def close_inspector_workers() -> Generator[None, None, None]:
+    """Stop the Node.js workers a test started, so none outlives it."""
+    yield
+    _close_inspector_workers()
+
+
+@pytest.fixture
+def fake_inspector_cli(tmp_path: Path) -> Path:
+    """Create an empty graphql-inspector CLI for tests that mock its runs, and return its node_modules."""
+    cli_path = tmp_path / "node_modules" / ".bin" / "graphql-inspector"
+    cli_path.parent.mkdir(parents=True)
+    cli_path.touch()
+    return cli_path.parent.parent
+
+
 @pytest.fixture(scope="module")
 def schema1_tmp(spec_directory: Path) -> Generator[Path, None, None]:
     assert TSD.SCHEMA1.exists(), f"Missing test file: {TSD.SCHEMA1}"
@@ -125,3 +151,221 @@ def test_similar_keyword_output(schema1_tmp: Path, output_to_file: bool, inspect
         assert keyword in normalize_whitespace(result.output) or (
             output_to_file and file_content and keyword in file_content
         )
+
+
+def test_diff_result_is_cached_by_schema_content(tmp_path: Path, fake_inspector_cli: Path) -> None:
+    old_schema = tmp_path / "old.graphql"
+    old_schema.write_text("type Query { ping: String }", encoding="utf-8")
+    new_schema = tmp_path / "new.graphql"
+    new_schema.write_text("type Query { pong: String }", encoding="utf-8")
+    inspector = GraphQLInspector(old_schema, node_modules_path=fake_inspector_cli)
+    completed = subprocess.CompletedProcess(args=[], returncode=1, stdout="Detected 2 changes", stderr="")
+
+    with patch("s2dm.tools.graphql_inspector.subprocess.run", return_value=completed) as run_mock:
+        first = inspector.diff(new_schema)
+        second = inspector.diff(new_schema)
+        new_schema.write_text("type Query { pong: Int }", encoding="utf-8")
+        inspector.diff(new_schema)
+
+    assert run_mock.call_count == 2
+    assert second.as_dict() == first.as_dict()
+
+
+def test_validate_result_is_cached_by_schema_and_document_content(tmp_path: Path, fake_inspector_cli: Path) -> None:
+    schema = tmp_path / "schema.graphql"
+    schema.write_text("type Query { ping: String }", encoding="utf-8")
+    document = tmp_path / "query.graphql"
+    document.write_text("{ ping }", encoding="utf-8")
+    inspector = GraphQLInspector(schema, node_modules_path=fake_inspector_cli)
+    completed = subprocess.CompletedProcess(args=[], returncode=0, stdout="All documents are valid", stderr="")
+
+    with patch("s2dm.tools.graphql_inspector.subprocess.run", return_value=completed) as run_mock:
+        first = inspector.validate(str(document))
+        second = inspector.validate(str(document))
+        document.write_text("{ pong }", encoding="utf-8")
+        inspector.validate(str(document))
+        inspector.validate(str(tmp_path / "*.graphql"))
+        inspector.validate(str(tmp_path / "*.graphql"))
+
+    assert run_mock.call_count == 4
+    assert second.as_dict() == first.as_dict()
+
+
+def test_diff_result_is_not_reused_after_inspector_upgrade(tmp_path: Path) -> None:
+    package = tmp_path / "node_modules" / "@graphql-inspector" / "cli"
+    package.mkdir(parents=True)
+    (package / "package.json").write_text('{"name": "@graphql-inspector/cli", "version": "5.0.0"}', encoding="utf-8")
+    (package / "index.js").touch(mode=0o755)
+    cli_path = tmp_path / "node_modules" / ".bin" / "graphql-inspector"
+    cli_path.parent.mkdir()
+    cli_path.symlink_to(package / "index.js")
+    old_schema = tmp_path / "old.graphql"
+    old_schema.write_text("type Query { ping: String }", encoding="utf-8")
+    new_schema = tmp_path / "new.graphql"
+    new_schema.write_text("type Query { pong: String }", encoding="utf-8")
+    inspector = GraphQLInspector(old_schema, node_modules_path=cli_path.parent.parent)
+    completed = subprocess.CompletedProcess(args=[], returncode=1, stdout="Detected 2 changes", stderr="")
+
+    with patch("s2dm.tools.graphql_inspector.subprocess.run", return_value=completed) as run_mock:
+        inspector.diff(new_schema)
+        (package / "package.json").write_text(
+            '{"name": "@graphql-inspector/cli", "version": "5.1.0"}', encoding="utf-8"
+        )
+        inspector.diff(new_schema)
+
+    assert run_mock.call_count == 2
+
+
+def test_disk_cache_keeps_most_recent_results(
+    tmp_path: Path, fake_inspector_cli: Path, isolated_inspector_cache: Path
+) -> None:
+    schema = tmp_path / "schema.graphql"
+    schema.write_text("type Query { ping: String }", encoding="utf-8")
+    inspector = GraphQLInspector(schema, node_modules_path=fake_inspector_cli)
+    completed = subprocess.CompletedProcess(args=[], returncode=0, stdout="No changes detected", stderr="")
+
+    with (
+        patch("s2dm.tools.graphql_inspector.INSPECTOR_CACHE_MAX_ENTRIES", 2),
+        patch("s2dm.tools.graphql_inspector.subprocess.run", return_value=completed),
+    ):
+        for index in range(4):
+            other_schema = tmp_path / f"other{index}.graphql"
+            other_schema.write_text(f"type Query {{ field{index}: String }}", encoding="utf-8")
+            inspector.diff(other_schema)
+
+    assert len(list(isolated_inspector_cache.glob("*.json"))) == 2
+
+
+def test_disk_cache_can_be_disabled_by_environment(
+    tmp_path: Path, fake_inspector_cli: Path, isolated_inspector_cache: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("S2DM_NO_INSPECTOR_DISK_CACHE", "1")
+    schema = tmp_path / "schema.graphql"
+    schema.write_text("type Query { ping: String }", encoding="utf-8")
+    other_schema = tmp_path / "other.graphql"
+    other_schema.write_text("type Query { pong: String }", encoding="utf-8")
+    completed = subprocess.CompletedProcess(args=[], returncode=1, stdout="Detected 2 changes", stderr="")
+
+    with patch("s2dm.tools.graphql_inspector.subprocess.run", return_value=completed):
+        GraphQLInspector(schema, node_modules_path=fake_inspector_cli).diff(other_schema)
+
+    assert list(isolated_inspector_cache.iterdir()) == []
+
+
+def test_structured_diff_cache_is_keyed_by_core_version(tmp_path: Path) -> None:
+    node_modules = tmp_path / "node_modules"
+    core_manifest = node_modules / "@graphql-inspector" / "core" / "package.json"
+    core_manifest.parent.mkdir(parents=True)
+    core_manifest.write_text('{"name": "@graphql-inspector/core", "version": "6.0.0"}', encoding="utf-8")
+    schema = tmp_path / "schema.graphql"
+    schema.write_text("type Query { ping: String }", encoding="utf-8")
+    other_schema = tmp_path / "other.graphql"
+    other_schema.write_text("type Query { pong: String }", encoding="utf-8")
+    with patch.object(GraphQLInspector, "_resolve_cli_path", return_value="graphql-inspector"):
+        inspector = GraphQLInspector(schema, node_modules_path=node_modules)
+    worker = MagicMock()
+    worker.request.return_value = {"exit_code": 0, "output": "[]"}
+
+    with patch("s2dm.tools.graphql_inspector._get_inspector_worker", return_value=worker):
+        inspector.diff_structured(other_schema)
+        inspector.diff_structured(other_schema)
+        assert worker.request.call_count == 1
+        core_manifest.write_text('{"name": "@graphql-inspector/core", "version": "6.1.0"}', encoding="utf-8")
+        inspector.diff_structured(other_schema)
+
+    assert worker.request.call_count == 2
+
+
+def test_memory_cache_is_shared_between_inspectors(
+    tmp_path: Path, fake_inspector_cli: Path, isolated_inspector_cache: Path
+) -> None:
+    old_schema = tmp_path / "old.graphql"
+    old_schema.write_text("type Query { ping: String }", encoding="utf-8")
+    new_schema = tmp_path / "new.graphql"
+    new_schema.write_text("type Query { pong: String }", encoding="utf-8")
+    cache = MemoryInspectorCache(max_size=1)
+    completed = subprocess.CompletedProcess(args=[], returncode=1, stdout="Detected 2 changes", stderr="")
+
+    with patch("s2dm.tools.graphql_inspector.subprocess.run", return_value=completed) as run_mock:
+        GraphQLInspector(old_schema, node_modules_path=fake_inspector_cli, cache=cache).diff(new_schema)
+        GraphQLInspector(old_schema, node_modules_path=fake_inspector_cli, cache=cache).diff(new_schema)
+        assert run_mock.call_count == 1
+        # A second result evicts the first one from the single-entry cache
+        GraphQLInspector(new_schema, node_modules_path=fake_inspector_cli, cache=cache).diff(old_schema)
+        GraphQLInspector(old_schema, node_modules_path=fake_inspector_cli, cache=cache).diff(new_schema)
+        assert run_mock.call_count == 3
+
+    assert list(isolated_inspector_cache.iterdir()) == []
+
+
+def test_similar_written_output_is_restored_from_cache(tmp_path: Path, fake_inspector_cli: Path) -> None:
+    schema = tmp_path / "schema.graphql"
+    schema.write_text("type Query { ping: String }", encoding="utf-8")
+    output = tmp_path / "similar.json"
+    inspector = GraphQLInspector(schema, node_modules_path=fake_inspector_cli)
+
+    def run_similar(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        Path(cmd[cmd.index("--write") + 1]).write_text('{"Query": []}', encoding="utf-8")
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="", stderr="")
+
+    with patch("s2dm.tools.graphql_inspector.subprocess.run", side_effect=run_similar) as run_mock:
+        first = inspector.similar(output)
+        output.unlink()
+        second = inspector.similar(output)
+
+    assert run_mock.call_count == 1
+    assert second.as_dict() == first.as_dict()
+    assert output.read_text(encoding="utf-8") == '{"Query": []}'
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="requires Node.js")
+def test_structured_diff_worker_serves_repeated_diffs(tmp_path: Path) -> None:
+    node_modules = tmp_path / "node_modules"
+    core_package = node_modules / "@graphql-inspector" / "core"
+    core_package.mkdir(parents=True)
+    (core_package / "index.js").write_text(
+        "exports.diff = async (oldSchema, newSchema) => oldSchema === newSchema ? [] : "
+        "[{type: 'FIELD_REMOVED', criticality: {level: 'BREAKING'}, path: 'Query.ping', message: 'removed'}];\n",
+        encoding="utf-8",
+    )
+    graphql_package = node_modules / "graphql"
+    graphql_package.mkdir()
+    (graphql_package / "index.js").write_text(
+        "exports.buildSchema = (sdl) => sdl;\nexports.printSchema = (schema) => schema;\n", encoding="utf-8"
+    )
+    old_schema = tmp_path / "old.graphql"
+    old_schema.write_text("type Query { ping: String }", encoding="utf-8")
+    new_schema = tmp_path / "new.graphql"
+    new_schema.write_text("type Query { pong: String }", encoding="utf-8")
+
+    with patch.object(GraphQLInspector, "_resolve_cli_path", return_value="graphql-inspector"):
+        inspector = GraphQLInspector(old_schema, node_modules_path=node_modules)
+    with patch("s2dm.tools.graphql_inspector.InspectorWorker", wraps=InspectorWorker) as worker_class:
+        changes = inspector.diff_structured(new_schema)
+        unchanged = inspector.diff_structured(old_schema)
+
+    assert worker_class.call_count == 1
+    assert [(change.path, change.criticality) for change in changes] == [("Query.ping", "BREAKING")]
+    assert unchanged == []
+    assert _get_inspector_worker(node_modules).request("bogus")["exit_code"] == 2
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="requires Node.js")
+def test_worker_reports_invalid_answer_with_stderr(tmp_path: Path) -> None:
+    node_modules = tmp_path / "node_modules"
+    node_modules.mkdir()
+    script = tmp_path / "worker.js"
+    script.write_text(
+        "process.stdin.once('data', () => { console.error('worker is broken'); console.log('not json'); });\n",
+        encoding="utf-8",
+    )
+
+    with patch("s2dm.tools.graphql_inspector.WORKER_SCRIPT_PATH", script):
+        worker = InspectorWorker(node_modules)
+    try:
+        with pytest.raises(RuntimeError, match="invalid JSON"):
+            worker.request("diff")
+    finally:
+        worker.close()
+
+    assert worker.stderr_tail() == "worker is broken"
@@ -274,6 +274,22 @@ def test_id_exporter_uses_previous_ids(temp_output_paths: dict[str, Path], schem
     assert result.concepts["Window.position"].variant == (1, 0)
 
 
+def test_id_exporter_rejects_malformed_previous_ids(
+    temp_output_paths: dict[str, Path], schema_builder: SchemaBuilder
+) -> None:
+    """Test that IDExporter reports an unparsable previous IDs file as a RuntimeError."""
+    schema = schema_builder(SIMPLE_WINDOW_SCHEMA)
+    temp_output_paths["previous_ids"].write_text('{"version_tag": "v1.0.0", "concepts": {', encoding="utf-8")
+
+    with pytest.raises(RuntimeError, match="Failed to load previous IDs"):
+        run_exporter(
+            schema=schema,
+            version_tag="v2.0.0",
+            output_path=temp_output_paths["ids"],
+            previous_ids_path=temp_output_paths["previous_ids"],
+        )
+
+
 def test_id_exporter_increments_variant_on_change(
     temp_output_paths: dict[str, Path], schema_builder: SchemaBuilder
 ) -> None:
@@ -578,6 +594,24 @@ def test_enum_change_propagates_across_types(temp_output_paths: dict[str, Path],
     assert result.concepts["Door"].id == "Door/v1.0"
 
 
+def test_get_fields_using_enum_includes_fields_with_enum_arguments(schema_builder: SchemaBuilder) -> None:
+    schema = schema_builder(
+        """
+        type Query { window: Window }
+        enum WindowState { OPEN CLOSED }
+        type Window {
+            state: WindowState
+            position(when: WindowState): Float
+            label: String
+        }
+        """
+    )
+    exporter = IDExporter(schema=schema, version_tag="v1.0.0")
+
+    assert exporter.get_fields_using_enum("WindowState") == {"Window.state", "Window.position"}
+    assert exporter.get_fields_using_enum("Window") == set()
+
+
 def test_multiple_changes_to_same_concept_increment_once(
     temp_output_paths: dict[str, Path], schema_builder: SchemaBuilder
 ) -> None:
@@ -703,6 +737,51 @@ def test_no_changes_with_empty_diff(temp_output_paths: dict[str, Path], schema_b
     assert result.concepts["Window.position"].variant_counter == 1
 
 
+@pytest.mark.parametrize(
+    "previous_entry,namespace_prefix,expected_id",
+    [
+        ({"id": "Window/v2.1", "variant_counter": 3}, None, "Window/v2.1"),
+        ({"id": "ns:Window/v2.1", "variant_counter": 3}, "ns", "ns:Window/v2.1"),
+        ({"id": "Window/v2.1", "variant_counter": 3}, "ns", "ns:Window/v2.1"),
+        ({"id": "Window/v2.1", "variant_counter": 3, "removed_in_version": "v1.0.0"}, None, "Window/v2.1"),
+    ],
+)
+def test_unchanged_schema_keeps_previous_ids(
+    temp_output_paths: dict[str, Path],
+    schema_builder: SchemaBuilder,
+    previous_entry: dict[str, Any],
+    namespace_prefix: str | None,
+    expected_id: str,
+) -> None:
+    """Test that a schema without changes keeps previous IDs, re-prefixed and no longer removed."""
+    schema = schema_builder(SIMPLE_WINDOW_SCHEMA)
+
+    save_previous_ids(
+        temp_output_paths["previous_ids"],
+        {
+            "Window": previous_entry,
+            "Window.position": {"id": f"{namespace_prefix or 'ns'}:Window.position/v1.0", "variant_counter": 1},
+        },
+    )
+
+    result = run_exporter(
+        schema=schema,
+        version_tag="v1.1.0",
+        output_path=temp_output_paths["ids"],
+        previous_ids_path=temp_output_paths["previous_ids"],
+        namespace_prefix=namespace_prefix,
+    )
+
+    assert result.version_tag == "v1.1.0"
+    assert list(result.concepts) == ["Window", "Window.position"]
+    assert result.concepts["Window"].id == expected_id
+    assert result.concepts["Window"].variant_counter == 3
+    assert result.concepts["Window"].removed_in_version is None
+    expected_position_id = f"{namespace_prefix}:Window.position/v1.0" if namespace_prefix else "Window.position/v1.0"
+    assert result.concepts["Window.position"].id == expected_position_id
+    assert VariantIDFile.load(temp_output_paths["ids"]) == result
+
+
 def test_variant_counter_continues_across_updates(
     temp_output_paths: dict[str, Path], schema_builder: SchemaBuilder
 ) -> None:
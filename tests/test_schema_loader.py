@@ -1,12 +1,16 @@
 from pathlib import Path
 from typing import cast
+from unittest.mock import patch
 
 import pytest
-from graphql import DocumentNode, GraphQLField, GraphQLObjectType, build_schema, parse
+from graphql import DocumentNode, GraphQLField, GraphQLObjectType, build_schema, parse, print_schema
 
+from s2dm.exporters.utils import schema_cache
 from s2dm.exporters.utils.schema_loader import (
+    build_schema_str,
     check_correct_schema,
     compose_schemas_to_string,
+    create_tempfile_to_composed_schema,
     load_schema_with_source_map,
     print_schema_with_directives_preserved,
 )
@@ -848,3 +852,76 @@ def test_check_correct_schema_excludes_warning_severity_violations() -> None:
     schema = build_schema(schema_str)
     violations = check_correct_schema(schema)
     assert all(violation.severity == Severity.ERROR for violation in violations)
+
+
+def test_build_schema_cached_reuses_parsed_document(
+    monkeypatch: pytest.MonkeyPatch, isolated_schema_cache: Path
+) -> None:
+    monkeypatch.setattr(schema_cache, "SCHEMA_CACHE_MIN_SIZE", 0)
+    schema_str = "type Query { vehicle: Vehicle }\ntype Vehicle { speed: Float @deprecated }\n"
+
+    first = schema_cache.build_schema_cached(schema_str)
+    assert len(list(isolated_schema_cache.glob("*.pickle"))) == 1
+
+    with patch("s2dm.exporters.utils.schema_cache.build_schema", side_effect=AssertionError("not cached")):
+        second = schema_cache.build_schema_cached(schema_str)
+
+    assert print_schema(second) == print_schema(first)
+
+
+def test_build_schema_cached_tolerates_entry_pruned_after_read(
+    monkeypatch: pytest.MonkeyPatch, isolated_schema_cache: Path
+) -> None:
+    monkeypatch.setattr(schema_cache, "SCHEMA_CACHE_MIN_SIZE", 0)
+    schema_str = "type Query { vehicle: Vehicle }\ntype Vehicle { speed: Float }\n"
+    schema_cache.build_schema_cached(schema_str)
+
+    with patch("s2dm.exporters.utils.schema_cache.os.utime", side_effect=FileNotFoundError):
+        schema = schema_cache.build_schema_cached(schema_str)
+
+    assert "speed" in print_schema(schema)
+
+
+def test_build_schema_cached_does_not_cache_invalid_schema(
+    monkeypatch: pytest.MonkeyPatch, isolated_schema_cache: Path
+) -> None:
+    monkeypatch.setattr(schema_cache, "SCHEMA_CACHE_MIN_SIZE", 0)
+
+    with pytest.raises(TypeError):
+        schema_cache.build_schema_cached("type Query { vehicle: Missing }")
+
+    assert not list(isolated_schema_cache.glob("*.pickle"))
+
+
+def test_build_schema_str_recomposes_only_when_sources_change(tmp_path: Path) -> None:
+    schema_dir = tmp_path / "schema"
+    schema_dir.mkdir()
+    (schema_dir / "vehicle.graphql").write_text("type Vehicle { speed: Float }\n", encoding="utf-8")
+    query_file = tmp_path / "query.graphql"
+    query_file.write_text("type Query { vehicle: Vehicle }\n", encoding="utf-8")
+    schema_paths = [schema_dir, query_file]
+
+    first = build_schema_str(schema_paths)
+    with patch(
+        "s2dm.exporters.utils.schema_loader.build_schema_str_with_optional_source_map",
+        side_effect=AssertionError("not memoized"),
+    ):
+        assert build_schema_str(schema_paths) == first
+
+    (schema_dir / "cabin.graphql").write_text("type Cabin { doors: Int }\n", encoding="utf-8")
+    assert "type Cabin" in build_schema_str(schema_paths)
+
+
+def test_composed_schema_tempfile_reuses_composed_schema_str(tmp_path: Path) -> None:
+    schema_file = tmp_path / "schema.graphql"
+    schema_file.write_text("type Query { vehicle: Vehicle }\ntype Vehicle { speed: Float }\n", encoding="utf-8")
+    schema_paths = [schema_file.resolve()]
+
+    build_schema_str(schema_paths)
+    with patch(
+        "s2dm.exporters.utils.schema_loader.build_schema_str_with_optional_source_map",
+        side_effect=AssertionError("composed twice"),
+    ):
+        temp_path = create_tempfile_to_composed_schema(schema_paths)
+
+    assert "type Vehicle" in temp_path.read_text(encoding="utf-8")
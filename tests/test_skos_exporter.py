@@ -206,9 +206,9 @@ class TestSKOSGeneration:
         assert "Vehicle.name" in concepts.field_metadata
 
         metadata = concepts.field_metadata["Vehicle.name"]
-        assert metadata["object_name"] == "Vehicle"
-        assert metadata["field_name"] == "name"
-        assert hasattr(metadata["field_definition"], "description")
+        assert metadata.object_name == "Vehicle"
+        assert metadata.field_name == "name"
+        assert hasattr(metadata.field_definition, "description")
 
 
 class TestSKOSValidation:
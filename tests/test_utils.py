@@ -21,6 +21,8 @@ from s2dm.exporters.utils import instance_tag as instance_tag_utils
 from s2dm.exporters.utils import schema as schema_utils
 from s2dm.exporters.utils import schema_loader as schema_loader_utils
 from s2dm.exporters.utils.graphql_type import is_introspection_type
+from s2dm.utils import file as file_utils
+from s2dm.utils import json_output as json_output_utils
 from s2dm.utils import url as url_utils
 from tests.conftest import TestSchemaData as TSD
 
@@ -73,6 +75,20 @@ def test_create_tempfile_to_composed_schema(schema_path: list[Path]) -> None:
     temp_path.unlink()
 
 
+def test_create_tempfile_to_composed_schema_is_reused_until_schema_changes(tmp_path: Path) -> None:
+    schema_file = tmp_path / "schema.graphql"
+    schema_file.write_text("type Query { ping: String }", encoding="utf-8")
+
+    first = schema_loader_utils.create_tempfile_to_composed_schema([schema_file])
+    second = schema_loader_utils.create_tempfile_to_composed_schema([schema_file])
+    schema_file.write_text("type Query { ping: String, pong: String }", encoding="utf-8")
+    third = schema_loader_utils.create_tempfile_to_composed_schema([schema_file])
+
+    assert second == first
+    assert third != first
+    assert "pong" in third.read_text(encoding="utf-8")
+
+
 def test_ensure_query(schema_path: list[Path]) -> None:
     schema = schema_loader_utils.load_schema(schema_path)
     ensured = schema_loader_utils.ensure_query(schema)
@@ -238,6 +254,40 @@ def test_select_schema_content_keeps_direct_enum_directive_argument_type() -> No
     assert "INACTIVE" in selected_schema_str
 
 
+# #########################################################
+# File utils
+# #########################################################
+
+
+def test_read_text_mapped_matches_read_text(tmp_path: Path) -> None:
+    """Small files are read normally and large files are decoded from a memory map."""
+    content = "type Query { vehicle: Vehicle } # \u00e9\n" * 10
+    query_path = tmp_path / "query.graphql"
+    query_path.write_text(content, encoding="utf-8")
+
+    assert file_utils.read_text_mapped(query_path) == content
+    assert file_utils.read_text_mapped(query_path, mmap_threshold=1) == content
+
+
+def test_write_bytes_atomic_replaces_file_and_creates_parents(tmp_path: Path) -> None:
+    output_path = tmp_path / "nested" / "out" / "schema.ttl"
+
+    file_utils.write_bytes_atomic(output_path, b"first")
+    file_utils.write_bytes_atomic(output_path, b"second")
+
+    assert output_path.read_bytes() == b"second"
+    assert [entry.name for entry in output_path.parent.iterdir()] == ["schema.ttl"]
+
+
+def test_write_json_output_matches_format_json_output(tmp_path: Path) -> None:
+    data = [{"path": "Vehicle.speed", "message": "Field 'speed' was removed \u2013 breaking"}]
+    output_path = tmp_path / "diff.json"
+
+    json_output_utils.write_json_output(data, output_path)
+
+    assert output_path.read_text(encoding="utf-8") == json_output_utils.format_json_output(data)
+
+
 # #########################################################
 # Extraction utils
 # #########################################################